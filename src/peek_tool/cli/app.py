@@ -8,7 +8,12 @@ from typing import Optional
 
 # Import command groups and commands
 from peek_tool.cli.commands.mcp import app as mcp_app
+from peek_tool.cli.commands.bench import app as bench_app
+from peek_tool.cli.commands.index import app as index_app
 from peek_tool.cli.commands.inspect.command import inspect_command
+from peek_tool.cli.commands.refs.command import refs_command
+from peek_tool.cli.commands.search.command import search_command
+from peek_tool.cli.commands.source.command import source_command
 
 app = typer.Typer(
     help="Peek: Inspect Python modules, APIs, and data files",
@@ -17,9 +22,14 @@ app = typer.Typer(
 
 # Register command groups
 app.add_typer(mcp_app, name="mcp")
+app.add_typer(bench_app, name="bench")
+app.add_typer(index_app, name="index")
 
 # Register direct commands
 app.command("inspect")(inspect_command)
+app.command("search")(search_command)
+app.command("source")(source_command)
+app.command("refs")(refs_command)
 
 
 # Default callback to show help when no command is provided
@@ -41,8 +51,27 @@ def default_command(
     format: Optional[str] = typer.Option(None, "--format", "-f", help="Output format"),
 ):
     """Default command that acts as an alias for the inspect command."""
-    # Execute the inspect command directly
-    inspect_command(target=target, type=type, format=format)
+    # Execute the inspect command directly (options not exposed here keep
+    # their defaults; typer only resolves them when invoked from the CLI)
+    inspect_command(
+        target=target,
+        type=type,
+        format=format,
+        recursive=False,
+        depth=None,
+        include=None,
+        exclude=None,
+        jobs=None,
+        profile_import=False,
+        timings=False,
+        memprofile=False,
+        public_only=False,
+        no_imported=False,
+        respect_all=False,
+        kind=None,
+        max_tokens=None,
+        python=None,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"""Benchmark command group for the peek CLI."""
+
+import typer
+from peek_tool.cli.commands.bench.codec import codec_command
+from peek_tool.cli.commands.bench.python import python_command
+
+app = typer.Typer(help="Benchmark peek-tool internals")
+
+# Register commands
+app.command("codec")(codec_command)
+app.command("python")(python_command)
+
+__all__ = ["app"]
@@ -0,0 +1,36 @@
+"""Codec benchmark command."""
+
+from typing import List, Optional
+
+import typer
+
+from peek_tool.core.benchmarks import benchmark_codec
+
+# Targets used when none are given: small, medium, and large results
+DEFAULT_TARGETS = ["json", "email.message", "asyncio", "typing"]
+
+
+def codec_command(
+    targets: Optional[List[str]] = typer.Argument(
+        None, help="Targets whose inspection results are serialized"
+    ),
+    iterations: int = typer.Option(
+        20, "--iterations", "-n", help="Timed runs per operation"
+    ),
+) -> None:
+    """Compare the binary result codec with pickle and JSON."""
+    try:
+        rows = benchmark_codec(targets or DEFAULT_TARGETS, iterations=iterations)
+
+        header = f"{'target':<20} {'serializer':<12} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}"
+        typer.echo(header)
+        typer.echo("-" * len(header))
+        for row in rows:
+            typer.echo(
+                f"{row['target']:<20} {row['serializer']:<12} {row['size_bytes']:>10} "
+                f"{row['encode_ms']:>10.3f} {row['decode_ms']:>10.3f}"
+            )
+
+    except Exception as e:
+        typer.secho(f"Error: {str(e)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
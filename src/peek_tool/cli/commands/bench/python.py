@@ -0,0 +1,94 @@
+"""Python inspection benchmark command."""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from peek_tool.core.benchmarks import benchmark_python, compare_python_results, python_corpus
+
+
+def python_command(
+    modules: Optional[List[str]] = typer.Argument(
+        None, help="Modules to benchmark instead of the stdlib corpus"
+    ),
+    iterations: int = typer.Option(
+        10, "--iterations", "-n", min=1, help="Timed inspections per target"
+    ),
+    import_runs: int = typer.Option(
+        3, "--import-runs", min=1, help="Cold imports per module, in fresh interpreters"
+    ),
+    packages: bool = typer.Option(
+        True, "--packages/--no-packages", help="Add large installed packages (numpy, pandas, ...)"
+    ),
+    snapshot: bool = typer.Option(
+        False, "--snapshot", help="Answer stdlib targets from the stdlib snapshot"
+    ),
+    output: Path = typer.Option(
+        Path("peek-bench-python.json"), "--output", "-o", help="JSON results file to write"
+    ),
+    compare: Optional[Path] = typer.Option(
+        None, "--compare", help="Results file of an earlier run to compare against"
+    ),
+) -> None:
+    """Benchmark module, class, and function inspection over a fixed corpus."""
+    try:
+        baseline = json.loads(compare.read_text()) if compare is not None else None
+
+        corpus = python_corpus(modules, packages=packages)
+        typer.echo(f"Benchmarking {len(corpus)} targets...", err=True)
+        results = benchmark_python(
+            corpus, iterations=iterations, import_runs=import_runs, use_snapshot=snapshot
+        )
+
+        header = f"{'module':<28} {'import ms':>10}"
+        typer.echo(header)
+        typer.echo("-" * len(header))
+        for row in results["imports"]:
+            value = f"{row['median_ms']:>10.1f}" if "error" not in row else "     error"
+            typer.echo(f"{row['module']:<28} {value}")
+        typer.echo("")
+
+        header = (
+            f"{'target':<44} {'kind':<9} {'p50 ms':>9} {'p95 ms':>9} {'warm ms':>9} "
+            f"{'peak KiB':>10}"
+        )
+        typer.echo(header)
+        typer.echo("-" * len(header))
+        for row in results["targets"]:
+            if "error" in row:
+                typer.echo(f"{row['target']:<44} {row['kind']:<9} error: {row['error']}")
+                continue
+            typer.echo(
+                f"{row['target']:<44} {row['kind']:<9} {row['p50_ms']:>9.3f} "
+                f"{row['p95_ms']:>9.3f} {row['warm_p50_ms']:>9.3f} "
+                f"{row['peak_bytes'] / 1024:>10.1f}"
+            )
+
+        output.write_text(json.dumps(results, indent=2))
+        typer.echo(f"\nResults written to {output}", err=True)
+
+        if baseline is not None:
+            _echo_comparison(compare_python_results(baseline, results), compare)
+
+    except Exception as e:
+        typer.secho(f"Error: {str(e)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+
+def _echo_comparison(rows: List[dict], baseline: Path) -> None:
+    """Print the change of each target against the baseline run."""
+
+    def change(value: Optional[float]) -> str:
+        return f"{value * 100:+.1f}%" if value is not None else "n/a"
+
+    typer.echo(f"\nChange since {baseline} (positive is slower or larger):")
+    header = f"{'target':<44} {'p50':>9} {'p95':>9} {'peak':>9}"
+    typer.echo(header)
+    typer.echo("-" * len(header))
+    for row in rows:
+        typer.echo(
+            f"{row['target']:<44} {change(row['p50_ms_change']):>9} "
+            f"{change(row['p95_ms_change']):>9} {change(row['peak_bytes_change']):>9}"
+        )
@@ -0,0 +1,11 @@
+"""Index command group for the peek CLI."""
+
+import typer
+from peek_tool.cli.commands.index.stdlib import stdlib_command
+
+app = typer.Typer(help="Build prebuilt indexes and snapshots")
+
+# Register commands
+app.command("stdlib")(stdlib_command)
+
+__all__ = ["app"]
@@ -0,0 +1,46 @@
+"""Stdlib snapshot command."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from peek_tool.core.stdlib_snapshot import StdlibSnapshot
+
+
+def stdlib_command(
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Snapshot file (default: the peek cache directory)"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Worker processes (default: CPU count)"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="List modules that failed to import"
+    ),
+) -> None:
+    """Snapshot every standard-library module for instant, import-free answers."""
+    try:
+
+        def progress(item, done: int, total: int) -> None:
+            if done % 50 == 0 or done == total:
+                typer.echo(f"  {done}/{total} modules inspected", err=True)
+
+        typer.echo("Building stdlib snapshot...", err=True)
+        stats = StdlibSnapshot.build(path=output, workers=jobs, progress=progress)
+
+        typer.secho("\n✓ Success!", fg=typer.colors.GREEN, bold=True)
+        typer.echo(f"Snapshot written to: {stats['path']}")
+        typer.echo(
+            f"{stats['modules']} modules, {stats['bytes'] / 1024:.0f} KiB, "
+            f"built in {stats['seconds']}s"
+        )
+        if stats["failures"]:
+            typer.echo(f"{len(stats['failures'])} module(s) could not be imported")
+            if verbose:
+                for name in stats["failures"]:
+                    typer.echo(f"  {name}")
+
+    except Exception as e:
+        typer.secho(f"Error: {str(e)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
@@ -1,23 +1,217 @@
 """Inspect command implementation for peek-tool."""
 
+import sys
+from contextlib import nullcontext
+from typing import List, Optional
+
 import typer
 
 from peek_tool.core.base import InspectorFactory
+from peek_tool.core.crawler import PackageCrawler
+from peek_tool.core.import_profiler import ImportProfiler
+from peek_tool.core.memory_profiler import MemoryProfiler
+from peek_tool.core.timings import TimingRecorder, span
+from peek_tool.models.inspection_filters import InspectionFilters
 
 
 def inspect_command(
     target: str = typer.Argument(
-        ..., help="Target to inspect (e.g., Python module, class, or file path)"
+        ..., help="Target to inspect (e.g., Python module, class, file path, or pkg.whl:module)"
+    ),
+    type: Optional[str] = typer.Option(
+        None, "--type", "-t", help="Type of target to inspect (python, json, archive)"
+    ),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="Output format (text, json)"
+    ),
+    recursive: bool = typer.Option(
+        False, "--recursive", "-r", help="Inspect a package and all its submodules"
+    ),
+    depth: Optional[int] = typer.Option(
+        None, "--depth", "-d", help="Maximum submodule depth for --recursive"
+    ),
+    include: Optional[List[str]] = typer.Option(
+        None, "--include", help="Only inspect submodules matching this glob (repeatable)"
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None, "--exclude", help="Skip submodules matching this glob (repeatable)"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Worker processes for --recursive (default: CPU count)"
+    ),
+    profile_import: bool = typer.Option(
+        False,
+        "--profile-import",
+        help="Show a tree of the slowest modules imported during inspection",
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Show the time spent in each phase (resolve, import, introspect, format)",
+    ),
+    memprofile: bool = typer.Option(
+        False,
+        "--memprofile",
+        help="Trace memory: peak and retained bytes per phase and the top allocation sites",
+    ),
+    public_only: bool = typer.Option(
+        False, "--public-only", help="Skip members whose names start with an underscore"
+    ),
+    no_imported: bool = typer.Option(
+        False, "--no-imported", help="Skip classes and functions imported from elsewhere"
+    ),
+    respect_all: bool = typer.Option(
+        False, "--respect-all", help="Only inspect names listed in a module's __all__"
+    ),
+    kind: Optional[List[str]] = typer.Option(
+        None,
+        "--kind",
+        "-k",
+        help="Only inspect members of this kind: class, function, submodule (repeatable)",
+    ),
+    max_tokens: Optional[int] = typer.Option(
+        None,
+        "--max-tokens",
+        help="Fit text output to roughly this many tokens by adjusting the level of detail",
+    ),
+    python: Optional[str] = typer.Option(
+        None,
+        "--python",
+        help="Inspect with this Python interpreter (e.g. another venv's bin/python)",
     ),
 ) -> None:
     """Inspect a Python module, class, method, function, or JSON file."""
     try:
-        # Perform inspection using the factory
-        output = InspectorFactory.inspect(target)
+        output_format = format or "text"
+        filters = InspectionFilters(
+            public_only=public_only,
+            no_imported=no_imported,
+            respect_all=respect_all,
+            kinds=frozenset(kind or []),
+        )
 
-        # Print the formatted output
-        typer.echo(output)
+        if python is not None and (recursive or profile_import):
+            raise ValueError(
+                "--python cannot be combined with --recursive or --profile-import"
+            )
+
+        if recursive:
+            if max_tokens is not None:
+                raise ValueError("--max-tokens cannot be combined with --recursive")
+            if profile_import or timings or memprofile:
+                raise ValueError(
+                    "--profile-import, --timings and --memprofile cannot be combined with "
+                    "--recursive (submodules are inspected in worker processes)"
+                )
+            _inspect_recursive(
+                target, output_format, depth, include or [], exclude or [], jobs, filters
+            )
+            return
+
+        if timings and memprofile:
+            raise ValueError(
+                "--memprofile and --timings cannot be combined (tracing distorts the timings)"
+            )
+        if memprofile and python is not None:
+            raise ValueError("--memprofile cannot trace inspections run by another interpreter")
+
+        recorder = MemoryProfiler() if memprofile else TimingRecorder() if timings else None
+        with recorder or nullcontext():
+            if profile_import:
+                with ImportProfiler() as profiler:
+                    _inspect_single(target, type, output_format, filters, max_tokens)
+            else:
+                _inspect_single(target, type, output_format, filters, max_tokens, python)
+
+        # Keep machine-readable output parseable
+        if profile_import:
+            typer.echo(profiler.render(), err=output_format != "text")
+        if recorder is not None:
+            typer.echo(recorder.render(), err=output_format != "text")
 
     except Exception as e:
         typer.secho(f"Error: {str(e)}", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1)
+
+
+def _inspect_single(
+    target: str,
+    type: Optional[str],
+    output_format: str,
+    filters: InspectionFilters,
+    max_tokens: Optional[int] = None,
+    python: Optional[str] = None,
+) -> None:
+    """Inspect one target and print the result."""
+    if output_format == "text":
+        # Perform inspection using the factory
+        output = InspectorFactory.inspect(
+            target,
+            inspector_type=type,
+            filters=filters,
+            max_tokens=max_tokens,
+            python=python,
+        )
+
+        # Print the formatted output
+        typer.echo(output)
+    else:
+        if max_tokens is not None:
+            raise ValueError("--max-tokens only applies to text output")
+
+        # Machine-readable output is written incrementally
+        chunks = InspectorFactory.inspect_stream(
+            target,
+            output_format=output_format,
+            inspector_type=type,
+            filters=filters,
+            python=python,
+        )
+        # Streamed, so the format phase includes writing the output
+        with span("format"):
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+
+
+def _inspect_recursive(
+    target: str,
+    output_format: str,
+    depth: Optional[int],
+    include: List[str],
+    exclude: List[str],
+    jobs: Optional[int],
+    filters: InspectionFilters,
+) -> None:
+    """Crawl a package and print each submodule's result as soon as it is ready.
+
+    Text output separates modules with blank lines; JSON output is written as
+    JSON Lines (one document per module).
+    """
+    crawler = PackageCrawler(
+        depth=depth, include=include, exclude=exclude, workers=jobs, filters=filters
+    )
+    formatter = InspectorFactory.create_formatter("python", output_format)
+
+    failures = 0
+    for item in crawler.crawl(target):
+        if item.error is not None:
+            failures += 1
+            typer.secho(
+                f"Error inspecting {item.module_name}: {item.error}",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            continue
+
+        if output_format == "text":
+            typer.echo(formatter.format(item.result))
+        else:
+            for chunk in formatter.stream(item.result):
+                sys.stdout.write(chunk)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+
+    if failures:
+        typer.secho(f"{failures} module(s) failed to import", fg=typer.colors.YELLOW, err=True)
@@ -1,19 +1,59 @@
 """MCP server command implementation."""
 
+from typing import List, Optional
+
 import typer
 
-from peek_tool.mcp_server import server
+from peek_tool.mcp_server import run
+from peek_tool.mcp_server.config import build_options
 
 
 def server_command(
     transport: str = typer.Option(
         "stdio", "--transport", "-t", help="Transport protocol (stdio, sse)"
     ),
+    python: Optional[str] = typer.Option(
+        None,
+        "--python",
+        help="Inspect Python targets with this interpreter (e.g. a project venv's bin/python)",
+    ),
+    preload: Optional[List[str]] = typer.Option(
+        None,
+        "--preload",
+        help="Module or JSON file to load in the background after start-up (repeatable)",
+    ),
+    config: Optional[str] = typer.Option(
+        None, "--config", help="TOML file with server options and a [preload] list"
+    ),
+    prefetch: bool = typer.Option(
+        False,
+        "--prefetch",
+        help="After serving a module, load its classes and submodules while idle",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", min=1, help="Tool calls running at once (default: 4)"
+    ),
+    max_per_client: Optional[int] = typer.Option(
+        None,
+        "--max-per-client",
+        min=1,
+        help="Tool calls one client may have running at once (default: 2)",
+    ),
 ) -> None:
     """Start the MCP server for integration."""
     try:
         # Run the MCP server with specified options
-        server.run(transport=transport)
+        run(
+            build_options(
+                transport,
+                python,
+                preload or [],
+                config,
+                prefetch,
+                workers,
+                max_per_client,
+            )
+        )
     except Exception as e:
         typer.secho(
             f"Error starting MCP server: {str(e)}", fg=typer.colors.RED, err=True
@@ -0,0 +1,5 @@
+"""References command for the peek CLI."""
+
+from peek_tool.cli.commands.refs.command import refs_command
+
+__all__ = ["refs_command"]
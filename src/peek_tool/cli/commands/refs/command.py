@@ -0,0 +1,32 @@
+"""References command implementation for peek-tool."""
+
+from typing import Optional
+
+import typer
+
+from peek_tool.core.reference_index import ReferenceFinder
+
+
+def refs_command(
+    symbol: str = typer.Argument(
+        ..., help="Dotted name (e.g., json.dumps) or bare name (e.g., dumps)"
+    ),
+    root: str = typer.Argument(".", help="Directory whose Python files are searched"),
+    kind: Optional[str] = typer.Option(
+        None,
+        "--kind",
+        "-k",
+        help="Only show one kind: import, call, base, attribute, name, or definition",
+    ),
+    limit: int = typer.Option(200, "--limit", "-n", help="Maximum number of references"),
+) -> None:
+    """Find where a symbol is imported, called, subclassed, or used in a project."""
+    try:
+        output, _ = ReferenceFinder.get_references_results(
+            symbol, root, kind=kind, limit=limit
+        )
+        typer.echo(output)
+
+    except Exception as e:
+        typer.secho(f"Error: {str(e)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
@@ -0,0 +1,5 @@
+"""Search command for the peek CLI."""
+
+from peek_tool.cli.commands.search.command import search_command
+
+__all__ = ["search_command"]
@@ -0,0 +1,25 @@
+"""Search command implementation for peek-tool."""
+
+import typer
+
+from peek_tool.core.docstring_search import DocstringSearcher
+
+
+def search_command(
+    package: str = typer.Argument(..., help="Package or module to search (e.g., json)"),
+    query: str = typer.Argument(..., help="Words (or a regex with --regex) to find"),
+    regex: bool = typer.Option(
+        False, "--regex", "-r", help="Treat the query as a regular expression"
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", help="Maximum number of hits"),
+) -> None:
+    """Search the docstrings of every module in a package."""
+    try:
+        output, _ = DocstringSearcher.get_search_results(
+            package, query, regex=regex, limit=limit
+        )
+        typer.echo(output)
+
+    except Exception as e:
+        typer.secho(f"Error: {str(e)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
@@ -0,0 +1,5 @@
+"""Source command for the peek CLI."""
+
+from peek_tool.cli.commands.source.command import source_command
+
+__all__ = ["source_command"]
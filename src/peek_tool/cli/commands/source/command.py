@@ -0,0 +1,28 @@
+"""Source command implementation for peek-tool."""
+
+from typing import Optional
+
+import typer
+
+from peek_tool.core.source_index import SourceViewer
+
+
+def source_command(
+    target: str = typer.Argument(
+        ..., help="Module, class, function, or method (e.g., json.dumps)"
+    ),
+    lines: Optional[str] = typer.Option(
+        None,
+        "--lines",
+        "-l",
+        help="File line range to show, clipped to the definition (e.g., 180:200)",
+    ),
+) -> None:
+    """Show the source code of a Python target with line numbers."""
+    try:
+        output, _ = SourceViewer.get_source(target, lines=lines)
+        typer.echo(output)
+
+    except Exception as e:
+        typer.secho(f"Error: {str(e)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
@@ -1,6 +1,13 @@
 from peek_tool.core.base import Inspector, InspectorFactory
 from peek_tool.core.python_inspector import PythonInspector
 from peek_tool.core.json_inspector import JsonInspector
+from peek_tool.core.archive_inspector import ArchiveInspector
 
 # Ensure inspectors are registered
-__all__ = ["Inspector", "InspectorFactory", "PythonInspector", "JsonInspector"]
+__all__ = [
+    "Inspector",
+    "InspectorFactory",
+    "PythonInspector",
+    "JsonInspector",
+    "ArchiveInspector",
+]
@@ -0,0 +1,606 @@
+"""Inspect wheels and sdists without installing them.
+
+Targets look like ``path/to/pkg.whl:module.Class.method``. The archive's
+member list is read once; source files are decompressed only when a module is
+inspected (zip archives are read member by member; tar archives are streamed)
+and parsed statically with ``ast``, so no code from the archive is executed.
+The resulting ``Module``/``Class``/``Method`` models are the same ones the live
+Python inspector produces and are rendered by the same formatters.
+
+Parsed modules are cached in memory and on disk, keyed by the SHA-256 of the
+archive, so a re-inspected archive is neither decompressed nor parsed again.
+
+Static analysis is approximate: names imported from other modules of the same
+archive are resolved (including ``from .x import *``), but names imported from
+outside the archive are omitted, and inherited methods are only listed for base
+classes defined in the archive.
+"""
+
+import ast
+import dataclasses
+import hashlib
+import os
+import re
+import tarfile
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Set, Tuple
+
+from peek_tool.core import codec
+from peek_tool.core.base import Inspector, InspectorFactory, TargetNotFoundError
+from peek_tool.core.cache import get_cache_dir
+from peek_tool.core.docstring_parser import DocstringParser
+from peek_tool.core.name_index import MIN_SIMILARITY, similarity
+from peek_tool.models.inspection_result import InspectionResult
+from peek_tool.models.python_element import Class, Method, Module, Parameter
+
+# Bump when the cached model format changes
+ARCHIVE_FORMAT = 1
+
+# Archives kept open in memory (e.g. by a long-running MCP server)
+MAX_OPEN_ARCHIVES = 16
+
+ARCHIVE_SUFFIXES = (".whl", ".zip", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".tar")
+
+# Decorators that make a class attribute something other than a plain method
+# (the live inspector does not list these either)
+_NON_METHOD_DECORATORS = {"property", "cached_property", "classmethod"}
+
+
+def is_archive(path: str) -> bool:
+    """Whether a path names a supported archive file."""
+    return path.lower().endswith(ARCHIVE_SUFFIXES) and os.path.isfile(path)
+
+
+class _Archive:
+    """Lazily read Python sources from a wheel or sdist."""
+
+    def __init__(self, path: str, digest: str):
+        self.path = path
+        self.digest = digest
+        self.is_wheel = path.lower().endswith(".whl")
+        self.is_zip = zipfile.is_zipfile(path)
+        self._handle = None  # Opened on first read and kept open
+
+        # Module name -> (member name, is package)
+        self.modules: Dict[str, Tuple[str, bool]] = {}
+        self.metadata_member: Optional[str] = None
+
+        # Modules with imported names resolved (persisted), and the parse
+        # state they are built from (in memory only)
+        self.parsed: Dict[str, Module] = {}
+        self._locals: Dict[str, Optional[_LocalModule]] = {}
+        self._classes: Dict[str, Class] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+
+        self._index_members(self._member_names())
+        self._load_cache()
+
+    def _open(self):
+        if self._handle is None:
+            self._handle = (
+                zipfile.ZipFile(self.path) if self.is_zip else tarfile.open(self.path)
+            )
+        return self._handle
+
+    def _member_names(self) -> List[str]:
+        archive = self._open()
+        if self.is_zip:
+            return archive.namelist()
+        return [member.name for member in archive.getmembers() if member.isfile()]
+
+    def _index_members(self, names: List[str]) -> None:
+        """Map module names to archive members."""
+        # Sdists wrap everything in a "name-version/" directory
+        roots = {PurePosixPath(name).parts[0] for name in names if name}
+        strip_root = not self.is_wheel and len(roots) == 1
+
+        for name in names:
+            parts = list(PurePosixPath(name).parts)
+            if strip_root:
+                parts = parts[1:]
+            if not parts:
+                continue
+
+            if parts[-1] in ("METADATA", "PKG-INFO") and (
+                len(parts) == 1 or parts[0].endswith(".dist-info")
+            ):
+                self.metadata_member = name
+            if not parts[-1].endswith((".py", ".pyi")):
+                continue
+
+            if self.is_wheel and parts[0].endswith(".data"):
+                # Only library code from the wheel's data directory is importable
+                if len(parts) < 3 or parts[1] not in ("purelib", "platlib"):
+                    continue
+                parts = parts[2:]
+            elif not self.is_wheel and parts[0] == "src":
+                parts = parts[1:]
+
+            stem = parts[-1].rsplit(".", 1)[0]
+            module_parts = parts[:-1] if stem == "__init__" else parts[:-1] + [stem]
+            if not module_parts or not all(p.isidentifier() for p in module_parts):
+                continue
+
+            module_name = ".".join(module_parts)
+            # Sources win over stubs
+            existing = self.modules.get(module_name)
+            if existing is None or existing[0].endswith(".pyi"):
+                self.modules[module_name] = (name, stem == "__init__")
+
+    def read(self, member: str) -> bytes:
+        """Decompress a single member."""
+        with self._lock:
+            archive = self._open()
+            if self.is_zip:
+                return archive.read(member)
+            extracted = archive.extractfile(member)
+            return extracted.read() if extracted is not None else b""
+
+    def summary(self) -> str:
+        """Name, version, and summary from the package metadata, if present."""
+        if self.metadata_member is None:
+            return ""
+        text = self.read(self.metadata_member).decode("utf-8", "replace")
+        headers = dict(
+            re.findall(r"^(Name|Version|Summary): (.*)$", text.split("\n\n", 1)[0], re.M)
+        )
+        name = " ".join(filter(None, [headers.get("Name"), headers.get("Version")]))
+        summary = headers.get("Summary", "")
+        return f"{name}: {summary}" if name and summary else name or summary
+
+    def submodules(self, module_name: str) -> List[str]:
+        """Direct submodules of a package (or top-level modules for "")."""
+        prefix = f"{module_name}." if module_name else ""
+        depth = prefix.count(".") + 1
+        children = set()
+        for name in self.modules:
+            if name.startswith(prefix):
+                children.add(".".join(name.split(".")[:depth]))
+        return sorted(children)
+
+    def get_module(self, module_name: str) -> Optional[Module]:
+        """Return the model of a module in the archive, with imported names resolved."""
+        with self._lock:
+            if module_name in self.parsed:
+                return self.parsed[module_name]
+            local = self._local(module_name)
+            if local is None:
+                return None
+
+            classes = {name: self._complete_class(module_name, name) for name in local.classes}
+            functions = dict(local.functions)
+            imported_names = list(local.imports)
+            for source in local.star_imports:
+                imported_names += sorted(self._exported_names(source, set()))
+
+            for name in imported_names:
+                if name in classes or name in functions:
+                    continue
+                found = self._lookup(module_name, name, set())
+                if found is None or found[0] == module_name:
+                    continue
+                source, member = found
+                target = classes if isinstance(member, Class) else functions
+                target[name] = dataclasses.replace(
+                    member, is_imported=True, import_source=source
+                )
+
+            module = Module(
+                name=module_name,
+                docstring=local.docstring,
+                parsed_docstring=DocstringParser.parse(local.docstring),
+                classes=[classes[name] for name in sorted(classes)],
+                functions=[functions[name] for name in sorted(functions)],
+                submodules=self.submodules(module_name) if local.is_package else [],
+            )
+            self.parsed[module_name] = module
+            self._dirty = True
+            return module
+
+    def _local(self, module_name: str) -> Optional["_LocalModule"]:
+        """Parse a module's own definitions (each module is decompressed at most once)."""
+        if module_name not in self._locals:
+            entry = self.modules.get(module_name)
+            self._locals[module_name] = (
+                _ModuleParser(module_name, entry[1]).parse(self.read(entry[0]))
+                if entry is not None
+                else None
+            )
+        return self._locals[module_name]
+
+    def _lookup(
+        self, module_name: str, name: str, seen: Set[Tuple[str, str]]
+    ) -> Optional[Tuple[str, object]]:
+        """Follow a name through imports to its definition.
+
+        Returns:
+            A tuple of (defining module, Class or Method), or None if the name
+            is not defined in the archive
+        """
+        if (module_name, name) in seen:
+            return None
+        seen.add((module_name, name))
+
+        local = self._local(module_name)
+        if local is None:
+            return None
+        if name in local.classes:
+            return module_name, self._complete_class(module_name, name)
+        if name in local.functions:
+            return module_name, local.functions[name]
+        if name in local.imports:
+            return self._lookup(*local.imports[name], seen)
+        if not name.startswith("_"):
+            for source in local.star_imports:
+                found = self._lookup(source, name, seen)
+                if found is not None:
+                    return found
+        return None
+
+    def _exported_names(self, module_name: str, seen: Set[str]) -> Set[str]:
+        """Public names a ``from module import *`` brings in."""
+        if module_name in seen:
+            return set()
+        seen.add(module_name)
+
+        local = self._local(module_name)
+        if local is None:
+            return set()
+        names = set(local.classes) | set(local.functions) | set(local.imports)
+        for source in local.star_imports:
+            names |= self._exported_names(source, seen)
+        return {name for name in names if not name.startswith("_")}
+
+    def _complete_class(self, module_name: str, class_name: str) -> Class:
+        """A class with the methods it inherits from base classes defined in the archive."""
+        qualified_name = f"{module_name}.{class_name}"
+        if qualified_name in self._classes:
+            return self._classes[qualified_name]
+
+        own, base_names = self._local(module_name).classes[class_name]
+        # Guards against (invalid) inheritance cycles
+        self._classes[qualified_name] = own
+
+        methods = {method.name: method for method in own.methods}
+        for base_name in base_names:
+            found = self._lookup(module_name, base_name, set())
+            if found is not None and isinstance(found[1], Class):
+                for method in found[1].methods:
+                    methods.setdefault(method.name, method)
+
+        complete = dataclasses.replace(
+            own, methods=[methods[name] for name in sorted(methods)]
+        )
+        self._classes[qualified_name] = complete
+        return complete
+
+    def _cache_file(self) -> Path:
+        return get_cache_dir("archives") / f"{self.digest[:32]}.peekarc"
+
+    def _load_cache(self) -> None:
+        try:
+            data = codec.decode(self._cache_file().read_bytes())
+        except Exception:
+            return
+        if isinstance(data, dict) and data.get("format") == ARCHIVE_FORMAT:
+            self.parsed.update(data["modules"])
+
+    def save_cache(self) -> None:
+        """Persist the modules parsed so far, if any were added."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                payload = codec.encode({"format": ARCHIVE_FORMAT, "modules": self.parsed})
+                self._cache_file().write_bytes(payload)
+            except OSError:
+                return
+            self._dirty = False
+
+    def close(self) -> None:
+        """Persist parsed modules and close the archive file (reopened if read again)."""
+        with self._lock:
+            self.save_cache()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+@dataclass
+class _LocalModule:
+    """Definitions of one archive module, before imported names are resolved."""
+
+    docstring: str
+    is_package: bool
+    # Name -> (class with its own methods, base class names)
+    classes: Dict[str, Tuple[Class, List[str]]] = field(default_factory=dict)
+    functions: Dict[str, Method] = field(default_factory=dict)
+    # Local name -> (source module, name in the source module)
+    imports: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    star_imports: List[str] = field(default_factory=list)
+
+
+class _ModuleParser:
+    """Collect the definitions and imports in the source of one archive module."""
+
+    def __init__(self, module_name: str, is_package: bool):
+        self.module_name = module_name
+        self.is_package = is_package
+
+    def parse(self, source: bytes) -> _LocalModule:
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            tree = ast.Module(body=[], type_ignores=[])
+
+        local = _LocalModule(docstring=ast.get_docstring(tree) or "", is_package=self.is_package)
+        for node in _top_level_statements(tree.body):
+            if isinstance(node, ast.ImportFrom):
+                source_name = self._resolve_from(node)
+                for alias in node.names:
+                    if alias.name == "*":
+                        local.star_imports.append(source_name)
+                    else:
+                        local.imports[alias.asname or alias.name] = (source_name, alias.name)
+            elif isinstance(node, ast.ClassDef):
+                local.classes[node.name] = (
+                    self._parse_class(node),
+                    [_base_name(base) for base in node.bases],
+                )
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                local.functions[node.name] = _parse_function(node)
+        return local
+
+    def _resolve_from(self, node: ast.ImportFrom) -> str:
+        """Absolute name of the module a ``from ... import`` statement reads from."""
+        if not node.level:
+            return node.module or ""
+        parts = self.module_name.split(".")
+        if not self.is_package:
+            parts = parts[:-1]
+        if node.level > 1:
+            parts = parts[: len(parts) - (node.level - 1)]
+        return ".".join(parts + ([node.module] if node.module else []))
+
+    def _parse_class(self, node: ast.ClassDef) -> Class:
+        """Build a Class model with the methods the class itself defines."""
+        docstring = ast.get_docstring(node) or ""
+        qualified_name = f"{self.module_name}.{node.name}"
+        class_info = Class(
+            name=node.name,
+            docstring=docstring,
+            parsed_docstring=DocstringParser.parse(docstring),
+            base_classes=[
+                name for name in map(_base_name, node.bases) if name != "object"
+            ],
+            qualified_name=qualified_name,
+        )
+
+        for item in _top_level_statements(node.body):
+            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if item.name.startswith("__") and item.name != "__init__":
+                continue
+            if any(_decorator_name(d) in _NON_METHOD_DECORATORS for d in item.decorator_list):
+                continue
+            if any(
+                isinstance(d, ast.Attribute) and d.attr in ("setter", "getter", "deleter")
+                for d in item.decorator_list
+            ):
+                continue
+            method = _parse_function(item)
+            method.defined_in = qualified_name
+            class_info.methods.append(method)
+        return class_info
+
+
+def _top_level_statements(body: List[ast.stmt]):
+    """Yield statements of a body, descending into ``if``/``try`` blocks."""
+    for node in body:
+        if isinstance(node, ast.If):
+            yield from _top_level_statements(node.body)
+            yield from _top_level_statements(node.orelse)
+        elif isinstance(node, ast.Try):
+            yield from _top_level_statements(node.body)
+            for handler in node.handlers:
+                yield from _top_level_statements(handler.body)
+            yield from _top_level_statements(node.orelse)
+            yield from _top_level_statements(node.finalbody)
+        else:
+            yield node
+
+
+def _parse_function(node) -> Method:
+    """Build a Method model from a function definition."""
+    docstring = ast.get_docstring(node) or ""
+    parsed_doc = DocstringParser.parse(docstring)
+    method = Method(
+        name=node.name,
+        docstring=docstring,
+        parsed_docstring=parsed_doc,
+        return_type=ast.unparse(node.returns) if node.returns else None,
+    )
+
+    args = node.args
+    positional = args.posonlyargs + args.args
+    defaults: List[Optional[ast.expr]] = [None] * (len(positional) - len(args.defaults))
+    defaults += args.defaults
+    pairs = list(zip(positional, defaults))
+    if args.vararg:
+        pairs.append((args.vararg, None))
+    pairs += list(zip(args.kwonlyargs, args.kw_defaults))
+    if args.kwarg:
+        pairs.append((args.kwarg, None))
+
+    for arg, default in pairs:
+        # Skip self parameter for methods
+        if arg.arg == "self" and node.name != "__init__":
+            continue
+        method.parameters.append(
+            Parameter(
+                name=arg.arg,
+                type_annotation=ast.unparse(arg.annotation) if arg.annotation else None,
+                default_value=_format_default(default),
+                description=parsed_doc.param_description(arg.arg),
+            )
+        )
+    return method
+
+
+def _format_default(node: Optional[ast.expr]) -> Optional[str]:
+    """Format a default value the way the live inspector does."""
+    if node is None:
+        return None
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, SyntaxError, TypeError):
+        return "..."
+    if value is None:
+        return "None"
+    if isinstance(value, (str, int, float, bool)):
+        return repr(value)
+    return "..."
+
+
+def _base_name(node: ast.expr) -> str:
+    """Short name of a base class expression (``abc.ABC`` -> ``ABC``)."""
+    if isinstance(node, ast.Subscript):
+        node = node.value
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ast.unparse(node)
+
+
+def _decorator_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Call):
+        node = node.func
+    return _base_name(node)
+
+
+class ArchiveInspector(Inspector):
+    """Inspector for modules inside wheels and sdists, parsed without installing them."""
+
+    # Archives by content hash, shared across inspections, least recently
+    # used first; each keeps its file open and its parsed modules in memory
+    _archives: "OrderedDict[str, _Archive]" = OrderedDict()
+    # (path, size, mtime_ns) -> content hash
+    _digests: Dict[Tuple[str, int, int], str] = {}
+    _lock = threading.Lock()
+
+    def supports(self, target: str) -> bool:
+        """Check if the target names an existing wheel or sdist."""
+        return is_archive(target.split(":", 1)[0])
+
+    def inspect(self, target_name: str) -> InspectionResult:
+        """Inspect an archive, or a module, class, or method inside it."""
+        path, _, dotted = target_name.partition(":")
+        archive = self.get_archive(path)
+        display_name = f"{os.path.basename(path)}:{dotted}" if dotted else os.path.basename(path)
+
+        try:
+            if not dotted:
+                root = Module(
+                    name=os.path.basename(path),
+                    docstring=archive.summary(),
+                    submodules=archive.submodules(""),
+                )
+                return InspectionResult(name=display_name, type="module", elements=[root])
+
+            result = self._inspect_dotted(archive, dotted, display_name)
+        finally:
+            archive.save_cache()
+
+        if result is None:
+            raise TargetNotFoundError(
+                f"Could not find {dotted} in {path}",
+                target_name,
+                [f"{path}:{name}" for name in self._suggest_in(archive, dotted)],
+            )
+        return result
+
+    def _inspect_dotted(
+        self, archive: _Archive, dotted: str, display_name: str
+    ) -> Optional[InspectionResult]:
+        """Resolve module.Class.method inside an archive."""
+        parts = dotted.split(".")
+        # The longest prefix that names a module in the archive
+        for i in range(len(parts), 0, -1):
+            module = archive.get_module(".".join(parts[:i]))
+            if module is not None:
+                break
+        else:
+            return None
+
+        remainder = parts[i:]
+        if not remainder:
+            return InspectionResult(name=display_name, type="module", elements=[module])
+
+        members = {m.name: m for m in module.classes + module.functions}
+        element = members.get(remainder[0])
+        if element is None:
+            return None
+        if len(remainder) == 1:
+            kind = "class" if isinstance(element, Class) else "function"
+            if element.is_imported:
+                # Viewed directly, the element is not "imported" from anywhere
+                element = dataclasses.replace(element, is_imported=False, import_source=None)
+            return InspectionResult(name=display_name, type=kind, elements=[element])
+
+        if isinstance(element, Class) and len(remainder) == 2:
+            for method in element.methods:
+                if method.name == remainder[1]:
+                    return InspectionResult(
+                        name=display_name, type="function", elements=[method]
+                    )
+        return None
+
+    def _suggest_in(self, archive: _Archive, dotted: str) -> List[str]:
+        """Module and member names of the archive that resemble a dotted target."""
+        candidates = list(archive.modules)
+        parent = dotted.rsplit(".", 1)[0] if "." in dotted else ""
+        module = archive.get_module(parent) if parent else None
+        if module is not None:
+            candidates += [f"{parent}.{m.name}" for m in module.classes + module.functions]
+
+        scored = [(similarity(dotted, name), name) for name in candidates]
+        scored = [item for item in scored if item[0] >= MIN_SIMILARITY]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [name for _, name in scored[:5]]
+
+    @classmethod
+    def get_archive(cls, path: str) -> _Archive:
+        """Return the (cached) archive at a path, keyed by its content hash."""
+        stat = os.stat(path)
+        file_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with cls._lock:
+            digest = cls._digests.get(file_key)
+            if digest is None:
+                sha = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        sha.update(block)
+                digest = cls._digests[file_key] = sha.hexdigest()
+
+            archive = cls._archives.get(digest)
+            if archive is not None:
+                cls._archives.move_to_end(digest)
+                return archive
+
+            archive = cls._archives[digest] = _Archive(path, digest)
+            while len(cls._archives) > MAX_OPEN_ARCHIVES:
+                evicted_digest, evicted = cls._archives.popitem(last=False)
+                evicted.close()
+                for key in [k for k, d in cls._digests.items() if d == evicted_digest]:
+                    del cls._digests[key]
+            return archive
+
+
+# Register the inspector with its formatter
+InspectorFactory.register("archive", ArchiveInspector, formatter_type="python-text")
@@ -1,13 +1,31 @@
+import dataclasses
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, Iterator, List, Optional, Tuple, Type
 
+from peek_tool.core.metrics import INSPECTION_SECONDS
+from peek_tool.core.timings import active_recorder, span
+from peek_tool.models.inspection_filters import InspectionFilters
 from peek_tool.models.inspection_result import InspectionResult
 
 
+class TargetNotFoundError(ValueError):
+    """Raised when a target cannot be found, with suggestions for what was meant."""
+
+    def __init__(self, message: str, target: str, suggestions: Optional[List[str]] = None):
+        self.target = target
+        self.suggestions = list(suggestions or [])
+        if self.suggestions:
+            message = f"{message}. Did you mean: {', '.join(self.suggestions)}?"
+        super().__init__(message)
+
+
 class Inspector(ABC):
     """Base class for all inspectors."""
 
+    # Whether the inspector accepts InspectionFilters in its constructor
+    supports_filters = False
+
     @abstractmethod
     def inspect(self, target_name: str) -> InspectionResult:
         """Inspect a target and return structured results."""
@@ -18,6 +36,10 @@ class Inspector(ABC):
         """Check if this inspector supports the given target."""
         pass
 
+    def suggest(self, target: str) -> List[str]:
+        """Suggest targets the user may have meant when a target is not found."""
+        return []
+
 
 class InspectorFactory:
     """Factory for creating appropriate inspectors based on target type."""
@@ -41,12 +63,20 @@ class InspectorFactory:
             cls._formatter_mappings[name] = formatter_type
 
     @classmethod
-    def create_inspector(cls, target_type: str) -> Inspector:
+    def create_inspector(
+        cls, target_type: str, filters: Optional[InspectionFilters] = None
+    ) -> Inspector:
         """Create and return appropriate inspector for the target type."""
         if target_type not in cls._inspectors:
             raise ValueError(f"No inspector registered for target type: {target_type}")
 
-        return cls._inspectors[target_type]()
+        inspector_class = cls._inspectors[target_type]
+        if filters is not None and filters.is_active:
+            if not inspector_class.supports_filters:
+                raise ValueError(f"Filters are not supported for {target_type} targets")
+            return inspector_class(filters=filters)
+
+        return inspector_class()
 
     @classmethod
     def detect_inspector_type(cls, target: str) -> str:
@@ -57,6 +87,10 @@ class InspectorFactory:
             extension = path.suffix.lower()
             if extension == ".json":
                 return "json"
+            from peek_tool.core.archive_inspector import ARCHIVE_SUFFIXES
+
+            if path.name.lower().endswith(ARCHIVE_SUFFIXES):
+                return "archive"
             # Add more file types as needed
 
         # Default to Python for other targets
@@ -68,13 +102,71 @@ class InspectorFactory:
         return cls._formatter_mappings.get(inspector_type, "text")
 
     @classmethod
-    def inspect(cls, target: str) -> str:
+    def inspect_result(
+        cls,
+        target: str,
+        inspector_type: Optional[str] = None,
+        filters: Optional[InspectionFilters] = None,
+        python: Optional[str] = None,
+    ) -> InspectionResult:
+        """
+        Inspect a target and return the structured result without formatting it.
+
+        Args:
+            target: The target to inspect
+            inspector_type: Inspector to use (auto-detected if None)
+            filters: Which members to inspect (all if None)
+            python: Interpreter to inspect Python targets with (this one if None)
+
+        Returns:
+            The inspection result
+
+        Raises:
+            ValueError: If inspection fails
+        """
+        return cls._run_inspection(target, inspector_type, filters, python)[1]
+
+    @classmethod
+    def create_formatter(cls, inspector_type: str, output_format: str = "text"):
+        """
+        Create the formatter for an inspector type and output format.
+
+        The "text" output format uses the formatter associated with the
+        inspector type; any other value names a registered formatter
+        (e.g. "json" for machine-readable output).
+        """
+        from peek_tool.formatters.base import FormatterFactory
+
+        if output_format == "text":
+            format_type = cls.get_formatter_for_inspector(inspector_type)
+        else:
+            format_type = output_format
+
+        return FormatterFactory.create_formatter(format_type)
+
+    @classmethod
+    def inspect(
+        cls,
+        target: str,
+        output_format: str = "text",
+        inspector_type: Optional[str] = None,
+        filters: Optional[InspectionFilters] = None,
+        max_tokens: Optional[int] = None,
+        python: Optional[str] = None,
+    ) -> str:
         """
         Perform a complete inspection operation with automatic type detection
         and formatter selection.
 
         Args:
             target: The target to inspect
+            output_format: "text" for the inspector's text formatter, or the
+                name of another registered formatter such as "json"
+            inspector_type: Inspector to use (auto-detected if None)
+            filters: Which members to inspect (all if None)
+            max_tokens: Token budget for text output; formatter limits are
+                planned from the result to fit it (no limit if None)
+            python: Interpreter to inspect Python targets with (this one if None)
 
         Returns:
             Formatted inspection result as a string
@@ -82,28 +174,94 @@ class InspectorFactory:
         Raises:
             ValueError: If inspection fails
         """
-        # Auto-detect inspector type
-        detected_type = cls.detect_inspector_type(target)
+        detected_type, result = cls._run_inspection(
+            target, inspector_type, filters, python
+        )
 
-        # Create the appropriate inspector
-        inspector = cls.create_inspector(detected_type)
+        # Create and use the formatter
+        formatter = cls.create_formatter(detected_type, output_format)
+        if max_tokens is not None:
+            if output_format != "text":
+                raise ValueError("A token budget only applies to text output")
+            from peek_tool.core.output_planner import OutputPlanner
+
+            with span("plan"):
+                plan = OutputPlanner.plan(result, formatter, max_tokens)
+            plan.apply(formatter)
+            result.metadata["output_plan"] = plan.as_dict()
+        with span("format"):
+            return formatter.format(result)
+
+    @classmethod
+    def inspect_stream(
+        cls,
+        target: str,
+        output_format: str = "text",
+        inspector_type: Optional[str] = None,
+        filters: Optional[InspectionFilters] = None,
+        python: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Like inspect(), but yield the formatted output in chunks.
+
+        The inspection itself runs eagerly so errors are raised before any
+        output is produced.
+        """
+        detected_type, result = cls._run_inspection(
+            target, inspector_type, filters, python
+        )
+        formatter = cls.create_formatter(detected_type, output_format)
+        return formatter.stream(result)
+
+    @classmethod
+    def _run_inspection(
+        cls,
+        target: str,
+        inspector_type: Optional[str] = None,
+        filters: Optional[InspectionFilters] = None,
+        python: Optional[str] = None,
+    ) -> Tuple[str, InspectionResult]:
+        """Resolve the inspector for a target and run it."""
+        with span("resolve"):
+            # Auto-detect inspector type
+            detected_type = inspector_type or cls.detect_inspector_type(target)
+
+            if python is None:
+                # Create the appropriate inspector
+                inspector = cls.create_inspector(detected_type, filters)
+                supported = inspector.supports(target)
+
+        if python is not None:
+            if detected_type != "python":
+                raise ValueError("An interpreter can only be chosen for Python targets")
+            from peek_tool.core.interpreter_pool import InterpreterPool
+
+            with span("inspect"), INSPECTION_SECONDS.time(detected_type):
+                result = InterpreterPool.inspect_result(python, target, filters)
+            return detected_type, _with_timings(result)
 
         # Validate that the inspector supports this target
-        if not inspector.supports(target):
-            raise ValueError(
-                f"Target '{target}' is not supported by the {detected_type} inspector"
+        if not supported:
+            raise TargetNotFoundError(
+                f"Target '{target}' is not supported by the {detected_type} inspector",
+                target,
+                inspector.suggest(target),
             )
 
         # Perform the inspection
-        result = inspector.inspect(target)
-
-        # Get the associated formatter
-        format_type = cls.get_formatter_for_inspector(detected_type)
+        with span("inspect"), INSPECTION_SECONDS.time(detected_type):
+            result = inspector.inspect(target)
+        return detected_type, _with_timings(result)
 
-        # Create and use the formatter
-        from peek_tool.formatters.base import FormatterFactory
 
-        formatter = FormatterFactory.create_formatter(format_type)
-        output = formatter.format(result)
+def _with_timings(result: InspectionResult) -> InspectionResult:
+    """Copy the phases recorded so far into the result's metadata when recording.
 
-        return output
+    The result is copied, since inspectors may hand out cached results.
+    """
+    recorder = active_recorder()
+    if recorder is None:
+        return result
+    return dataclasses.replace(
+        result, metadata={**result.metadata, recorder.metadata_key: recorder.as_dict()}
+    )
@@ -0,0 +1,362 @@
+"""Micro-benchmarks for peek-tool internals.
+
+This module measures the performance of internal building blocks against
+their obvious alternatives, so design choices can be re-checked on new
+interpreter versions and larger inputs. It also benchmarks Python inspection
+end to end over a fixed corpus, with results that can be saved and compared
+across runs to catch regressions.
+"""
+
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import pickle
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from peek_tool import __version__
+from peek_tool.core import codec
+from peek_tool.core.base import InspectorFactory
+from peek_tool.core.docstring_parser import DocstringParser
+
+# Version of the benchmark_python() results format (2: latencies include
+# docstring parsing)
+PYTHON_RESULTS_VERSION = 2
+
+# Fixed stdlib corpus: module -> (class, function) inspected along with it
+STDLIB_CORPUS: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+    "json": ("json.JSONDecoder", "json.dumps"),
+    "collections": ("collections.OrderedDict", "collections.namedtuple"),
+    "typing": ("typing.Generic", "typing.get_type_hints"),
+    "inspect": ("inspect.Signature", "inspect.signature"),
+    "pathlib": ("pathlib.Path", None),
+    "argparse": ("argparse.ArgumentParser", None),
+    "logging": ("logging.Logger", "logging.getLogger"),
+    "dataclasses": ("dataclasses.Field", "dataclasses.dataclass"),
+    "decimal": ("decimal.Decimal", "decimal.localcontext"),
+    "email.message": ("email.message.EmailMessage", None),
+    "http.client": ("http.client.HTTPConnection", None),
+    "xml.etree.ElementTree": (
+        "xml.etree.ElementTree.ElementTree",
+        "xml.etree.ElementTree.parse",
+    ),
+    "asyncio": ("asyncio.Queue", "asyncio.gather"),
+}
+
+# Large third-party packages added to the corpus when installed
+LARGE_PACKAGES = [
+    "numpy",
+    "pandas",
+    "scipy",
+    "sympy",
+    "matplotlib",
+    "sqlalchemy",
+    "django",
+    "pydantic",
+    "requests",
+    "boto3",
+    "torch",
+]
+
+
+def _best_time_ms(func: Callable[[], Any], iterations: int) -> float:
+    """Return the best per-call time in milliseconds over several runs."""
+    best = float("inf")
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        func()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / 1e6
+
+
+def benchmark_codec(targets: List[str], iterations: int = 20) -> List[Dict[str, Any]]:
+    """Compare the binary codec with pickle and JSON on real inspection results.
+
+    Args:
+        targets: Targets to inspect (e.g. 'email.message', 'asyncio')
+        iterations: Number of timed runs per operation (the best run is reported)
+
+    Returns:
+        One row per target and serializer with size and encode/decode times
+    """
+    from peek_tool.formatters.base import FormatterFactory
+
+    json_formatter = FormatterFactory.create_formatter("json")
+    rows = []
+
+    for target in targets:
+        result = InspectorFactory.inspect_result(target)
+
+        serializers = {
+            "peek-binary": (codec.encode_result, codec.decode_result),
+            "pickle": (
+                lambda r: pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL),
+                pickle.loads,
+            ),
+            # JSON decoding only yields dicts, so it is not a full round-trip
+            "json": (json_formatter.format, json.loads),
+        }
+
+        for name, (encode, decode) in serializers.items():
+            payload = encode(result)
+            rows.append(
+                {
+                    "target": target,
+                    "serializer": name,
+                    "size_bytes": len(payload),
+                    "encode_ms": round(_best_time_ms(lambda: encode(result), iterations), 3),
+                    "decode_ms": round(_best_time_ms(lambda: decode(payload), iterations), 3),
+                }
+            )
+
+    return rows
+
+
+def python_corpus(
+    modules: Optional[List[str]] = None, packages: bool = True
+) -> List[Dict[str, str]]:
+    """List the module, class, and function targets of the Python benchmark.
+
+    Args:
+        modules: Modules to benchmark instead of the stdlib corpus
+        packages: Add the installed LARGE_PACKAGES
+
+    Returns:
+        One entry per target, with its module and kind
+    """
+    if modules:
+        picks = {module: STDLIB_CORPUS.get(module) or _pick_members(module) for module in modules}
+    else:
+        picks = dict(STDLIB_CORPUS)
+        if packages:
+            for package in LARGE_PACKAGES:
+                if importlib.util.find_spec(package) is not None:
+                    picks[package] = _pick_members(package)
+
+    corpus = []
+    for module, (class_target, function_target) in picks.items():
+        corpus.append({"target": module, "module": module, "kind": "module"})
+        if class_target:
+            corpus.append({"target": class_target, "module": module, "kind": "class"})
+        if function_target:
+            corpus.append({"target": function_target, "module": module, "kind": "function"})
+    return corpus
+
+
+def benchmark_python(
+    corpus: List[Dict[str, str]],
+    iterations: int = 10,
+    import_runs: int = 3,
+    use_snapshot: bool = False,
+) -> Dict[str, Any]:
+    """Benchmark Python inspection over a corpus of targets.
+
+    Import time is measured separately, in fresh interpreters, so inspection
+    latency covers only introspection of already imported modules. Each
+    target is inspected once untimed, then timed ``iterations`` times, then
+    once more under tracemalloc to measure its allocations. The memoized
+    docstring parser is emptied before each timed and measured inspection, so
+    latencies and allocations include parsing; ``warm_p50_ms`` is the median latency with
+    the docstrings already parsed.
+
+    Args:
+        corpus: Targets from python_corpus()
+        iterations: Timed inspections per target
+        import_runs: Cold imports per module (the median is reported)
+        use_snapshot: Answer stdlib targets from the stdlib snapshot instead
+            of inspecting them live
+
+    Returns:
+        The environment, per-target latency percentiles and allocations, and
+        per-module import times (JSON-serializable)
+    """
+    modules = list(dict.fromkeys(entry["module"] for entry in corpus))
+    imports = [_cold_import(module, import_runs) for module in modules]
+
+    targets = []
+    with _snapshot_disabled(not use_snapshot):
+        for entry in corpus:
+            targets.append({**entry, **_time_inspection(entry["target"], iterations)})
+
+    return {
+        "version": PYTHON_RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "peek": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "settings": {
+            "iterations": iterations,
+            "import_runs": import_runs,
+            "snapshot": use_snapshot,
+        },
+        "imports": imports,
+        "targets": targets,
+    }
+
+
+def compare_python_results(
+    baseline: Dict[str, Any], current: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Compare two benchmark_python() results target by target.
+
+    Returns:
+        One row per target present in both, with the relative change of the
+        p50 and p95 latencies and of the peak allocation (positive is worse)
+
+    Raises:
+        ValueError: If the results were recorded in different formats
+    """
+    if baseline.get("version") != current.get("version"):
+        raise ValueError(
+            f"The baseline has results format {baseline.get('version')}, not "
+            f"{current.get('version')}; its latencies are not comparable"
+        )
+    previous = {row["target"]: row for row in baseline.get("targets", [])}
+    rows = []
+    for row in current["targets"]:
+        before = previous.get(row["target"])
+        if before is None:
+            continue
+        rows.append(
+            {
+                "target": row["target"],
+                "kind": row["kind"],
+                **{
+                    f"{field}_change": _relative_change(before.get(field), row.get(field))
+                    for field in ("p50_ms", "p95_ms", "peak_bytes")
+                },
+            }
+        )
+    return rows
+
+
+def _pick_members(module_name: str) -> Tuple[Optional[str], Optional[str]]:
+    """Pick the first public class and function defined in a module (by name)."""
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        return None, None
+
+    def first(predicate: Callable[[Any], bool]) -> Optional[str]:
+        for name in sorted(vars(module)):
+            value = vars(module)[name]
+            if (
+                not name.startswith("_")
+                and predicate(value)
+                and getattr(value, "__module__", None) == module_name
+            ):
+                return f"{module_name}.{name}"
+        return None
+
+    return first(inspect.isclass), first(inspect.isfunction)
+
+
+def _time_inspection(target: str, iterations: int) -> Dict[str, Any]:
+    """Latency percentiles and allocations of inspecting one target."""
+    try:
+        # Imports the module, so the timed runs measure introspection only
+        InspectorFactory.inspect_result(target, "python")
+    except Exception as e:
+        return {"error": str(e)}
+
+    samples = []
+    warm_samples = []
+    for _ in range(iterations):
+        DocstringParser.cache_clear()
+        start = time.perf_counter_ns()
+        InspectorFactory.inspect_result(target, "python")
+        samples.append((time.perf_counter_ns() - start) / 1e6)
+
+        start = time.perf_counter_ns()
+        InspectorFactory.inspect_result(target, "python")
+        warm_samples.append((time.perf_counter_ns() - start) / 1e6)
+
+    DocstringParser.cache_clear()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = InspectorFactory.inspect_result(target, "python")
+    current, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+    del result
+
+    return {
+        "p50_ms": round(_percentile(samples, 50), 3),
+        "p95_ms": round(_percentile(samples, 95), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "warm_p50_ms": round(_percentile(warm_samples, 50), 3),
+        "peak_bytes": peak - before,
+        "result_bytes": current - before,
+    }
+
+
+def _cold_import(module: str, runs: int) -> Dict[str, Any]:
+    """Time importing a module in fresh interpreters."""
+    code = (
+        "import importlib, time\n"
+        "start = time.perf_counter_ns()\n"
+        f"importlib.import_module({module!r})\n"
+        "print(time.perf_counter_ns() - start)\n"
+    )
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=300
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1:] or ["import failed"]
+            return {"module": module, "error": error[0]}
+        samples.append(int(completed.stdout.strip()) / 1e6)
+    return {
+        "module": module,
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+    }
+
+
+@contextmanager
+def _snapshot_disabled(disabled: bool) -> Iterator[None]:
+    """Make stdlib targets be inspected live instead of read from the snapshot."""
+    previous = os.environ.get("PEEK_NO_SNAPSHOT")
+    if disabled:
+        os.environ["PEEK_NO_SNAPSHOT"] = "1"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("PEEK_NO_SNAPSHOT", None)
+        else:
+            os.environ["PEEK_NO_SNAPSHOT"] = previous
+
+
+def _percentile(samples: List[float], percent: int) -> float:
+    """Percentile of the samples, interpolated between the closest ranks."""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * percent / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _relative_change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return round((after - before) / before, 4)
@@ -0,0 +1,32 @@
+"""On-disk cache location for peek-tool.
+
+Indexes and snapshots that are expensive to rebuild are persisted under a
+per-user cache directory so repeated CLI invocations can reuse them.
+"""
+
+import os
+from pathlib import Path
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """Return (and create) a directory inside the peek-tool cache.
+
+    The cache root is ``$PEEK_CACHE_DIR`` if set, otherwise
+    ``$XDG_CACHE_HOME/peek-tool`` (defaulting to ``~/.cache/peek-tool``).
+
+    Args:
+        parts: Optional sub-directory names below the cache root
+
+    Returns:
+        The cache directory path
+    """
+    root = os.environ.get("PEEK_CACHE_DIR")
+    if root:
+        path = Path(root)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        path = (Path(xdg) if xdg else Path.home() / ".cache") / "peek-tool"
+
+    path = path.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
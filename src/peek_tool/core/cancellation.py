@@ -0,0 +1,97 @@
+"""Cooperative cancellation and progress reporting for long operations.
+
+A caller that may abandon an operation (e.g. an MCP client cancelling a
+request) runs it with a ``CancellationToken``. Long loops call
+``checkpoint()`` between units of work (modules, classes, chunks of a JSON
+file): once the token is cancelled the next checkpoint raises
+``OperationCancelled``, and while it is not, progress is passed on to the
+token's callback.
+
+Without a token, a checkpoint is a single context variable lookup.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Called with (progress, total); total is None when unknown
+ProgressCallback = Callable[[float, Optional[float]], None]
+
+# Minimum seconds between two progress callbacks
+PROGRESS_INTERVAL = 0.25
+
+_current: ContextVar[Optional["CancellationToken"]] = ContextVar(
+    "peek_cancellation_token", default=None
+)
+
+
+class OperationCancelled(Exception):
+    """Raised at a checkpoint when the running operation has been cancelled."""
+
+
+class CancellationToken:
+    """Cancellation flag and progress sink for one operation."""
+
+    def __init__(self, on_progress: Optional[ProgressCallback] = None):
+        """Create a token.
+
+        Args:
+            on_progress: Receives progress from checkpoints, at most every
+                PROGRESS_INTERVAL seconds and only when it has increased (so
+                quick operations report nothing)
+        """
+        self._cancelled = threading.Event()
+        self._on_progress = on_progress
+        self._last_report = time.monotonic()
+        self._reported = -1.0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the operation has been cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Ask the operation to stop at its next checkpoint (thread-safe)."""
+        self._cancelled.set()
+
+    def run(self, work: Callable[[], T]) -> T:
+        """Run work with this token as the current one (checked by checkpoint())."""
+        reset = _current.set(self)
+        try:
+            return work()
+        finally:
+            _current.reset(reset)
+
+    def checkpoint(self, progress: Optional[float] = None, total: Optional[float] = None) -> None:
+        """Stop if cancelled, otherwise report progress if it is time to.
+
+        Raises:
+            OperationCancelled: If the token has been cancelled
+        """
+        if self._cancelled.is_set():
+            raise OperationCancelled("The operation was cancelled")
+        if progress is None or self._on_progress is None or progress <= self._reported:
+            return
+        now = time.monotonic()
+        if now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            self._reported = progress
+            self._on_progress(progress, total)
+
+
+def checkpoint(progress: Optional[float] = None, total: Optional[float] = None) -> None:
+    """Check the current operation's token, if any (see CancellationToken.checkpoint).
+
+    Args:
+        progress: Units of work done so far
+        total: Total units of work, if known
+
+    Raises:
+        OperationCancelled: If the current operation has been cancelled
+    """
+    token = _current.get()
+    if token is not None:
+        token.checkpoint(progress, total)
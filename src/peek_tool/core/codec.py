@@ -0,0 +1,322 @@
+"""Compact binary encoding of inspection results.
+
+Inspection results are trees of small dataclasses that repeat the same
+names, type strings, and module names many times. This codec stores every
+distinct string once in a string table and encodes the tree structure with
+varints, which makes it considerably smaller than pickle or JSON for large
+modules. It is shared by the on-disk caches and the worker processes.
+
+Layout::
+
+    magic "PKB" | version | string table | type table | root value
+
+The type table records the field names of each model type used in the
+payload, so payloads stay decodable when models gain or lose fields.
+"""
+
+import struct
+from typing import Any, Dict, List, Tuple, Type
+
+from peek_tool.models.docstring import DocstringItem, DocstringSection, ParsedDocstring
+from peek_tool.models.inspection_result import InspectionResult
+from peek_tool.models.json_element import JsonElement, JsonRootElement
+from peek_tool.models.python_element import Class, Method, Module, Parameter
+
+MAGIC = b"PKB"
+VERSION = 1
+
+# Value tags
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_LIST = 6
+_DICT = 7
+_MODEL = 8
+_BYTES = 9
+_EMPTY_LIST = 10
+_EMPTY_DICT = 11
+_EMPTY_STR = 12
+
+_DOUBLE = struct.Struct("<d")
+
+# Model classes that can be encoded, looked up by class name when decoding
+_MODELS: Dict[str, Type] = {}
+
+# Cached field names per model class, in declaration order
+_MODEL_FIELDS: Dict[Type, Tuple[str, ...]] = {}
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be decoded."""
+
+
+def register_model(model_class: Type) -> Type:
+    """Register a dataclass so instances of it can be encoded."""
+    from dataclasses import fields
+
+    _MODELS[model_class.__name__] = model_class
+    _MODEL_FIELDS[model_class] = tuple(f.name for f in fields(model_class))
+    return model_class
+
+
+for _model in (
+    InspectionResult,
+    Module,
+    Class,
+    Method,
+    Parameter,
+    JsonRootElement,
+    JsonElement,
+    ParsedDocstring,
+    DocstringSection,
+    DocstringItem,
+):
+    register_model(_model)
+
+
+def encode(value: Any) -> bytes:
+    """Encode a model tree (or any nesting of primitives, lists, and dicts).
+
+    Args:
+        value: The value to encode, typically an InspectionResult
+
+    Returns:
+        The encoded payload
+    """
+    strings: Dict[str, int] = {}
+    types: Dict[Type, int] = {}
+    body = bytearray()
+    append = body.append
+    extend = body.extend
+    model_fields = _MODEL_FIELDS
+
+    def write_varint(n: int) -> None:
+        while n > 0x7F:
+            append((n & 0x7F) | 0x80)
+            n >>= 7
+        append(n)
+
+    def write(v: Any) -> None:
+        cls = type(v)
+        if cls is str:
+            if not v:
+                append(_EMPTY_STR)
+                return
+            index = strings.get(v)
+            if index is None:
+                index = strings[v] = len(strings)
+            append(_STR)
+            write_varint(index)
+        elif v is None:
+            append(_NONE)
+        elif cls is bool:
+            append(_TRUE if v else _FALSE)
+        elif cls in model_fields:
+            type_index = types.get(cls)
+            if type_index is None:
+                type_index = types[cls] = len(types)
+            append(_MODEL)
+            write_varint(type_index)
+            for name in model_fields[cls]:
+                write(getattr(v, name))
+        elif cls is list or cls is tuple:
+            if not v:
+                append(_EMPTY_LIST)
+                return
+            append(_LIST)
+            write_varint(len(v))
+            for item in v:
+                write(item)
+        elif cls is dict:
+            if not v:
+                append(_EMPTY_DICT)
+                return
+            append(_DICT)
+            write_varint(len(v))
+            for key, item in v.items():
+                write(key)
+                write(item)
+        elif isinstance(v, int):
+            append(_INT)
+            write_varint((v << 1) if v >= 0 else ((-v << 1) - 1))
+        elif isinstance(v, float):
+            append(_FLOAT)
+            extend(_DOUBLE.pack(v))
+        elif isinstance(v, (bytes, bytearray)):
+            append(_BYTES)
+            write_varint(len(v))
+            extend(v)
+        elif isinstance(v, str):
+            write(str(v))
+        elif isinstance(v, (list, tuple, set, frozenset)):
+            write(list(v))
+        elif isinstance(v, dict):
+            write(dict(v))
+        else:
+            write(str(v))
+
+    write(value)
+
+    # Type table strings must be in the string table before it is written
+    for cls in types:
+        for name in (cls.__name__, *model_fields[cls]):
+            if name not in strings:
+                strings[name] = len(strings)
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    append_out = out.append
+
+    def write_out_varint(n: int) -> None:
+        while n > 0x7F:
+            append_out((n & 0x7F) | 0x80)
+            n >>= 7
+        append_out(n)
+
+    write_out_varint(len(strings))
+    for s in strings:  # dicts preserve insertion order, which matches the indexes
+        encoded = s.encode("utf-8", "surrogatepass")
+        write_out_varint(len(encoded))
+        out.extend(encoded)
+
+    write_out_varint(len(types))
+    for cls in types:
+        names = model_fields[cls]
+        write_out_varint(strings[cls.__name__])
+        write_out_varint(len(names))
+        for name in names:
+            write_out_varint(strings[name])
+
+    out.extend(body)
+    return bytes(out)
+
+
+def decode(data: bytes) -> Any:
+    """Decode a payload produced by encode().
+
+    Args:
+        data: The encoded payload
+
+    Returns:
+        The decoded value with models reconstructed
+
+    Raises:
+        CodecError: If the payload is malformed or from an unknown version
+    """
+    if data[:3] != MAGIC:
+        raise CodecError("Not a peek binary payload")
+    if data[3] != VERSION:
+        raise CodecError(f"Unsupported payload version {data[3]}")
+
+    buf = bytes(data)
+    pos = 4
+
+    def read_varint() -> int:
+        nonlocal pos
+        byte = buf[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = buf[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    try:
+        strings: List[str] = []
+        for _ in range(read_varint()):
+            length = read_varint()
+            strings.append(buf[pos : pos + length].decode("utf-8", "surrogatepass"))
+            pos += length
+
+        # Each entry: (model class or None if unknown, field names, positional)
+        types: List[Tuple[Any, Tuple[Any, ...], bool]] = []
+        for _ in range(read_varint()):
+            model_class = _MODELS.get(strings[read_varint()])
+            names = tuple(strings[read_varint()] for _ in range(read_varint()))
+            positional = False
+            if model_class is not None:
+                known = _MODEL_FIELDS[model_class]
+                # Payloads written by the same model version decode positionally
+                positional = names == known
+                names = tuple(name if name in known else None for name in names)
+            types.append((model_class, names, positional))
+
+        def read() -> Any:
+            nonlocal pos
+            tag = buf[pos]
+            pos += 1
+            if tag == _STR:
+                return strings[read_varint()]
+            if tag == _MODEL:
+                model_class, names, positional = types[read_varint()]
+                if positional:
+                    return model_class(*[read() for _ in names])
+                kwargs = {}
+                for name in names:
+                    value = read()
+                    if name is not None:
+                        kwargs[name] = value
+                return model_class(**kwargs) if model_class is not None else kwargs
+            if tag == _NONE:
+                return None
+            if tag == _EMPTY_STR:
+                return ""
+            if tag == _EMPTY_LIST:
+                return []
+            if tag == _EMPTY_DICT:
+                return {}
+            if tag == _LIST:
+                return [read() for _ in range(read_varint())]
+            if tag == _DICT:
+                result = {}
+                for _ in range(read_varint()):
+                    key = read()
+                    result[key] = read()
+                return result
+            if tag == _FALSE:
+                return False
+            if tag == _TRUE:
+                return True
+            if tag == _INT:
+                n = read_varint()
+                return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+            if tag == _FLOAT:
+                (value,) = _DOUBLE.unpack_from(buf, pos)
+                pos += 8
+                return value
+            if tag == _BYTES:
+                length = read_varint()
+                value = buf[pos : pos + length]
+                pos += length
+                return value
+            raise CodecError(f"Unknown value tag {tag} at offset {pos - 1}")
+
+        return read()
+    except (IndexError, TypeError, UnicodeDecodeError, struct.error) as e:
+        raise CodecError(f"Malformed payload: {e}")
+
+
+def encode_result(result: InspectionResult) -> bytes:
+    """Encode an inspection result."""
+    return encode(result)
+
+
+def decode_result(data: bytes) -> InspectionResult:
+    """Decode an inspection result.
+
+    Raises:
+        CodecError: If the payload is malformed or does not hold an InspectionResult
+    """
+    result = decode(data)
+    if not isinstance(result, InspectionResult):
+        raise CodecError("Payload does not contain an InspectionResult")
+    return result
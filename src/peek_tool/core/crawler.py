@@ -0,0 +1,178 @@
+"""Recursive package crawling.
+
+Submodules are discovered statically (without importing them) and then
+inspected concurrently in a process pool. Each worker process imports the
+modules it inspects, so import side effects stay out of the calling process,
+and results are streamed back as soon as each submodule is done.
+"""
+
+import importlib.util
+import os
+import pkgutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from peek_tool.core.cancellation import OperationCancelled, checkpoint
+from peek_tool.core.codec import decode_result, encode_result
+from peek_tool.core.process_pool import pool_context
+from peek_tool.models.inspection_filters import InspectionFilters
+from peek_tool.models.inspection_result import InspectionResult
+
+
+@dataclass
+class CrawlResult:
+    """The outcome of inspecting one module during a crawl."""
+
+    module_name: str
+    result: Optional[InspectionResult] = None
+    error: Optional[str] = None
+
+
+class PackageCrawler:
+    """Inspect a package and its submodules in parallel."""
+
+    def __init__(
+        self,
+        depth: Optional[int] = None,
+        include: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        workers: Optional[int] = None,
+        filters: Optional[InspectionFilters] = None,
+    ):
+        """Create a crawler.
+
+        Args:
+            depth: Maximum submodule depth below the root (None for unlimited)
+            include: Glob patterns; if given, only matching modules are inspected
+            exclude: Glob patterns; matching modules (and packages' contents) are skipped
+            workers: Number of worker processes (defaults to the CPU count)
+            filters: Which members of each module to inspect (all if None)
+        """
+        self.depth = depth
+        self.include = list(include)
+        self.exclude = list(exclude)
+        self.workers = workers or os.cpu_count() or 1
+        self.filters = filters
+
+    def discover(self, package: str) -> List[str]:
+        """List the modules to inspect, without importing any submodule.
+
+        Args:
+            package: The root package or module name
+
+        Returns:
+            Module names in breadth-first order, starting with the root
+
+        Raises:
+            ValueError: If the package cannot be found
+        """
+        try:
+            spec = importlib.util.find_spec(package)
+        except (ImportError, ValueError) as e:
+            raise ValueError(f"Could not find package {package}: {e}")
+        if spec is None:
+            raise ValueError(f"Could not find package {package}")
+
+        modules = [package] if self._is_included(package) else []
+        pending: List[Tuple[str, List[str], int]] = []
+        if spec.submodule_search_locations:
+            pending.append((package, list(spec.submodule_search_locations), 1))
+
+        while pending:
+            prefix, paths, level = pending.pop(0)
+            if self.depth is not None and level > self.depth:
+                continue
+
+            for info in sorted(pkgutil.iter_modules(paths), key=lambda i: i.name):
+                name = f"{prefix}.{info.name}"
+                # Running a __main__ module would start the package's CLI
+                if info.name == "__main__" or self._is_excluded(name):
+                    continue
+                if self._is_included(name):
+                    modules.append(name)
+                finder_path = getattr(info.module_finder, "path", None)
+                if info.ispkg and finder_path:
+                    sub_path = os.path.join(finder_path, info.name)
+                    pending.append((name, [sub_path], level + 1))
+
+        return modules
+
+    def crawl(self, package: str) -> Iterator[CrawlResult]:
+        """Inspect a package and its submodules, yielding results as they complete.
+
+        Discovery runs eagerly, so an unknown package raises immediately.
+
+        Args:
+            package: The root package or module name
+
+        Returns:
+            An iterator of CrawlResult, one per module, in completion order
+        """
+        return self.inspect_modules(self.discover(package))
+
+    def inspect_modules(self, modules: Sequence[str]) -> Iterator[CrawlResult]:
+        """Inspect a list of modules in the worker pool.
+
+        Args:
+            modules: Fully qualified module names
+
+        Yields:
+            One CrawlResult per module, in completion order
+        """
+        if not modules:
+            return
+
+        workers = min(self.workers, len(modules))
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=pool_context()
+        ) as executor:
+            futures = {
+                executor.submit(_inspect_in_worker, name, self.filters): name
+                for name in modules
+            }
+            for done, future in enumerate(as_completed(futures)):
+                try:
+                    checkpoint(done, len(futures))
+                except OperationCancelled:
+                    # Modules already being inspected finish; queued ones never start
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                name = futures[future]
+                try:
+                    payload, error = future.result()
+                except Exception as e:  # Worker crashed (e.g. segfault on import)
+                    yield CrawlResult(module_name=name, error=str(e) or type(e).__name__)
+                    continue
+
+                if error is not None:
+                    yield CrawlResult(module_name=name, error=error)
+                else:
+                    yield CrawlResult(module_name=name, result=decode_result(payload))
+
+    def _is_included(self, name: str) -> bool:
+        """Check a module name against the include patterns."""
+        return not self.include or any(fnmatchcase(name, p) for p in self.include)
+
+    def _is_excluded(self, name: str) -> bool:
+        """Check a module name against the exclude patterns."""
+        return any(fnmatchcase(name, p) for p in self.exclude)
+
+
+def _inspect_in_worker(
+    module_name: str, filters: Optional[InspectionFilters] = None
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Inspect a module inside a worker process.
+
+    Returns:
+        The encoded InspectionResult and None, or None and an error message
+    """
+    from peek_tool.core.python_inspector import PythonInspector
+
+    try:
+        module = importlib.import_module(module_name)
+        result = PythonInspector(filters)._inspect_module(module)
+        return encode_result(result), None
+    except BaseException as e:  # Imports can raise SystemExit and friends
+        return None, f"{type(e).__name__}: {e}"
@@ -0,0 +1,419 @@
+"""Structured docstring parsing.
+
+This module parses Google, NumPy, and reStructuredText style docstrings into
+ParsedDocstring models. Parsing is memoized on the docstring text, so each
+distinct docstring is only parsed once per process no matter how many objects
+share it or how many times it is rendered.
+"""
+
+import inspect
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from peek_tool.models.docstring import DocstringItem, DocstringSection, ParsedDocstring
+
+# Maps lower-cased section headers to section kinds
+SECTION_KINDS: Dict[str, str] = {
+    "args": "params",
+    "arguments": "params",
+    "parameters": "params",
+    "params": "params",
+    "keyword args": "params",
+    "keyword arguments": "params",
+    "other parameters": "params",
+    "returns": "returns",
+    "return": "returns",
+    "yields": "yields",
+    "yield": "yields",
+    "raises": "raises",
+    "raise": "raises",
+    "exceptions": "raises",
+    "example": "examples",
+    "examples": "examples",
+    "note": "notes",
+    "notes": "notes",
+    "warning": "warnings",
+    "warnings": "warnings",
+    "attributes": "attributes",
+    "see also": "see_also",
+    "references": "references",
+    "todo": "todo",
+}
+
+# Section kinds whose bodies are lists of named entries
+ITEM_KINDS = {"params", "raises", "attributes"}
+
+# NumPy sections whose entries are "type" rather than "name" when no colon is present
+TYPE_FIRST_KINDS = {"returns", "yields", "raises"}
+
+_GOOGLE_HEADER_RE = re.compile(r"^([A-Za-z][A-Za-z ]*?):(?:\s+(.*))?$")
+_GOOGLE_ITEM_RE = re.compile(r"^(\*{0,2}[\w.]+)\s*(?:\(([^)]*)\))?\s*:(?:\s+(.*))?$")
+_NUMPY_UNDERLINE_RE = re.compile(r"^\s*-{3,}\s*$")
+_REST_FIELD_RE = re.compile(r"^:([A-Za-z]+)(?:\s+([^:]*?))?:(?:\s+(.*))?$")
+_REST_DETECT_RE = re.compile(
+    r"^\s*:(param|parameter|arg|argument|key|keyword|type|returns?|rtype|"
+    r"raises?|except|exception|yields?|ytype)\b",
+    re.MULTILINE,
+)
+
+_REST_KINDS = {
+    "param": "params",
+    "parameter": "params",
+    "arg": "params",
+    "argument": "params",
+    "key": "params",
+    "keyword": "params",
+    "returns": "returns",
+    "return": "returns",
+    "yields": "yields",
+    "yield": "yields",
+    "raises": "raises",
+    "raise": "raises",
+    "except": "raises",
+    "exception": "raises",
+}
+
+_REST_TITLES = {
+    "params": "Parameters",
+    "returns": "Returns",
+    "yields": "Yields",
+    "raises": "Raises",
+}
+
+
+class DocstringParser:
+    """Parser for Google, NumPy, and reST style docstrings."""
+
+    @classmethod
+    def parse(cls, docstring: Optional[str]) -> ParsedDocstring:
+        """Parse a docstring into structured sections.
+
+        Args:
+            docstring: The raw docstring (may be None or empty)
+
+        Returns:
+            A ParsedDocstring. Results are cached by docstring text, so the
+            returned object is shared and must not be mutated.
+        """
+        if not docstring:
+            return _EMPTY
+        return _parse_cached(docstring)
+
+    @classmethod
+    def cache_info(cls):
+        """Return cache statistics for the memoized parser."""
+        return _parse_cached.cache_info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Empty the memoized parser (e.g. so a benchmark times parsing)."""
+        _parse_cached.cache_clear()
+
+
+_EMPTY = ParsedDocstring()
+
+
+@lru_cache(maxsize=8192)
+def _parse_cached(docstring: str) -> ParsedDocstring:
+    """Parse a non-empty docstring (memoized)."""
+    lines = inspect.cleandoc(docstring.replace("\r\n", "\n")).split("\n")
+
+    if _REST_DETECT_RE.search(docstring):
+        return _parse_rest(lines)
+    if _is_numpy(lines):
+        return _parse_numpy(lines)
+    return _parse_google(lines)
+
+
+def _is_numpy(lines: List[str]) -> bool:
+    """Check whether any known header is followed by a dashed underline."""
+    for i in range(len(lines) - 1):
+        if (
+            lines[i].strip().lower() in SECTION_KINDS
+            and _NUMPY_UNDERLINE_RE.match(lines[i + 1])
+        ):
+            return True
+    return False
+
+
+def _split_summary(lines: List[str]) -> Tuple[str, str]:
+    """Split leading free text into a summary paragraph and the remaining description."""
+    text = "\n".join(lines).strip("\n")
+    if not text:
+        return "", ""
+    summary, _, description = text.partition("\n\n")
+    return summary.strip(), description.strip("\n")
+
+
+def _dedent(lines: List[str]) -> List[str]:
+    """Remove the common leading indentation from a block of lines."""
+    indents = [len(line) - len(line.lstrip()) for line in lines if line.strip()]
+    if not indents:
+        return []
+    common = min(indents)
+    result = [line[common:] if line.strip() else "" for line in lines]
+
+    # Trim leading and trailing blank lines
+    while result and not result[0]:
+        result.pop(0)
+    while result and not result[-1]:
+        result.pop()
+    return result
+
+
+def _is_fence(stripped: str) -> bool:
+    """Check whether a line opens or closes a fenced code block."""
+    return stripped.startswith("```") or stripped.startswith(":::")
+
+
+def _build_section(kind: str, title: str, body: List[str], numpy: bool) -> DocstringSection:
+    """Create a section from its body lines, parsing entries where applicable."""
+    body = _dedent(body)
+    section = DocstringSection(kind=kind, title=title, text="\n".join(body))
+
+    if numpy and (kind in ITEM_KINDS or kind in TYPE_FIRST_KINDS):
+        section.items = _parse_numpy_items(kind, body)
+    elif kind in ITEM_KINDS:
+        section.items = _parse_google_items(body)
+    return section
+
+
+def _parse_google_items(body: List[str]) -> List[DocstringItem]:
+    """Parse Google style 'name (type): description' entries.
+
+    Returns an empty list if the body does not follow the entry layout, in
+    which case callers fall back to the section text.
+    """
+    items: List[DocstringItem] = []
+    description: List[str] = []
+
+    def flush() -> None:
+        if items:
+            items[-1].description = "\n".join(description).strip()
+
+    for line in body:
+        if not line.strip():
+            description.append("")
+            continue
+        indent = len(line) - len(line.lstrip())
+        match = _GOOGLE_ITEM_RE.match(line) if indent == 0 else None
+        if match:
+            flush()
+            name, type_annotation, first = match.groups()
+            items.append(DocstringItem(name=name, type_annotation=type_annotation))
+            description = [first.strip()] if first else []
+        elif items and indent > 0:
+            description.append(line.strip())
+        else:
+            # Not an entry list (e.g. a bullet list or free text)
+            return []
+    flush()
+    return items
+
+
+def _parse_numpy_items(kind: str, body: List[str]) -> List[DocstringItem]:
+    """Parse NumPy style 'name : type' entries with indented descriptions."""
+    items: List[DocstringItem] = []
+    description: List[str] = []
+
+    def flush() -> None:
+        if items:
+            items[-1].description = "\n".join(_dedent(description)).strip()
+
+    for line in body:
+        if line.strip() and not line[0].isspace():
+            flush()
+            description = []
+            head = line.strip()
+            if " : " in head or head.endswith(" :"):
+                name, _, type_annotation = head.partition(":")
+                items.append(
+                    DocstringItem(
+                        name=name.strip(),
+                        type_annotation=type_annotation.strip() or None,
+                    )
+                )
+            elif kind in TYPE_FIRST_KINDS:
+                items.append(DocstringItem(type_annotation=head))
+            else:
+                items.append(DocstringItem(name=head))
+        elif items:
+            description.append(line)
+        elif line.strip():
+            # Indented text before any entry, so this is not an entry list
+            return []
+    flush()
+    return items
+
+
+def _parse_google(lines: List[str]) -> ParsedDocstring:
+    """Parse a Google style (or plain) docstring."""
+    parsed = ParsedDocstring(style="plain")
+    preamble: List[str] = []
+    current: Optional[Tuple[str, str]] = None
+    body: List[str] = []
+    in_code_block = False
+
+    def close() -> None:
+        if current is not None:
+            kind, title = current
+            parsed.sections.append(_build_section(kind, title, body, numpy=False))
+
+    for line in lines:
+        stripped = line.strip()
+
+        if _is_fence(stripped):
+            in_code_block = not in_code_block
+        elif not in_code_block and line and not line[0].isspace():
+            match = _GOOGLE_HEADER_RE.match(stripped)
+            kind = SECTION_KINDS.get(match.group(1).lower()) if match else None
+            if kind:
+                close()
+                parsed.style = "google"
+                current = (kind, match.group(1))
+                body = [f"    {match.group(2)}"] if match.group(2) else []
+                continue
+            if current is not None:
+                # Unindented text ends the current section
+                close()
+                current = ("text", "")
+                body = []
+
+        if current is None:
+            preamble.append(line)
+        else:
+            body.append(line)
+
+    close()
+    parsed.summary, parsed.description = _split_summary(preamble)
+    parsed.sections = [s for s in parsed.sections if s.text or s.kind != "text"]
+    return parsed
+
+
+def _parse_numpy(lines: List[str]) -> ParsedDocstring:
+    """Parse a NumPy style docstring."""
+    parsed = ParsedDocstring(style="numpy")
+    preamble: List[str] = []
+    current: Optional[Tuple[str, str]] = None
+    body: List[str] = []
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        is_header = (
+            i + 1 < len(lines)
+            and line.strip()
+            and _NUMPY_UNDERLINE_RE.match(lines[i + 1])
+        )
+        if is_header:
+            if current is not None:
+                parsed.sections.append(_build_section(*current, body, numpy=True))
+            title = line.strip()
+            current = (SECTION_KINDS.get(title.lower(), "text"), title)
+            body = []
+            i += 2
+            continue
+
+        if current is None:
+            preamble.append(line)
+        else:
+            body.append(line)
+        i += 1
+
+    if current is not None:
+        parsed.sections.append(_build_section(*current, body, numpy=True))
+
+    parsed.summary, parsed.description = _split_summary(preamble)
+    return parsed
+
+
+def _parse_rest(lines: List[str]) -> ParsedDocstring:
+    """Parse a reStructuredText (Sphinx field list) docstring."""
+    parsed = ParsedDocstring(style="rest")
+    preamble: List[str] = []
+    sections: Dict[str, DocstringSection] = {}
+    types: Dict[str, str] = {}
+    trailing: List[str] = []
+    current: Optional[DocstringItem] = None
+    seen_field = False
+
+    def section_for(kind: str) -> DocstringSection:
+        if kind not in sections:
+            sections[kind] = DocstringSection(kind=kind, title=_REST_TITLES[kind])
+            parsed.sections.append(sections[kind])
+        return sections[kind]
+
+    for line in lines:
+        match = _REST_FIELD_RE.match(line)
+        if match:
+            seen_field = True
+            field_name, argument, text = match.groups()
+            field_name = field_name.lower()
+            argument = (argument or "").strip()
+            text = (text or "").strip()
+            current = None
+
+            if field_name in ("type", "rtype", "ytype"):
+                key = argument if field_name == "type" else f":{field_name}"
+                types[key] = text
+                continue
+
+            kind = _REST_KINDS.get(field_name)
+            if kind is None:
+                continue
+
+            item = DocstringItem(description=text)
+            if kind == "params":
+                # ":param int name:" carries an inline type
+                words = argument.split()
+                item.name = words[-1] if words else ""
+                if len(words) > 1:
+                    item.type_annotation = " ".join(words[:-1])
+            elif kind == "raises":
+                item.name = argument
+            section_for(kind).items.append(item)
+            current = item
+        elif current is not None and line[:1].isspace():
+            current.description = f"{current.description}\n{line.strip()}".strip()
+        elif seen_field:
+            current = None
+            trailing.append(line)
+        else:
+            preamble.append(line)
+
+    # Apply ":type:" and ":rtype:" fields collected separately
+    for kind, section in sections.items():
+        for item in section.items:
+            if kind == "params" and item.name in types and not item.type_annotation:
+                item.type_annotation = types[item.name]
+            elif kind == "returns" and ":rtype" in types:
+                item.type_annotation = types[":rtype"]
+            elif kind == "yields" and ":ytype" in types:
+                item.type_annotation = types[":ytype"]
+    if ":rtype" in types and "returns" not in sections:
+        section_for("returns").items.append(
+            DocstringItem(type_annotation=types[":rtype"])
+        )
+
+    for section in parsed.sections:
+        section.text = "\n".join(_format_rest_item(item) for item in section.items)
+
+    trailing_text = "\n".join(_dedent(trailing))
+    if trailing_text:
+        parsed.sections.append(
+            DocstringSection(kind="text", title="", text=trailing_text)
+        )
+
+    parsed.summary, parsed.description = _split_summary(preamble)
+    return parsed
+
+
+def _format_rest_item(item: DocstringItem) -> str:
+    """Render a reST field entry as plain text for the section body."""
+    head = item.name
+    if item.type_annotation:
+        head = f"{head} ({item.type_annotation})" if head else item.type_annotation
+    if head and item.description:
+        return f"{head}: {item.description}"
+    return head or item.description
@@ -0,0 +1,453 @@
+"""Full-text search over the docstrings of a package.
+
+Docstrings are extracted statically with ``ast`` wherever source files are
+available (falling back to importing modules that only exist as extensions),
+using a process pool for large packages. The extracted index is cached per
+package fingerprint, in memory and on disk, so repeated queries are answered
+without re-reading any source files.
+"""
+
+import ast
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import math
+import os
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from peek_tool.core.cache import get_cache_dir
+from peek_tool.core.cancellation import OperationCancelled, checkpoint
+from peek_tool.core.process_pool import pool_context
+from peek_tool.models.search_result import DocstringEntry, DocstringSearchHit
+
+# Packages with fewer source files than this are scanned in-process
+PARALLEL_THRESHOLD = 32
+
+# Number of query results kept in memory
+MAX_CACHED_QUERIES = 256
+
+# Seconds an in-memory index is reused before its package is walked and
+# stat'ed again to check for changes
+INDEX_RECHECK_SECONDS = 5.0
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class _DocstringIndex:
+    """Docstrings of a package plus an inverted word index over them."""
+
+    fingerprint: str
+    entries: List[DocstringEntry]
+    postings: Dict[str, Dict[int, int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, fingerprint: str, entries: List[DocstringEntry]) -> "_DocstringIndex":
+        """Create an index, tokenizing every docstring once."""
+        index = cls(fingerprint=fingerprint, entries=entries)
+        for i, entry in enumerate(entries):
+            for word in _WORD_RE.findall(entry.docstring.lower()):
+                bucket = index.postings.setdefault(word, {})
+                bucket[i] = bucket.get(i, 0) + 1
+        return index
+
+
+class DocstringSearcher:
+    """Search docstrings across all modules of a package."""
+
+    _indexes: Dict[str, _DocstringIndex] = {}
+    _queries: "OrderedDict[Tuple, List[DocstringSearchHit]]" = OrderedDict()
+    # Package -> monotonic time its index was last checked against the files
+    _checked: Dict[str, float] = {}
+    # Guards _indexes, _checked and _queries; indexes are built outside it, so two
+    # threads may build the same index and the last one is kept
+    _lock = threading.Lock()
+
+    @classmethod
+    def search(
+        cls,
+        package: str,
+        query: str,
+        regex: bool = False,
+        limit: int = 20,
+    ) -> List[DocstringSearchHit]:
+        """Search the docstrings of a package.
+
+        Args:
+            package: Importable package or module name (e.g. 'json')
+            query: Words to look for, or a regular expression if regex is True
+            regex: Treat the query as a case-insensitive regular expression
+            limit: Maximum number of hits to return
+
+        Returns:
+            Hits ordered by descending score
+
+        Raises:
+            ValueError: If the package cannot be found or the regex is invalid
+        """
+        index = cls.get_index(package)
+
+        key = (package, index.fingerprint, query, regex, limit)
+        with cls._lock:
+            cached_hits = cls._queries.get(key)
+            if cached_hits is not None:
+                cls._queries.move_to_end(key)
+                return cached_hits
+
+        if regex:
+            try:
+                pattern = re.compile(query, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression {query!r}: {e}")
+            hits = cls._search_regex(index, pattern)
+        else:
+            hits = cls._search_tokens(index, query)
+
+        hits.sort(key=lambda hit: (-hit.score, hit.path))
+        hits = hits[:limit]
+
+        with cls._lock:
+            cls._queries[key] = hits
+            if len(cls._queries) > MAX_CACHED_QUERIES:
+                cls._queries.popitem(last=False)
+        return hits
+
+    @classmethod
+    def get_index(cls, package: str) -> _DocstringIndex:
+        """Return the docstring index for a package, building it if needed.
+
+        An index checked less than INDEX_RECHECK_SECONDS ago is returned as
+        is; otherwise the package's files are listed and stat'ed again, and
+        the index is rebuilt if any of them changed.
+        """
+        with cls._lock:
+            cached = cls._indexes.get(package)
+            checked = cls._checked.get(package, float("-inf"))
+        if cached is not None and time.monotonic() - checked < INDEX_RECHECK_SECONDS:
+            return cached
+
+        checked = time.monotonic()
+        sources, runtime_modules = _discover_modules(package)
+        fingerprint = _fingerprint(sources, runtime_modules)
+
+        if cached is not None and cached.fingerprint == fingerprint:
+            with cls._lock:
+                cls._checked[package] = checked
+            return cached
+
+        cache_file = get_cache_dir("docstrings") / f"{package}-{fingerprint[:16]}.pickle"
+        entries: Optional[List[DocstringEntry]] = None
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    entries = pickle.load(f)
+            except Exception:
+                entries = None
+
+        if entries is None:
+            entries = _extract_all(sources)
+            for module_name in runtime_modules:
+                entries.extend(_extract_runtime(module_name))
+            try:
+                with open(cache_file, "wb") as f:
+                    pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                pass
+
+        index = _DocstringIndex.build(fingerprint, entries)
+        with cls._lock:
+            cls._indexes[package] = index
+            cls._checked[package] = checked
+        return index
+
+    @classmethod
+    def _search_regex(
+        cls, index: _DocstringIndex, pattern: re.Pattern
+    ) -> List[DocstringSearchHit]:
+        """Score entries by the number of regex matches in docstring and name."""
+        hits = []
+        for entry in index.entries:
+            doc_matches = len(pattern.findall(entry.docstring))
+            name_matches = len(pattern.findall(entry.path.rsplit(".", 1)[-1]))
+            if not doc_matches and not name_matches:
+                continue
+            score = doc_matches + 3 * name_matches
+            snippet = _first_line(entry.docstring, lambda line: pattern.search(line))
+            hits.append(_make_hit(entry, score, snippet))
+        return hits
+
+    @classmethod
+    def _search_tokens(cls, index: _DocstringIndex, query: str) -> List[DocstringSearchHit]:
+        """Rank entries containing every query word (prefix match) with tf-idf."""
+        tokens = _WORD_RE.findall(query.lower())
+        if not tokens:
+            return []
+
+        total = max(len(index.entries), 1)
+        scores: Optional[Dict[int, float]] = None
+        for token in tokens:
+            token_scores: Dict[int, float] = {}
+            for word, postings in index.postings.items():
+                if not word.startswith(token):
+                    continue
+                idf = math.log(1 + total / len(postings))
+                for i, tf in postings.items():
+                    token_scores[i] = token_scores.get(i, 0.0) + (1 + math.log(tf)) * idf
+
+            # Names matching the token count even if the docstring does not mention it
+            for i, entry in enumerate(index.entries):
+                name = entry.path.rsplit(".", 1)[-1].lower()
+                if token in name:
+                    token_scores[i] = token_scores.get(i, 0.0) + 2.0
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    i: score + token_scores[i]
+                    for i, score in scores.items()
+                    if i in token_scores
+                }
+
+        hits = []
+        for i, score in (scores or {}).items():
+            entry = index.entries[i]
+            snippet = _first_line(
+                entry.docstring, lambda line: any(t in line.lower() for t in tokens)
+            )
+            hits.append(_make_hit(entry, round(score, 3), snippet))
+        return hits
+
+    @classmethod
+    def get_search_results(
+        cls,
+        package: str,
+        query: str,
+        regex: bool = False,
+        limit: int = 20,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Search docstrings and render the hits for display.
+
+        Args:
+            package: Importable package or module name
+            query: Words or regular expression to search for
+            regex: Treat the query as a regular expression
+            limit: Maximum number of hits to return
+
+        Returns:
+            A tuple containing:
+            - A formatted string listing the ranked hits
+            - A dictionary with metadata (package, query, hit count)
+        """
+        hits = cls.search(package, query, regex=regex, limit=limit)
+        with cls._lock:
+            index = cls._indexes[package]
+
+        metadata = {
+            "package": package,
+            "query": query,
+            "regex": regex,
+            "hits": len(hits),
+            "docstrings_scanned": len(index.entries),
+        }
+
+        header = f"Docstring search: {query!r} in {package}"
+        summary = f"{len(hits)} hit(s) in {len(index.entries)} docstrings"
+        lines = ["─" * len(header), header, "─" * len(header), ""]
+
+        if not hits:
+            lines.append("(No matches found)")
+        for rank, hit in enumerate(hits, 1):
+            lines.append(f"{rank:>3}. {hit.path} ({hit.kind})  score {hit.score:g}")
+            if hit.snippet:
+                lines.append(f"     {hit.snippet}")
+
+        lines.append("")
+        lines.append(summary)
+        return "\n".join(lines), metadata
+
+
+def _make_hit(entry: DocstringEntry, score: float, snippet: str) -> DocstringSearchHit:
+    """Create a search hit for an entry."""
+    return DocstringSearchHit(
+        path=entry.path,
+        kind=entry.kind,
+        score=score,
+        snippet=snippet,
+        line=entry.line,
+    )
+
+
+def _first_line(docstring: str, predicate) -> str:
+    """Return the first docstring line matching a predicate (or the first line)."""
+    lines = [line.strip() for line in docstring.split("\n") if line.strip()]
+    for line in lines:
+        if predicate(line):
+            return line[:120]
+    return lines[0][:120] if lines else ""
+
+
+def _discover_modules(package: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Find the modules of a package without importing its submodules.
+
+    Returns:
+        A tuple of (module name, source path) pairs for modules with Python
+        source, and names of modules that have no source and must be imported.
+    """
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError) as e:
+        raise ValueError(f"Could not find package {package}: {e}")
+    if spec is None:
+        raise ValueError(f"Could not find package {package}")
+
+    sources: List[Tuple[str, str]] = []
+    runtime_modules: List[str] = []
+
+    if spec.origin and spec.origin.endswith(".py"):
+        sources.append((package, spec.origin))
+    elif not spec.submodule_search_locations:
+        runtime_modules.append(package)
+
+    for location in spec.submodule_search_locations or []:
+        _walk_package_dir(package, location, sources, runtime_modules)
+
+    return sources, runtime_modules
+
+
+def _walk_package_dir(
+    prefix: str,
+    directory: str,
+    sources: List[Tuple[str, str]],
+    runtime_modules: List[str],
+) -> None:
+    """Recursively collect the modules below a package directory."""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir():
+            if name == "__pycache__" or name.startswith(".") or not name.isidentifier():
+                continue
+            _walk_package_dir(f"{prefix}.{name}", entry.path, sources, runtime_modules)
+        elif name.endswith(".py"):
+            stem = name[:-3]
+            if stem == "__init__":
+                continue  # Covered by the package spec origin or parent walk
+            if stem.isidentifier():
+                sources.append((f"{prefix}.{stem}", entry.path))
+        elif name.endswith((".so", ".pyd")):
+            stem = name.split(".", 1)[0]
+            if stem.isidentifier():
+                runtime_modules.append(f"{prefix}.{stem}")
+
+    init_file = os.path.join(directory, "__init__.py")
+    if os.path.exists(init_file) and (prefix, init_file) not in sources:
+        sources.append((prefix, init_file))
+
+
+def _fingerprint(sources: List[Tuple[str, str]], runtime_modules: List[str]) -> str:
+    """Compute a fingerprint from the names, sizes, and mtimes of all modules."""
+    digest = hashlib.sha1()
+    for module_name, path in sorted(sources):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{module_name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    for module_name in sorted(runtime_modules):
+        digest.update(f"{module_name}\n".encode())
+    return digest.hexdigest()
+
+
+def _extract_all(sources: List[Tuple[str, str]]) -> List[DocstringEntry]:
+    """Extract docstrings from source files, in parallel for large packages."""
+    results = []
+    if len(sources) < PARALLEL_THRESHOLD:
+        for done, source in enumerate(sources):
+            checkpoint(done, len(sources))
+            results.append(_extract_file(source))
+    else:
+        workers = min(os.cpu_count() or 1, len(sources))
+        chunksize = max(1, len(sources) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+            try:
+                for entries in executor.map(_extract_file, sources, chunksize=chunksize):
+                    checkpoint(len(results), len(sources))
+                    results.append(entries)
+            except OperationCancelled:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    return [entry for entries in results for entry in entries]
+
+
+def _extract_file(source: Tuple[str, str]) -> List[DocstringEntry]:
+    """Statically extract the docstrings of a module and its definitions."""
+    module_name, path = source
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    entries = []
+    docstring = ast.get_docstring(tree)
+    if docstring:
+        entries.append(DocstringEntry(module_name, "module", docstring, 1))
+
+    def visit(body, prefix: str) -> None:
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                kind = "class"
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                kind = "function"
+            else:
+                continue
+            path = f"{prefix}.{node.name}"
+            doc = ast.get_docstring(node)
+            if doc:
+                entries.append(DocstringEntry(path, kind, doc, node.lineno))
+            if kind == "class":
+                visit(node.body, path)
+
+    visit(tree.body, module_name)
+    return entries
+
+
+def _extract_runtime(module_name: str) -> List[DocstringEntry]:
+    """Extract docstrings by importing a module that has no Python source."""
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        return []
+
+    entries = []
+    doc = inspect.getdoc(module)
+    if doc:
+        entries.append(DocstringEntry(module_name, "module", doc))
+
+    for name, obj in inspect.getmembers(module):
+        if getattr(obj, "__module__", None) != module_name:
+            continue
+        if inspect.isclass(obj):
+            kind = "class"
+        elif inspect.isroutine(obj):
+            kind = "function"
+        else:
+            continue
+        doc = inspect.getdoc(obj)
+        if doc:
+            entries.append(DocstringEntry(f"{module_name}.{name}", kind, doc))
+    return entries
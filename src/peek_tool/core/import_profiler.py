@@ -0,0 +1,178 @@
+"""In-process import-time profiling, similar to ``python -X importtime``.
+
+While an ImportProfiler is active, a finder at the front of ``sys.meta_path``
+wraps the loader of every module imported by the current thread and times its
+execution. Nested imports become children, so the report can show both the
+cumulative time of a module and its self time. Modules that were already
+imported cost nothing and do not appear.
+"""
+
+import sys
+import threading
+import time
+from typing import List, Optional
+
+from peek_tool.models.import_profile import ImportTiming
+
+# Number of modules shown by default in a report
+DEFAULT_TOP = 15
+
+_state = threading.local()
+_install_lock = threading.Lock()
+_active_profilers = 0
+
+
+class _TimingFinder:
+    """Meta path finder that wraps the loaders found by the other finders."""
+
+    @classmethod
+    def find_spec(cls, name, path=None, target=None):
+        profiler = getattr(_state, "profiler", None)
+        if profiler is None or getattr(_state, "finding", False):
+            return None
+
+        _state.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is cls or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            _state.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, profiler)
+        return spec
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module and then restores the real loader."""
+
+    def __init__(self, loader, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Leave no trace of the proxy on the imported module
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        timing = self._profiler._enter(module.__name__)
+        start = time.perf_counter_ns()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(timing, time.perf_counter_ns() - start)
+
+
+class ImportProfiler:
+    """Context manager that records the imports made by the current thread.
+
+    Example:
+        with ImportProfiler() as profiler:
+            importlib.import_module("email.message")
+        print(profiler.render())
+    """
+
+    def __init__(self):
+        self.roots: List[ImportTiming] = []
+        self._stack: List[ImportTiming] = []
+        self._previous: Optional["ImportProfiler"] = None
+
+    def __enter__(self) -> "ImportProfiler":
+        global _active_profilers
+        with _install_lock:
+            if _active_profilers == 0:
+                sys.meta_path.insert(0, _TimingFinder)
+            _active_profilers += 1
+        self._previous = getattr(_state, "profiler", None)
+        _state.profiler = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _active_profilers
+        _state.profiler = self._previous
+        with _install_lock:
+            _active_profilers -= 1
+            if _active_profilers == 0 and _TimingFinder in sys.meta_path:
+                sys.meta_path.remove(_TimingFinder)
+
+    def _enter(self, module_name: str) -> ImportTiming:
+        timing = ImportTiming(module=module_name)
+        (self._stack[-1].children if self._stack else self.roots).append(timing)
+        self._stack.append(timing)
+        return timing
+
+    def _exit(self, timing: ImportTiming, elapsed_ns: int) -> None:
+        self._stack.pop()
+        timing.cumulative_us = elapsed_ns // 1000
+        timing.self_us = max(
+            timing.cumulative_us - sum(c.cumulative_us for c in timing.children), 0
+        )
+
+    @property
+    def total_us(self) -> int:
+        """Total time spent importing modules."""
+        return sum(root.cumulative_us for root in self.roots)
+
+    def all_timings(self) -> List[ImportTiming]:
+        """Return every recorded module, parents before children."""
+        timings = []
+        pending = list(reversed(self.roots))
+        while pending:
+            timing = pending.pop()
+            timings.append(timing)
+            pending.extend(reversed(timing.children))
+        return timings
+
+    def render(self, top: int = DEFAULT_TOP) -> str:
+        """Render the slowest imports as a cumulative/self-time tree.
+
+        Args:
+            top: Number of modules to show; modules are kept by cumulative
+                time, so every shown module's parent is shown as well
+
+        Returns:
+            The report as text
+        """
+        timings = self.all_timings()
+        header = (
+            f"Import profile: {len(timings)} module(s) imported in "
+            f"{self.total_us / 1000:.1f} ms"
+        )
+        lines = [header]
+        if not timings:
+            return header
+
+        cumulative = sorted((t.cumulative_us for t in timings), reverse=True)
+        threshold = cumulative[min(top, len(cumulative)) - 1]
+        lines.append(f"{'cumulative':>12} {'self':>10}  module")
+
+        def visit(nodes: List[ImportTiming], prefix: str, nested: bool) -> None:
+            shown = sorted(
+                (n for n in nodes if n.cumulative_us >= threshold),
+                key=lambda n: -n.cumulative_us,
+            )
+            for i, node in enumerate(shown):
+                last = i == len(shown) - 1
+                branch = ("└─ " if last else "├─ ") if nested else ""
+                lines.append(
+                    f"{node.cumulative_us / 1000:>9.1f} ms {node.self_us / 1000:>7.1f} ms"
+                    f"  {prefix}{branch}{node.module}"
+                )
+                child_prefix = prefix + ("   " if last else "│  ") if nested else ""
+                visit(node.children, child_prefix, True)
+
+        visit(self.roots, "", False)
+        return "\n".join(lines)
@@ -0,0 +1,351 @@
+"""Inspect modules installed for another Python interpreter.
+
+Each interpreter gets a small pool of long-lived worker processes started
+with that interpreter. A worker runs ``PythonInspector`` on requests read from
+its stdin and writes the results to its stdout, so only the first request for
+an interpreter pays the start-up cost, and modules the worker has imported
+stay imported for later requests.
+
+Workers load peek-tool's own ``core`` and ``models`` packages from this
+installation (they need nothing else), so peek-tool does not have to be
+installed in the target environment. The target must run a Python version
+peek-tool supports.
+
+Protocol: the worker first writes a ``PEEK <major>.<minor>`` line; after that
+every message in either direction is a 4-byte big-endian length followed by a
+payload encoded with ``peek_tool.core.codec``.
+"""
+
+import atexit
+import os
+import select
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, BinaryIO, Dict, List, Optional
+
+import peek_tool
+from peek_tool.core import codec
+from peek_tool.core.base import InspectorFactory, TargetNotFoundError
+from peek_tool.core.cancellation import checkpoint
+from peek_tool.models.inspection_filters import InspectionFilters
+from peek_tool.models.inspection_result import InspectionResult
+
+# Oldest Python version the worker code runs on (matches requires-python)
+MIN_PYTHON = (3, 11)
+
+# Workers kept per interpreter (requests beyond this wait for a free worker)
+MAX_WORKERS_PER_INTERPRETER = 2
+
+# Seconds a worker may take to answer one request before it is killed
+REQUEST_TIMEOUT = 120.0
+
+# Seconds between cancellation checks while waiting for a worker's answer
+POLL_INTERVAL = 0.1
+
+_FRAME_HEADER = struct.Struct(">I")
+
+# Registers the peek_tool package without running its __init__, which imports
+# the CLI and its dependencies; the worker only needs core and models
+_BOOTSTRAP = """\
+import sys, types
+sys.stdout.write("PEEK %d.%d\\n" % sys.version_info[:2])
+sys.stdout.flush()
+if sys.version_info < {min_python!r}:
+    sys.exit(2)
+package = types.ModuleType("peek_tool")
+package.__path__ = [{package_dir!r}]
+package.__version__ = {version!r}
+sys.modules["peek_tool"] = package
+from peek_tool.core.interpreter_pool import serve
+serve()
+"""
+
+
+class _Worker:
+    """A worker process running under a given interpreter."""
+
+    def __init__(self, python: str):
+        bootstrap = _BOOTSTRAP.format(
+            min_python=MIN_PYTHON,
+            package_dir=os.path.dirname(peek_tool.__file__),
+            version=peek_tool.__version__,
+        )
+        # The worker must see the target environment, not this one
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key not in ("PYTHONPATH", "PYTHONHOME")
+        }
+        try:
+            self.process = subprocess.Popen(
+                [python, "-c", bootstrap],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=env,
+            )
+        except OSError as e:
+            raise ValueError(f"Could not start {python}: {e}")
+
+        # A hanging start-up (a blocking sitecustomize or .pth import) must not
+        # pin the caller, nor the pool slot it holds
+        try:
+            self._wait_for_output(REQUEST_TIMEOUT)
+        except TimeoutError:
+            self.kill()
+            raise ValueError(f"{python} did not start within {REQUEST_TIMEOUT:g}s")
+        except BaseException:
+            self.kill()
+            raise
+
+        greeting = self.process.stdout.readline().decode("ascii", "replace").split()
+        if len(greeting) != 2 or greeting[0] != "PEEK":
+            self.close()
+            raise ValueError(
+                f"{python} did not start a peek worker (is it a Python interpreter?)"
+            )
+        version = tuple(int(part) for part in greeting[1].split("."))
+        if version < MIN_PYTHON:
+            self.close()
+            raise ValueError(
+                f"{python} is Python {greeting[1]}; inspecting requires Python "
+                f"{'.'.join(map(str, MIN_PYTHON))} or newer"
+            )
+
+    def request(self, message: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send one request and wait for its response (REQUEST_TIMEOUT by default).
+
+        While waiting, the current operation's cancellation token is checked
+        every POLL_INTERVAL seconds.
+
+        Raises:
+            EOFError: If the worker has exited
+            TimeoutError: If the response does not start within the timeout
+            OperationCancelled: If the current operation is cancelled
+        """
+        try:
+            _write_frame(self.process.stdin, codec.encode(message))
+        except (BrokenPipeError, OSError) as e:
+            raise EOFError(str(e))
+
+        self._wait_for_output(REQUEST_TIMEOUT if timeout is None else timeout)
+        response = _read_frame(self.process.stdout)
+        if response is None:
+            raise EOFError("worker exited")
+        return codec.decode(response)
+
+    def _wait_for_output(self, timeout: float) -> None:
+        """Wait until the worker writes (or exits), checking for cancellation.
+
+        Raises:
+            TimeoutError: If nothing arrives within the timeout
+            OperationCancelled: If the current operation is cancelled
+        """
+        deadline = time.monotonic() + timeout
+        while not select.select([self.process.stdout], [], [], POLL_INTERVAL)[0]:
+            checkpoint()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"no response after {timeout:g}s")
+
+    def kill(self) -> None:
+        """Stop the worker at once (e.g. while it is busy with a request)."""
+        self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Stop the worker (closing its stdin ends its request loop)."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+
+
+class InterpreterPool:
+    """Pools of worker processes, one pool per Python interpreter."""
+
+    _idle: Dict[str, List[_Worker]] = {}
+    _counts: Dict[str, int] = {}
+    _condition = threading.Condition()
+
+    @classmethod
+    def inspect_result(
+        cls, python: str, target: str, filters: Optional[InspectionFilters] = None
+    ) -> InspectionResult:
+        """Inspect a Python target in a worker running under another interpreter.
+
+        Args:
+            python: Path (or command name) of the Python interpreter
+            target: The module, class, or function to inspect
+            filters: Which members to inspect (all if None)
+
+        Returns:
+            The inspection result
+
+        Raises:
+            ValueError: If the interpreter cannot be started or inspection fails
+        """
+        python = cls._resolve(python)
+        filters = filters or InspectionFilters()
+        message = {
+            "target": target,
+            "filters": {
+                "public_only": filters.public_only,
+                "no_imported": filters.no_imported,
+                "respect_all": filters.respect_all,
+                "kinds": sorted(filters.kinds),
+            },
+        }
+
+        worker = cls._acquire(python)
+        # A worker that did not answer (timed out, cancelled, or failed) may
+        # still be busy, so it is killed rather than reused
+        broken = True
+        try:
+            response = worker.request(message)
+            broken = False
+        except EOFError:
+            raise ValueError(
+                f"The inspection worker for {python} exited while inspecting {target}"
+            )
+        except TimeoutError:
+            raise ValueError(
+                f"Inspecting {target} with {python} took longer than {REQUEST_TIMEOUT:g}s"
+            )
+        finally:
+            cls._release(python, worker, broken=broken)
+
+        if "error" not in response:
+            return response["result"]
+        if "suggestions" not in response:
+            raise ValueError(response["error"])
+        # The message already lists the suggestions
+        error = TargetNotFoundError(response["error"], target)
+        error.suggestions = response["suggestions"]
+        raise error
+
+    @classmethod
+    def _resolve(cls, python: str) -> str:
+        """Turn an interpreter name or path into an absolute path.
+
+        Symlinks are kept: a virtual environment's ``python`` is usually a
+        symlink, and resolving it would lose the environment.
+        """
+        path = shutil.which(python) if os.sep not in python else python
+        if path is None or not os.path.isfile(path):
+            raise ValueError(f"Python interpreter not found: {python}")
+        return os.path.abspath(path)
+
+    @classmethod
+    def _acquire(cls, python: str) -> _Worker:
+        """Take an idle worker, start a new one, or wait for one to be released."""
+        with cls._condition:
+            while True:
+                idle = cls._idle.setdefault(python, [])
+                if idle:
+                    return idle.pop()
+                if cls._counts.get(python, 0) < MAX_WORKERS_PER_INTERPRETER:
+                    cls._counts[python] = cls._counts.get(python, 0) + 1
+                    break
+                cls._condition.wait()
+
+        # Started outside the lock so other interpreters are not held up
+        try:
+            return _Worker(python)
+        except Exception:
+            with cls._condition:
+                cls._counts[python] -= 1
+                cls._condition.notify()
+            raise
+
+    @classmethod
+    def _release(cls, python: str, worker: _Worker, broken: bool = False) -> None:
+        with cls._condition:
+            if broken:
+                worker.kill()
+                cls._counts[python] -= 1
+            else:
+                cls._idle[python].append(worker)
+            cls._condition.notify()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        """Return the started, idle, and busy workers of each interpreter."""
+        with cls._condition:
+            return {
+                python: {
+                    "workers": count,
+                    "idle": len(cls._idle.get(python, ())),
+                    "busy": count - len(cls._idle.get(python, ())),
+                    "max_workers": MAX_WORKERS_PER_INTERPRETER,
+                }
+                for python, count in cls._counts.items()
+            }
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Stop every idle worker."""
+        with cls._condition:
+            for python, workers in cls._idle.items():
+                for worker in workers:
+                    worker.close()
+                cls._counts[python] -= len(workers)
+                workers.clear()
+
+
+atexit.register(InterpreterPool.close_all)
+
+
+def serve() -> None:
+    """Worker entry point: answer inspection requests until stdin is closed."""
+    # Keep the protocol stream private; anything imported modules print goes to stderr
+    output = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    requests = sys.stdin.buffer
+
+    while True:
+        frame = _read_frame(requests)
+        if frame is None:
+            return
+        request = codec.decode(frame)
+
+        try:
+            options = request["filters"]
+            filters = InspectionFilters(
+                public_only=options["public_only"],
+                no_imported=options["no_imported"],
+                respect_all=options["respect_all"],
+                kinds=frozenset(options["kinds"]),
+            )
+            result = InspectorFactory.inspect_result(request["target"], "python", filters)
+            response: Dict[str, Any] = {"result": result}
+        except TargetNotFoundError as e:
+            response = {"error": str(e), "suggestions": e.suggestions}
+        except Exception as e:
+            response = {"error": str(e)}
+
+        _write_frame(output, codec.encode(response))
+
+
+def _write_frame(stream: BinaryIO, payload: bytes) -> None:
+    stream.write(_FRAME_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def _read_frame(stream: BinaryIO) -> Optional[bytes]:
+    """Read one frame, or None at end of stream."""
+    header = stream.read(_FRAME_HEADER.size)
+    if len(header) < _FRAME_HEADER.size:
+        return None
+    (length,) = _FRAME_HEADER.unpack(header)
+    payload = stream.read(length)
+    return payload if len(payload) == length else None
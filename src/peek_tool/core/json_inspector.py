@@ -4,13 +4,24 @@ from pathlib import Path
 from typing import Any
 
 from peek_tool.core.base import Inspector, InspectorFactory
+from peek_tool.core.cancellation import OperationCancelled, checkpoint
+from peek_tool.core.timings import span
 from peek_tool.models.inspection_result import InspectionResult
 from peek_tool.models.json_element import JsonElement, JsonRootElement
 
+# The file is read in chunks of this many characters, with a checkpoint before each
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Elements built between two checkpoints
+ELEMENTS_PER_CHECKPOINT = 4096
+
 
 class JsonInspector(Inspector):
     """Inspector for JSON files and data structures."""
 
+    # Elements built so far (for periodic cancellation checks)
+    _elements = 0
+
     def supports(self, target: str) -> bool:
         """Check if the target is a valid JSON file or a path to one."""
         # If the target is a file path, check if it exists and has a .json extension
@@ -39,14 +50,17 @@ class JsonInspector(Inspector):
 
         # Load the JSON file
         try:
-            with open(file_path, "r") as f:
-                json_data = json.load(f)
+            with span("parse"):
+                json_data = json.loads(self._read_text(file_path))
+        except OperationCancelled:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to parse JSON file {file_path}: {str(e)}")
 
         # Create the root element
         file_name = os.path.basename(file_path)
-        root_element = self._create_json_element(file_name, json_data)
+        with span("build"):
+            root_element = self._create_json_element(file_name, json_data)
         json_root = JsonRootElement(
             name=file_name, element=root_element, path=file_path
         )
@@ -72,14 +86,17 @@ class JsonInspector(Inspector):
                         )
 
                 # Update the root element to point to the specified path
-                path_element = self._create_json_element(
-                    ".".join(path_components), current
-                )
+                with span("build"):
+                    path_element = self._create_json_element(
+                        ".".join(path_components), current
+                    )
                 json_root = JsonRootElement(
                     name=f"{file_name}:{'.'.join(path_components)}",
                     element=path_element,
                     path=file_path,
                 )
+            except OperationCancelled:
+                raise
             except Exception as e:
                 raise ValueError(f"Failed to traverse JSON path: {str(e)}")
 
@@ -91,8 +108,24 @@ class JsonInspector(Inspector):
             metadata={"file_path": file_path},
         )
 
+    def _read_text(self, file_path: str) -> str:
+        """Read a file in chunks, so a large read can be cancelled."""
+        chunks = []
+        with open(file_path, "r") as f:
+            while True:
+                checkpoint()
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return "".join(chunks)
+
     def _create_json_element(self, name: str, data: Any) -> JsonElement:
         """Convert JSON data to a JsonElement."""
+        self._elements += 1
+        if self._elements % ELEMENTS_PER_CHECKPOINT == 0:
+            checkpoint(self._elements)
+
         if data is None:
             return JsonElement(name=name, value_type="null", value=None)
 
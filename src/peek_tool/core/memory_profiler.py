@@ -0,0 +1,220 @@
+"""Per-phase memory profiling of inspections with ``tracemalloc``.
+
+A ``MemoryProfiler`` records the same phases as a ``TimingRecorder`` (the
+``span()`` calls in the inspectors and formatters) and measures, for each,
+the peak traced memory above its start and the memory still held when it
+ended. For the outermost major phases (import, introspect, parse, build,
+format) tracemalloc snapshots are compared to find the source lines whose
+allocations were retained.
+
+Tracing and snapshots slow Python down considerably (the recorded times are
+not representative), so this is a diagnostic mode. The peak is process-wide:
+allocations by other threads during a phase count too. Retained bytes are
+negative when a phase freed memory allocated before it.
+"""
+
+import fnmatch
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from peek_tool.core import timings
+from peek_tool.core.timings import TimingRecorder, render_tree
+from peek_tool.models.memory_profile import AllocationSite, MemorySpan
+
+# Phases whose allocation sites are reported (unless nested in another one)
+SITE_PHASES = frozenset({"import", "introspect", "parse", "build", "format"})
+
+# Allocation sites reported per phase
+DEFAULT_TOP = 5
+
+# Sites recorded per phase entry, before merging
+_SITES_PER_ENTRY = 25
+
+# Leave the profiler's own allocations out of snapshots
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, timings.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+@dataclass
+class _Frame:
+    """Tracking state of an entered phase."""
+
+    node: MemorySpan
+    start: int  # Traced memory when the phase started
+    peak: int  # Highest traced memory seen during the phase
+    overhead: int = 0  # Traced memory held by the start snapshot
+    snapshot: Optional[tracemalloc.Snapshot] = None
+
+
+class MemoryProfiler(TimingRecorder):
+    """Context manager that measures the memory used by each phase.
+
+    Starts tracemalloc if it is not already tracing, and stops it on exit.
+
+    Example:
+        with MemoryProfiler() as profiler:
+            InspectorFactory.inspect("data.json")
+        print(profiler.render())
+    """
+
+    span_type = MemorySpan
+    metadata_key = "memory"
+
+    def __init__(self, top: int = DEFAULT_TOP):
+        """Create a profiler.
+
+        Args:
+            top: Allocation sites reported per phase
+        """
+        super().__init__()
+        self.top = top
+        self._frames: List[_Frame] = []
+        self._started_tracing = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        # Filtering a snapshot fills caches on first use (the abc check of
+        # the filter list, fnmatch's compiled patterns); fill them before
+        # anything is recorded, or the first phase reports them as its sites
+        tracemalloc.Snapshot((), 1).filter_traces(_SNAPSHOT_FILTERS)
+        for snapshot_filter in _SNAPSHOT_FILTERS:
+            fnmatch.fnmatch("", snapshot_filter.filename_pattern)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return super().__enter__()
+
+    def __exit__(self, *exc_info) -> None:
+        super().__exit__(*exc_info)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @property
+    def peak_bytes(self) -> int:
+        """Highest peak of any top-level phase."""
+        return max((root.peak_bytes for root in self.roots), default=0)
+
+    def _enter(self, name: str) -> MemorySpan:
+        node = super()._enter(name)
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            parent = self._frames[-1]
+            parent.peak = max(parent.peak, peak)
+
+        snapshot = None
+        if name in SITE_PHASES and not any(f.snapshot is not None for f in self._frames):
+            snapshot = _take_snapshot()
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        self._frames.append(_Frame(node, start, start, start - current, snapshot))
+        return node
+
+    def _exit(self, node: MemorySpan) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        frame = self._frames.pop()
+        frame.peak = max(frame.peak, peak)
+        node.peak_bytes = max(node.peak_bytes, frame.peak - frame.start)
+        node.retained_bytes += current - frame.start
+
+        if frame.snapshot is not None:
+            diff = _take_snapshot().compare_to(frame.snapshot, "lineno")
+            frame.snapshot = None
+            _merge_sites(node, diff)
+
+        # Snapshots are not part of the phases' memory use
+        tracemalloc.reset_peak()
+        if self._frames:
+            parent = self._frames[-1]
+            parent.peak = max(parent.peak, frame.peak - frame.overhead)
+        super()._exit(node)
+
+    def _span_dict(self, node: MemorySpan) -> Dict[str, Any]:
+        data = super()._span_dict(node)
+        data["peak_bytes"] = node.peak_bytes
+        data["retained_bytes"] = node.retained_bytes
+        data["sites"] = [
+            {
+                "file": site.filename,
+                "line": site.lineno,
+                "bytes": site.size_bytes,
+                "blocks": site.count,
+            }
+            for site in node.sites[: self.top]
+        ]
+        return data
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the spans as plain data, with peak and retained bytes."""
+        data = super().as_dict()
+        data["peak_bytes"] = self.peak_bytes
+        return data
+
+    def render(self) -> str:
+        """Render a peak/retained memory tree and the top allocation sites."""
+        lines = [f"Memory: peak {_format_bytes(self.peak_bytes)}"]
+        if not self.roots:
+            return lines[0]
+        lines.append(f"{'peak':>10} {'retained':>10}  phase")
+        lines.extend(
+            render_tree(
+                self.roots,
+                lambda node: (
+                    f"{_format_bytes(node.peak_bytes):>10} "
+                    f"{_format_bytes(node.retained_bytes):>10}"
+                ),
+            )
+        )
+
+        for name, node in _with_sites(self.roots):
+            lines.append("")
+            lines.append(f"Top allocation sites retained by {name}:")
+            for site in node.sites[: self.top]:
+                lines.append(
+                    f"{_format_bytes(site.size_bytes):>10} {site.count:>8} blocks  "
+                    f"{site.filename}:{site.lineno}"
+                )
+        return "\n".join(lines)
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Snapshot the traced memory, leaving out the profiler's own allocations."""
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def _merge_sites(node: MemorySpan, diff: List[tracemalloc.StatisticDiff]) -> None:
+    """Add the sites that grew during one entry of a phase to its sites."""
+    sites = {(site.filename, site.lineno): site for site in node.sites}
+    grown = [stat for stat in diff if stat.size_diff > 0][:_SITES_PER_ENTRY]
+    for stat in grown:
+        frame = stat.traceback[0]
+        site = sites.get((frame.filename, frame.lineno))
+        if site is None:
+            site = sites[(frame.filename, frame.lineno)] = AllocationSite(
+                frame.filename, frame.lineno, 0, 0
+            )
+        site.size_bytes += stat.size_diff
+        site.count += max(stat.count_diff, 0)
+    node.sites = sorted(sites.values(), key=lambda site: site.size_bytes, reverse=True)
+
+
+def _with_sites(nodes: List[MemorySpan], path: str = ""):
+    """Yield (path, span) for every span with allocation sites, depth first."""
+    for node in nodes:
+        name = f"{path}/{node.name}" if path else node.name
+        if node.sites:
+            yield name, node
+        yield from _with_sites(node.children, name)
+
+
+def _format_bytes(size: int) -> str:
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
@@ -0,0 +1,128 @@
+"""Always-on service metrics in the Prometheus text exposition format.
+
+Histograms are aggregated as they are recorded: a sample costs a lock, a
+bisect, and a few number updates, and nothing is kept per request, so they
+can stay enabled in production. Values that already exist elsewhere (cache statistics, queue depth, memory) are read when the
+metrics are rendered, as gauges or counters built by ``sample_lines()``.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+# Content type of the text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Observed values counted into fixed buckets, per combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # Label values -> (per-bucket counts with a final +Inf bucket, sum)
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record one value for the given label values."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    @contextmanager
+    def time(self, *label_values: str) -> Iterator[None]:
+        """Observe the seconds spent in the block (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *label_values)
+
+    def collect(self) -> List[str]:
+        """Return the exposition lines for this histogram (cumulative buckets)."""
+        with self._lock:
+            values = sorted(
+                (key, list(counts), total[0]) for key, (counts, total) in self._values.items()
+            )
+
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for key, counts, total in values:
+            labels = dict(zip(self.labels, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(_sample(f"{self.name}_bucket", {**labels, "le": le}, cumulative))
+            lines.append(_sample(f"{self.name}_sum", labels, total))
+            lines.append(_sample(f"{self.name}_count", labels, cumulative))
+        return lines
+
+
+def sample_lines(
+    name: str,
+    description: str,
+    metric_type: str,
+    samples: Iterable[Tuple[Dict[str, str], float]],
+) -> List[str]:
+    """Return the exposition lines for a metric read from elsewhere.
+
+    Args:
+        name: Metric name
+        description: HELP text
+        metric_type: "gauge" or "counter"
+        samples: (labels, value) pairs
+    """
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+    lines.extend(_sample(name, labels, value) for labels, value in samples)
+    return lines
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident memory of this process, or None where unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        name = f"{name}{{{rendered}}}"
+    if isinstance(value, float) and not value.is_integer():
+        return f"{name} {value!r}"
+    return f"{name} {int(value)}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# Inspections run through InspectorFactory, by inspector type
+INSPECTION_SECONDS = Histogram(
+    "peek_inspection_seconds",
+    "Time to inspect a target, by inspector type",
+    ["inspector"],
+)
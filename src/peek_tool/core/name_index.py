@@ -0,0 +1,218 @@
+"""Fuzzy "did you mean" suggestions for targets that cannot be found.
+
+Suggestions come from two places:
+
+- The members (and submodules) of the deepest part of the target that does
+  resolve, ranked directly. ``json.JSONEncodr`` is compared against the
+  members of ``json``.
+- A trigram index over the names of loaded modules and their members, stdlib
+  snapshot modules, and top-level installed modules. It catches typos in the
+  module part itself (``jsno.dumps``). The index is built lazily, grows as
+  more modules are imported, and is queried through trigram posting lists,
+  so lookups stay fast with tens of thousands of names.
+"""
+
+import pkgutil
+import sys
+import threading
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Default number of suggestions
+DEFAULT_LIMIT = 5
+
+# Minimum similarity (Dice coefficient of trigram sets) for a suggestion
+MIN_SIMILARITY = 0.35
+
+# Trigrams shared by more names than this are skipped when gathering candidates
+MAX_POSTINGS = 5000
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the trigrams of a name, padded so short names still have some."""
+    padded = f"  {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """Dice coefficient of the trigram sets of two names."""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return 2 * len(ta & tb) / (len(ta) + len(tb))
+
+
+class NameIndex:
+    """Trigram index over dotted names of modules and their members."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._known: Set[str] = set()
+        self._postings: Dict[str, List[int]] = {}
+        self._indexed_modules: Set[str] = set()
+        self._static_sources_indexed = False
+
+    @classmethod
+    def get(cls) -> "NameIndex":
+        """Return the shared index, updated with any newly imported modules."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            cls._instance.refresh()
+            return cls._instance
+
+    def add(self, name: str) -> None:
+        """Add a dotted name to the index."""
+        if name in self._known:
+            return
+        self._known.add(name)
+        index = len(self.names)
+        self.names.append(name)
+        for trigram in trigrams(name):
+            self._postings.setdefault(trigram, []).append(index)
+
+    def refresh(self) -> None:
+        """Index modules imported since the last refresh."""
+        if not self._static_sources_indexed:
+            self._static_sources_indexed = True
+            self._add_all(info.name for info in pkgutil.iter_modules())
+            self._add_all(_snapshot_modules())
+
+        for module_name, module in list(sys.modules.items()):
+            if module_name in self._indexed_modules or module is None:
+                continue
+            self._indexed_modules.add(module_name)
+            self.add(module_name)
+            try:
+                members = list(vars(module))
+            except TypeError:
+                continue
+            for member in members:
+                if not member.startswith("__"):
+                    self.add(f"{module_name}.{member}")
+
+    def _add_all(self, names: Iterable[str]) -> None:
+        for name in names:
+            self.add(name)
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Tuple[str, float]]:
+        """Find the indexed names most similar to a query.
+
+        Returns:
+            (name, similarity) pairs, best first
+        """
+        query_trigrams = trigrams(query)
+        counts: Dict[int, int] = {}
+        for trigram in query_trigrams:
+            postings = self._postings.get(trigram)
+            if not postings or len(postings) > MAX_POSTINGS:
+                continue
+            for index in postings:
+                counts[index] = counts.get(index, 0) + 1
+
+        # Only the candidates sharing the most trigrams are scored exactly
+        candidates = sorted(counts, key=counts.get, reverse=True)[: limit * 20]
+        scored = []
+        for index in candidates:
+            name = self.names[index]
+            score = 2 * counts[index] / (len(query_trigrams) + len(trigrams(name)))
+            if score >= MIN_SIMILARITY:
+                scored.append((name, score))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+
+def suggest(target: str, limit: int = DEFAULT_LIMIT) -> List[str]:
+    """Suggest existing names for a target that could not be found.
+
+    Args:
+        target: The dotted target that failed to resolve
+        limit: Maximum number of suggestions
+
+    Returns:
+        Suggested dotted names, best first
+    """
+    scores: Dict[str, float] = {}
+
+    # Members of the deepest resolvable parent are the most likely intent
+    parent_name, parent, remainder = _resolve_parent(target)
+    if parent is not None and remainder:
+        wanted = remainder[0]
+        for member in _member_names(parent):
+            score = similarity(wanted, member)
+            if score >= MIN_SIMILARITY:
+                full_name = _extend(parent_name, parent, member, remainder[1:])
+                # Context matches rank above global ones of equal similarity
+                scores[full_name] = max(scores.get(full_name, 0.0), score + 0.1)
+
+    # Global matches sharing only a long prefix (os.path.joinn vs os.path.os)
+    # are demoted by how poorly their last component matches
+    wanted_tail = target.rsplit(".", 1)[-1]
+    for name, score in NameIndex.get().search(target, limit * 2):
+        if name != target:
+            tail_score = similarity(wanted_tail, name.rsplit(".", 1)[-1])
+            score *= 0.5 + 0.5 * tail_score
+            scores[name] = max(scores.get(name, 0.0), score)
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [name for name, _ in ranked[:limit]]
+
+
+def _resolve_parent(target: str):
+    """Walk a target through loaded modules and attributes as far as it resolves.
+
+    Returns:
+        A tuple of (resolved dotted name, resolved object or None, unresolved parts)
+    """
+    parts = target.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        module_name = ".".join(parts[:i])
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+
+        obj, resolved = module, i
+        while resolved < len(parts) - 1 and hasattr(obj, parts[resolved]):
+            obj = getattr(obj, parts[resolved])
+            resolved += 1
+        return ".".join(parts[:resolved]), obj, parts[resolved:]
+
+    return "", None, parts
+
+
+def _extend(parent_name: str, parent, member: str, rest: List[str]) -> str:
+    """Append the rest of a target to a suggested member for as long as it exists."""
+    parts = [parent_name, member]
+    obj = getattr(parent, member, None)
+    for name in rest:
+        if obj is None or not hasattr(obj, name):
+            break
+        obj = getattr(obj, name)
+        parts.append(name)
+    return ".".join(parts)
+
+
+def _member_names(obj) -> List[str]:
+    """List the attribute names of an object, plus submodules of a package."""
+    try:
+        names = set(dir(obj))
+    except Exception:
+        names = set()
+
+    path = getattr(obj, "__path__", None)
+    if path is not None:
+        try:
+            names.update(info.name for info in pkgutil.iter_modules(path))
+        except Exception:
+            pass
+    return sorted(name for name in names if not name.startswith("__"))
+
+
+def _snapshot_modules() -> List[str]:
+    """Module names stored in the stdlib snapshot, if one is available."""
+    from peek_tool.core.stdlib_snapshot import StdlibSnapshot
+
+    snapshot = StdlibSnapshot.get()
+    return snapshot.module_names() if snapshot is not None else []
@@ -0,0 +1,330 @@
+"""Token-budget planning for text output.
+
+Given an inspection result and a token budget, the planner estimates the size
+of each output section from the model (docstring lines, member listings,
+imported names, JSON nesting) and chooses formatter limits that fit as much
+detail as possible into the budget. The limits are applied to the formatter
+before rendering, so the output is rendered once, with no trimming pass.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from peek_tool.formatters.base import Formatter
+from peek_tool.formatters.json.base import JsonFormatter
+from peek_tool.formatters.python.base import PythonFormatter
+from peek_tool.models.inspection_result import InspectionResult
+from peek_tool.models.json_element import JsonElement, JsonRootElement
+from peek_tool.models.python_element import Class, Method, Module
+
+# Rough size of a token in characters of English text and code
+CHARS_PER_TOKEN = 4
+
+# Fraction of the budget the planner aims for, leaving room for estimation error
+SAFETY_MARGIN = 0.9
+
+# Docstring lines kept before members are listed (more are added if room remains)
+SUMMARY_LINES = 3
+
+# Approximate length of a "... (N more ...)" line
+MORE_LINE_CHARS = 24
+
+_TRUNCATION_MARKER_CHARS = len("\n\n[...docstring truncated...]")
+
+# Candidate JSON limits, from least to most detailed
+_JSON_DEPTHS = range(0, 9)
+_JSON_ARRAY_ITEMS = (1, 3, 5, 10, 20, 50, 100, 1000)
+_JSON_STRING_LENGTHS = (40, 80, 160, 400, 2000)
+
+
+@dataclass
+class OutputPlan:
+    """Formatter limits chosen to fit a token budget."""
+
+    budget_tokens: int
+    estimated_tokens: int
+    limits: Dict[str, Any] = field(default_factory=dict)  # Formatter attribute -> value
+
+    @property
+    def fits(self) -> bool:
+        """Whether the estimated output fits the budget."""
+        return self.estimated_tokens <= self.budget_tokens
+
+    def apply(self, formatter: Formatter) -> None:
+        """Set the planned limits on a formatter instance."""
+        for name, value in self.limits.items():
+            setattr(formatter, name, value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the plan as plain data (for metadata and logs)."""
+        return {
+            "budget_tokens": self.budget_tokens,
+            "estimated_tokens": self.estimated_tokens,
+            "fits": self.fits,
+            "limits": dict(self.limits),
+        }
+
+
+class OutputPlanner:
+    """Choose formatter limits that fit an inspection result into a token budget."""
+
+    @classmethod
+    def plan(
+        cls, result: InspectionResult, formatter: Formatter, max_tokens: int
+    ) -> OutputPlan:
+        """Plan the output of a result for a formatter.
+
+        Args:
+            result: The inspection result to be rendered
+            formatter: The text formatter that will render it
+            max_tokens: Token budget for the rendered output
+
+        Returns:
+            The plan; formatters without planning support get an empty plan
+        """
+        budget_chars = int(max_tokens * CHARS_PER_TOKEN * SAFETY_MARGIN)
+        title_chars = 2 * len(f"{result.name} ({result.type})") + 3
+
+        limits: Dict[str, Any] = {}
+        estimated_chars = title_chars
+        if result.elements:
+            element = result.elements[0]
+            if isinstance(formatter, PythonFormatter):
+                limits, estimated_chars = _plan_python(
+                    formatter, element, budget_chars - title_chars
+                )
+                estimated_chars += title_chars
+            elif isinstance(formatter, JsonFormatter) and isinstance(
+                element, JsonRootElement
+            ):
+                limits, estimated_chars = _plan_json(
+                    element, budget_chars - title_chars
+                )
+                estimated_chars += title_chars
+
+        return OutputPlan(
+            budget_tokens=max_tokens,
+            estimated_tokens=-(-estimated_chars // CHARS_PER_TOKEN),
+            limits=limits,
+        )
+
+
+def _plan_python(
+    formatter: PythonFormatter, element: Any, budget: int
+) -> Tuple[Dict[str, Any], int]:
+    """Allocate a character budget across the sections of a Python result.
+
+    Priority: a docstring summary, then as many members as fit, then
+    imported names, then the rest of the docstring.
+    """
+
+    def signature_chars(method: Method, indent: int) -> int:
+        params = ", ".join(formatter._format_parameter(p) for p in method.parameters)
+        chars = indent + len(f"def {method.name}({params})") + 1
+        if method.return_type:
+            chars += len(method.return_type) + 4
+        if method.is_imported and method.import_source:
+            chars += len(method.import_source) + 17
+        return chars
+
+    def class_decl_chars(class_obj: Class, indent: int) -> int:
+        chars = indent + len(f"class {class_obj.name}") + 1
+        if class_obj.base_classes:
+            chars += len(", ".join(class_obj.base_classes)) + 2
+        return chars
+
+    fixed = 0
+    member_lists: List[List[int]] = []
+    imported_full = imported_summary = 0
+
+    if isinstance(element, Module):
+        doc_attr = "MAX_DOCSTRING_LINES"
+        if element.submodules:
+            fixed += len("Submodules:\n") + sum(len(s) + 3 for s in element.submodules) + 1
+
+        local_classes = [c for c in element.classes if not c.is_imported]
+        local_functions = [f for f in element.functions if not f.is_imported]
+        if local_classes:
+            fixed += len("Classes:\n-------\n\n")
+            member_lists.append([class_decl_chars(c, 2) for c in local_classes])
+        if local_functions:
+            fixed += len("Functions:\n---------\n\n")
+            member_lists.append([signature_chars(f, 2) for f in local_functions])
+
+        for members in (element.classes, element.functions):
+            groups: Dict[str, int] = {}
+            for member in members:
+                if member.is_imported and member.import_source:
+                    groups[member.import_source] = (
+                        groups.get(member.import_source, 0) + len(member.name) + 2
+                    )
+            if groups:
+                imported_full += len("Imported Functions:\n\n") + sum(
+                    len(source) + 15 + names for source, names in groups.items()
+                )
+                imported_summary += len("Imported Functions: 000 from 00 module(s)\n\n")
+
+    elif isinstance(element, Class):
+        doc_attr = "MAX_FUNCTION_DOCSTRING_LINES"
+        fixed += class_decl_chars(element, 0) + 1
+        own_methods = []
+        inherited: Dict[str, int] = {}
+        for method in element.methods:
+            if formatter._is_inherited(method, element):
+                inherited[method.defined_in] = (
+                    inherited.get(method.defined_in, 0) + len(method.name) + 2
+                )
+            else:
+                own_methods.append(method)
+        if own_methods:
+            fixed += len("  Methods:\n")
+            member_lists.append([signature_chars(m, 4) for m in own_methods])
+        fixed += sum(len(source) + 24 + names for source, names in inherited.items())
+
+    elif isinstance(element, Method):
+        doc_attr = "MAX_FUNCTION_DOCSTRING_LINES"
+        fixed += signature_chars(element, 0) + 1
+
+    else:
+        return {}, 0
+
+    docstring = formatter._render_docstring(element) if element.docstring else ""
+    doc_lines = [len(line) + 1 for line in docstring.split("\n")] if docstring else []
+
+    def doc_chars(lines: int) -> int:
+        if not doc_lines:
+            return 0
+        lines = min(lines, len(doc_lines))
+        chars = len("  Description: \n") + sum(doc_lines[:lines])
+        if lines < len(doc_lines):
+            chars += _TRUNCATION_MARKER_CHARS
+        return chars
+
+    def members_chars(limit: int) -> int:
+        return sum(
+            sum(lengths[:limit]) + (MORE_LINE_CHARS if len(lengths) > limit else 0)
+            for lengths in member_lists
+        )
+
+    remaining = budget - fixed
+
+    # 1. Docstring summary
+    doc_limit = min(SUMMARY_LINES, max(len(doc_lines), 1))
+    while doc_limit > 1 and doc_chars(doc_limit) > remaining:
+        doc_limit -= 1
+    remaining -= doc_chars(doc_limit)
+
+    # 2. As many members per section as fit (imported names are at least counted)
+    longest = max((len(lengths) for lengths in member_lists), default=0)
+    member_limit = 0
+    while (
+        member_limit < longest
+        and members_chars(member_limit + 1) + imported_summary <= remaining
+    ):
+        member_limit += 1
+    remaining -= members_chars(member_limit)
+
+    # 3. Imported names, only once every local member is listed
+    show_imported = member_limit == longest and imported_full <= remaining
+    remaining -= imported_full if show_imported else imported_summary
+
+    # 4. The rest of the docstring
+    spent = doc_chars(doc_limit)
+    while doc_limit < len(doc_lines) and doc_chars(doc_limit + 1) - spent <= remaining:
+        doc_limit += 1
+    remaining -= doc_chars(doc_limit) - spent
+
+    limits = {
+        doc_attr: max(doc_limit, 1),
+        "MAX_LISTED_MEMBERS": None if member_limit == longest else member_limit,
+        "SHOW_IMPORTED": show_imported,
+    }
+    return limits, budget - remaining
+
+
+def _plan_json(root: JsonRootElement, budget: int) -> Tuple[Dict[str, Any], int]:
+    """Pick the deepest, then widest, then most verbose JSON view that fits.
+
+    Each candidate is sized by walking the visible part of the model, stopping
+    as soon as the budget is exceeded.
+    """
+    fixed = len(f"File: {root.path}\n\n")
+
+    def measure(depth_limit: int, items: int, strings: int, cap: float) -> Optional[int]:
+        total = _json_chars(root.element, 0, 0, depth_limit, items, strings, cap - fixed)
+        return None if total is None else fixed + total
+
+    depth, items, strings = 0, _JSON_ARRAY_ITEMS[0], _JSON_STRING_LENGTHS[0]
+    # The least detailed view is used even if it does not fit
+    best = measure(depth, items, strings, float("inf"))
+
+    # Deeper structure first, until it no longer fits or stops adding anything
+    for candidate in _JSON_DEPTHS[1:]:
+        size = measure(candidate, items, strings, budget)
+        if size is None or size == best:
+            break
+        depth, best = candidate, size
+
+    for candidate in _JSON_ARRAY_ITEMS[1:]:
+        size = measure(depth, candidate, strings, budget)
+        if size is None or size == best:
+            break
+        items, best = candidate, size
+
+    for candidate in _JSON_STRING_LENGTHS[1:]:
+        size = measure(depth, items, candidate, budget)
+        if size is None or size == best:
+            break
+        strings, best = candidate, size
+
+    limits = {
+        "MAX_DISPLAY_DEPTH": depth,
+        "MAX_ARRAY_ITEMS": items,
+        "MAX_STRING_LENGTH": strings,
+    }
+    return limits, best
+
+
+def _json_chars(
+    element: JsonElement,
+    indent: int,
+    depth: int,
+    depth_limit: int,
+    items: int,
+    strings: int,
+    cap: float,
+) -> Optional[int]:
+    """Estimate the rendered size of a JSON element, or None if it exceeds cap."""
+    name_chars = indent + len(element.name) + 3  # "name: " plus the newline
+
+    if element.value_type in ("object", "array"):
+        total = 2 * name_chars  # Opening and closing lines
+        if depth >= depth_limit:
+            return total + indent + 32 if total + indent + 32 <= cap else None
+
+        children = (
+            list(element.children.values())
+            if element.value_type == "object"
+            else element.items[:items]
+        )
+        if element.value_type == "array" and len(element.items) > items:
+            total += indent + 22
+
+        for child in children:
+            child_chars = _json_chars(
+                child, indent + 2, depth + 1, depth_limit, items, strings, cap - total
+            )
+            if child_chars is None:
+                return None
+            total += child_chars
+        return total if total <= cap else None
+
+    value = element.value
+    if element.value_type == "string" and value is not None:
+        value_chars = min(len(value), strings) + 2
+        if len(value) > strings:
+            value_chars += 15
+    else:
+        value_chars = len(str(value)) if value is not None else 4
+    total = name_chars + value_chars
+    return total if total <= cap else None
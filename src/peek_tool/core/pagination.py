@@ -0,0 +1,133 @@
+"""Page-by-page access to large rendered outputs.
+
+The full output of a request is rendered once and cached as a list of pages
+under a key derived from the request parameters. A cursor names one page of
+one cached output, so fetching any page is a cache lookup, with no new
+inspection. The same request parameters always produce the same key, which
+keeps cursors stable. A cursor that has been evicted or has expired can be
+recreated by repeating the original request.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from peek_tool.core.result_cache import ResultCache
+
+# Default maximum number of characters per page
+DEFAULT_PAGE_SIZE = 8000
+
+
+class Paginator:
+    """Serve rendered outputs page by page from a shared result cache."""
+
+    cache: ResultCache[List[str]] = ResultCache(
+        max_entries=64, max_bytes=64 * 1024 * 1024, ttl=600.0
+    )
+
+    @classmethod
+    def get_page(
+        cls,
+        key_parts: Tuple,
+        render: Callable[[], str],
+        page: Optional[int] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return one page of an output, rendering it only on a cache miss.
+
+        Args:
+            key_parts: Request parameters that determine the output
+            render: Produces the full output
+            page: 1-based page number (defaults to 1, or to the cursor's page)
+            cursor: A cursor returned with an earlier page
+            page_size: Maximum characters per page
+
+        Returns:
+            A tuple containing:
+            - The page text followed by a footer with the next cursor
+            - A dictionary with metadata (page, pages, cursor, next cursor, cached)
+
+        Raises:
+            ValueError: If the cursor is malformed, unknown, or expired, or the
+                page does not exist
+        """
+        page_size = page_size or DEFAULT_PAGE_SIZE
+
+        if cursor is not None:
+            key, cursor_page = parse_cursor(cursor)
+            pages = cls.cache.get(key)
+            if pages is None:
+                raise ValueError(
+                    f"Cursor {cursor} has expired; repeat the original request "
+                    "to get a new cursor"
+                )
+            cached = True
+            page = page or cursor_page
+        else:
+            key = hashlib.sha1(repr(key_parts + (page_size,)).encode()).hexdigest()[:16]
+            pages, cached = cls.cache.get_or_create(
+                key,
+                lambda: split_pages(render(), page_size),
+                sizeof=lambda pages: sum(len(p) for p in pages),
+            )
+            page = page or 1
+
+        if not 1 <= page <= len(pages):
+            raise ValueError(f"Page {page} does not exist; the output has {len(pages)} page(s)")
+
+        next_cursor = make_cursor(key, page + 1) if page < len(pages) else None
+        metadata = {
+            "page": page,
+            "pages": len(pages),
+            "cursor": make_cursor(key, page),
+            "next_cursor": next_cursor,
+            "cached": cached,
+        }
+
+        footer = f"[Page {page} of {len(pages)}]"
+        if next_cursor:
+            footer += f" next_cursor: {next_cursor}"
+        return f"{pages[page - 1]}\n\n{footer}", metadata
+
+
+def split_pages(text: str, page_size: int) -> List[str]:
+    """Split text into pages of at most page_size characters, at line breaks if possible."""
+    pages: List[str] = []
+    current: List[str] = []
+    current_size = 0
+
+    for line in text.split("\n"):
+        # A single line longer than a page is cut into page-sized pieces
+        while len(line) > page_size:
+            if current:
+                pages.append("\n".join(current))
+                current, current_size = [], 0
+            pages.append(line[:page_size])
+            line = line[page_size:]
+
+        if current and current_size + len(line) + 1 > page_size:
+            pages.append("\n".join(current))
+            current, current_size = [], 0
+        current.append(line)
+        current_size += len(line) + 1
+
+    if current or not pages:
+        pages.append("\n".join(current))
+    return pages
+
+
+def make_cursor(key: str, page: int) -> str:
+    """Build the cursor for a page of a cached output."""
+    return f"{key}-{page}"
+
+
+def parse_cursor(cursor: str) -> Tuple[str, int]:
+    """Split a cursor into its output key and page number.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    key, _, page = cursor.strip().rpartition("-")
+    if not key or not page.isdigit():
+        raise ValueError(f"Invalid cursor {cursor!r}")
+    return key, int(page)
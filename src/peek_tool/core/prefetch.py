@@ -0,0 +1,225 @@
+"""Speculative prefetching of likely follow-up targets.
+
+After a module has been served, callers usually go on to inspect a few of
+its classes or submodules. A ``Prefetcher`` loads those on a background
+thread so the follow-up requests are answered from the cache. Prefetching
+only uses idle time:
+
+- the thread runs at the lowest OS scheduling priority where supported;
+- it waits while any foreground request is running, and queued targets are
+  dropped as soon as a new request starts;
+- each batch stops when it exceeds its CPU-time or memory budget.
+
+Hits (prefetched targets that were later requested) are counted so the
+budgets can be tuned.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from peek_tool.core.metrics import rss_bytes
+
+# Follow-up targets loaded after one request, at most
+MAX_TARGETS = 8
+
+# Thread CPU time one batch may use
+CPU_BUDGET_SECONDS = 2.0
+
+# Growth of the process's resident memory one batch may cause
+MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+# Prefetched targets remembered until requested (older ones are likely
+# evicted from the cache by then, so a request for them would not be a hit)
+MAX_UNUSED = 256
+
+
+class Prefetcher:
+    """Load the likely next targets of a request on an idle background thread."""
+
+    def __init__(
+        self,
+        load: Callable[[str], bool],
+        candidates: Callable[[str], List[str]],
+        max_targets: int = MAX_TARGETS,
+        cpu_budget: float = CPU_BUDGET_SECONDS,
+        memory_budget: int = MEMORY_BUDGET_BYTES,
+        max_unused: int = MAX_UNUSED,
+    ):
+        """Create a prefetcher (its thread starts with the first batch).
+
+        Args:
+            load: Loads one target into the cache; returns False if it was
+                already cached
+            candidates: Lists the likely next targets after a served target
+            max_targets: Maximum targets loaded per batch
+            cpu_budget: Thread CPU seconds one batch may use
+            memory_budget: Resident memory growth (bytes) one batch may cause
+            max_unused: Prefetched, not yet requested targets remembered for
+                counting hits (the oldest are forgotten first)
+        """
+        self._load = load
+        self._candidates = candidates
+        self.max_targets = max_targets
+        self.cpu_budget = cpu_budget
+        self.memory_budget = memory_budget
+        self.max_unused = max_unused
+
+        # Served targets waiting to be expanded, and expanded targets to load
+        self._sources: Deque[str] = deque()
+        self._queue: Deque[str] = deque()
+        self._active = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        # Prefetched targets not requested yet, oldest first
+        self._unused: "OrderedDict[str, None]" = OrderedDict()
+
+        self.batches = 0
+        self.loaded = 0
+        self.already_cached = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.over_budget = 0
+        self.hits = 0
+
+    def schedule(self, target: str) -> None:
+        """Prefetch the likely next targets after a served target."""
+        with self._condition:
+            self._sources.append(target)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="peek-prefetch", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    @contextmanager
+    def foreground(self) -> Iterator[None]:
+        """Mark a real request: queued prefetches are dropped and the thread waits."""
+        with self._condition:
+            self._active += 1
+            self.cancelled += len(self._queue)
+            self._queue.clear()
+            self._sources.clear()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify()
+
+    def record_request(self, target: str, cached: bool) -> None:
+        """Count a request for a target that may have been prefetched."""
+        with self._condition:
+            if target in self._unused:
+                del self._unused[target]
+                if cached:
+                    self.hits += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return prefetch counts and the hit rate."""
+        with self._condition:
+            return {
+                "batches": self.batches,
+                "loaded": self.loaded,
+                "already_cached": self.already_cached,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "over_budget": self.over_budget,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.loaded, 3) if self.loaded else 0.0,
+                "budget": {
+                    "max_targets": self.max_targets,
+                    "cpu_seconds": self.cpu_budget,
+                    "memory_bytes": self.memory_budget,
+                },
+            }
+
+    def _run(self) -> None:
+        """Thread body: expand served targets and load their candidates while idle."""
+        _lower_thread_priority()
+        while True:
+            with self._condition:
+                while self._active or not (self._sources or self._queue):
+                    self._condition.wait()
+                if not self._queue:
+                    source = self._sources.popleft()
+                    self._sources.clear()
+                else:
+                    source = None
+
+            if source is not None:
+                self._start_batch(source)
+            else:
+                self._load_next()
+
+    def _start_batch(self, source: str) -> None:
+        """Queue the candidates of a served target as a new batch."""
+        self._batch_cpu = time.thread_time()
+        self._batch_rss = rss_bytes()
+        try:
+            targets = self._candidates(source)[: self.max_targets]
+        except Exception:
+            targets = []
+        with self._condition:
+            if self._active or self._sources:
+                # A newer request arrived while the candidates were listed
+                self.cancelled += len(targets)
+                return
+            self.batches += 1
+            self._queue.extend(targets)
+
+    def _load_next(self) -> None:
+        """Load one queued target unless the batch is over budget."""
+        if self._over_budget():
+            with self._condition:
+                self.over_budget += len(self._queue)
+                self._queue.clear()
+            return
+
+        with self._condition:
+            if self._active or not self._queue:
+                return
+            target = self._queue.popleft()
+
+        try:
+            loaded = self._load(target)
+        except Exception:
+            with self._condition:
+                self.failed += 1
+            return
+
+        with self._condition:
+            if loaded:
+                self.loaded += 1
+                self._unused[target] = None
+                if len(self._unused) > self.max_unused:
+                    self._unused.popitem(last=False)
+            else:
+                self.already_cached += 1
+
+    def _over_budget(self) -> bool:
+        if time.thread_time() - self._batch_cpu > self.cpu_budget:
+            return True
+        rss = rss_bytes()
+        return (
+            rss is not None
+            and self._batch_rss is not None
+            and rss - self._batch_rss > self.memory_budget
+        )
+
+
+def _lower_thread_priority() -> None:
+    """Give the calling thread the lowest scheduling priority (Linux only).
+
+    On Linux, nice values apply to single threads, so this leaves the threads
+    serving requests unaffected.
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
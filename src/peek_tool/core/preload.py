@@ -0,0 +1,69 @@
+"""Background warm-up of inspection targets.
+
+A long-running process (the MCP server) can name modules and JSON files to
+load right after start-up, so that the first request for them does not pay
+for a cold import or parse. Targets are loaded one at a time on a daemon
+thread while the process keeps serving requests; progress and per-target
+timings can be read at any time.
+"""
+
+import threading
+import time
+from typing import Callable, Optional, Sequence
+
+from peek_tool.models.preload_status import PreloadItem, PreloadStatus
+
+
+class Preloader:
+    """Load a list of targets on a background thread."""
+
+    def __init__(
+        self,
+        targets: Sequence[str],
+        load: Callable[[str], None],
+        on_progress: Optional[Callable[[PreloadItem, PreloadStatus], None]] = None,
+    ):
+        """Create a preloader.
+
+        Args:
+            targets: Targets to load, in order (duplicates are loaded once)
+            load: Loads one target; exceptions mark the target as failed
+            on_progress: Called after each target finishes
+        """
+        self.status = PreloadStatus(
+            items=[PreloadItem(target) for target in dict.fromkeys(targets)]
+        )
+        self._load = load
+        self._on_progress = on_progress
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start loading in the background (returns immediately)."""
+        if self._thread is None and self.status.items:
+            self._thread = threading.Thread(target=self.run, name="peek-preload", daemon=True)
+            self._thread.start()
+
+    def run(self) -> PreloadStatus:
+        """Load every target in the calling thread."""
+        self.status.started_at = time.perf_counter()
+        for item in self.status.items:
+            item.status = "loading"
+            start = time.perf_counter()
+            try:
+                self._load(item.target)
+                item.status = "done"
+            except Exception as e:
+                item.status = "failed"
+                item.error = str(e)
+            item.seconds = time.perf_counter() - start
+            if self._on_progress is not None:
+                self._on_progress(item, self.status)
+        self.status.finished_at = time.perf_counter()
+        return self.status
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background run to finish; returns whether it has."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
@@ -0,0 +1,17 @@
+"""Process pools for CPU-bound work (crawling, parsing, docstring extraction).
+
+The MCP server runs these pools from a multithreaded process (scheduler
+workers, the preload and prefetch threads). Forking such a process can leave
+the children holding locks, such as the import lock or logging locks, that
+no thread will ever release, so workers start from a clean interpreter.
+"""
+
+import multiprocessing
+
+
+def pool_context():
+    """Pick a multiprocessing start method that gives workers a clean interpreter."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
@@ -1,21 +1,88 @@
+import dataclasses
 import inspect
 import importlib
 import pkgutil
-from typing import get_type_hints
-
-from peek_tool.core.base import Inspector, InspectorFactory
+import types
+from typing import Dict, List, Optional, Tuple, get_type_hints
+
+from peek_tool.core.base import Inspector, InspectorFactory, TargetNotFoundError
+from peek_tool.core.cancellation import checkpoint
+from peek_tool.core.timings import span
+from peek_tool.core.name_index import suggest
+from peek_tool.core.docstring_parser import DocstringParser
+from peek_tool.core.signatures import SignatureResolver, is_extension_callable
+from peek_tool.core.stdlib_snapshot import StdlibSnapshot
+from peek_tool.models.inspection_filters import InspectionFilters
 from peek_tool.models.inspection_result import InspectionResult
 from peek_tool.models.python_element import Module, Class, Method, Parameter
 
+# Methods of classes implemented in C
+_BUILTIN_METHOD_TYPES = (
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.ClassMethodDescriptorType,
+    types.WrapperDescriptorType,
+)
+
 
 class PythonInspector(Inspector):
     """Inspector for Python modules and classes."""
 
+    supports_filters = True
+
+    def __init__(self, filters: Optional[InspectionFilters] = None):
+        # Members excluded by the filters are never introspected
+        self.filters = filters or InspectionFilters()
+
+        # Methods analysed during this inspection session, keyed by
+        # (defining class, name), so base-class methods are inspected once
+        # and shared by every subclass
+        self._member_table: Dict[Tuple[type, str], Method] = {}
+
+        # Results answered from the stdlib snapshot, keyed by target
+        self._snapshot_results: Dict[str, Optional[InspectionResult]] = {}
+
+    def _lookup_snapshot(self, target: str) -> Optional[InspectionResult]:
+        """Answer a target from the prebuilt stdlib snapshot, if one is available."""
+        # The snapshot does not record __all__, nor the names members are bound
+        # to (only their __name__), so those filters are applied live
+        if self.filters.respect_all or self.filters.public_only:
+            return None
+
+        if target not in self._snapshot_results:
+            snapshot = StdlibSnapshot.get()
+            result = snapshot.lookup(target) if snapshot is not None else None
+            if result is not None and self.filters.is_active:
+                result = self._filter_snapshot_result(result)
+            self._snapshot_results[target] = result
+        return self._snapshot_results[target]
+
+    def _filter_snapshot_result(self, result: InspectionResult) -> InspectionResult:
+        """Apply the kind and imported-member filters to a result read from the snapshot."""
+        filters = self.filters
+
+        def keep(element, kind: str) -> bool:
+            return filters.allows_kind(kind) and not (filters.no_imported and element.is_imported)
+
+        element = result.elements[0]
+        if isinstance(element, Module):
+            element = dataclasses.replace(
+                element,
+                classes=[c for c in element.classes if keep(c, "class")],
+                functions=[f for f in element.functions if keep(f, "function")],
+                submodules=element.submodules if filters.allows_kind("submodule") else [],
+            )
+        return dataclasses.replace(result, elements=[element])
+
     def supports(self, target: str) -> bool:
         """Check if the target is importable as a Python module, class, or method."""
+        # Stdlib targets in the snapshot are supported without importing anything
+        if self._lookup_snapshot(target) is not None:
+            return True
+
         # Try to import as a module
         try:
-            importlib.import_module(target)
+            _import(target)
             return True
         except (ImportError, ModuleNotFoundError):
             parts = target.split(".")
@@ -24,26 +91,36 @@ class PythonInspector(Inspector):
             if len(parts) > 1:
                 module_name = ".".join(parts[:-1])
                 try:
-                    importlib.import_module(module_name)
+                    _import(module_name)
                     return True
                 except (ImportError, ModuleNotFoundError):
                     # Try to import as a method within a class
                     if len(parts) > 2:
                         class_module_name = ".".join(parts[:-2])
                         try:
-                            importlib.import_module(class_module_name)
+                            _import(class_module_name)
                             return True
                         except (ImportError, ModuleNotFoundError):
                             pass
 
             return False
 
+    def suggest(self, target: str) -> List[str]:
+        """Suggest similarly named modules and members for a target that was not found."""
+        return suggest(target)
+
     def inspect(self, target_name: str) -> InspectionResult:
         """Inspect a Python module or class and return structured results."""
+        with span("snapshot"):
+            snapshot_result = self._lookup_snapshot(target_name)
+        if snapshot_result is not None:
+            return snapshot_result
+
         # Try to import the target as a module first
         try:
-            module = importlib.import_module(target_name)
-            return self._inspect_module(module)
+            module = _import(target_name)
+            with span("introspect"):
+                return self._inspect_module(module)
         except (ImportError, ModuleNotFoundError):
             # If that fails, try to handle it as a class, method, or function
             parts = target_name.split(".")
@@ -55,14 +132,18 @@ class PythonInspector(Inspector):
                 item_name = parts[-1]
 
                 try:
-                    module = importlib.import_module(module_name)
+                    module = _import(module_name)
                     item = getattr(module, item_name)
 
                     # Handle different types of objects
                     if inspect.isclass(item):
-                        return self._inspect_class_as_root(item, target_name)
-                    elif inspect.isfunction(item) or inspect.ismethod(item):
-                        return self._inspect_function_as_root(item, target_name)
+                        with span("introspect"):
+                            return self._inspect_class_as_root(item, target_name)
+                    elif inspect.isroutine(item) or is_extension_callable(item):
+                        with span("introspect"):
+                            return self._inspect_function_as_root(
+                                item, target_name, module_name
+                            )
                     else:
                         # For other types, return basic information
                         doc = inspect.getdoc(item) or ""
@@ -80,19 +161,22 @@ class PythonInspector(Inspector):
                             class_name = parts[-2]
                             method_name = parts[-1]
 
-                            module = importlib.import_module(class_module_name)
+                            module = _import(class_module_name)
                             class_obj = getattr(module, class_name)
 
                             if inspect.isclass(class_obj):
                                 method = getattr(class_obj, method_name)
-                                return self._inspect_function_as_root(
-                                    method, target_name
-                                )
+                                with span("introspect"):
+                                    return self._inspect_function_as_root(
+                                        method, target_name, class_obj.__module__
+                                    )
                         except (ImportError, AttributeError):
                             pass
 
-        raise ValueError(
-            f"Could not import {target_name} as a Python module, class, function, or method"
+        raise TargetNotFoundError(
+            f"Could not import {target_name} as a Python module, class, function, or method",
+            target_name,
+            self.suggest(target_name),
         )
 
     def _inspect_module(self, module_obj) -> InspectionResult:
@@ -101,36 +185,63 @@ class PythonInspector(Inspector):
         module_doc = inspect.getdoc(module_obj) or ""
 
         # Create a Module object
-        module = Module(name=module_name, docstring=module_doc)
+        module = Module(
+            name=module_name,
+            docstring=module_doc,
+            parsed_docstring=_parse_docstring(module_doc),
+        )
+
+        filters = self.filters
 
         # Identify if this is a package with submodules
-        if hasattr(module_obj, "__path__"):  # It's a package
+        if hasattr(module_obj, "__path__") and filters.allows_kind("submodule"):
             pkg_path = module_obj.__path__
             for _, name, ispkg in pkgutil.iter_modules(pkg_path):
-                full_name = f"{module_name}.{name}"
-                module.submodules.append(full_name)
-
-        # Find all classes in the module
-        for name, obj in inspect.getmembers(module_obj, inspect.isclass):
-            class_info = self._inspect_class(obj)
-
-            # Check if class is imported or defined in this module
-            if obj.__module__ != module_name:
-                class_info.is_imported = True
-                class_info.import_source = obj.__module__
+                if filters.allows_name(name):
+                    full_name = f"{module_name}.{name}"
+                    module.submodules.append(full_name)
+
+        # Candidate names are filtered before any attribute is even looked up
+        exported = getattr(module_obj, "__all__", None) if filters.respect_all else None
+        if exported is not None:
+            names = sorted({name for name in exported if isinstance(name, str)})
+        else:
+            names = dir(module_obj)
+
+        for position, name in enumerate(names):
+            checkpoint(position, len(names))
+            if not filters.allows_name(name):
+                continue
+            try:
+                obj = getattr(module_obj, name)
+            except AttributeError:
+                continue
 
-            module.classes.append(class_info)
+            if inspect.isclass(obj):
+                kind = "class"
+            elif inspect.isroutine(obj) or is_extension_callable(obj):
+                kind = "function"
+            else:
+                continue
+            if not filters.allows_kind(kind):
+                continue
 
-        # Find all functions in the module
-        for name, obj in inspect.getmembers(module_obj, inspect.isfunction):
-            function_info = self._inspect_function(obj)
+            # Check if the member is imported or defined in this module
+            obj_module = getattr(obj, "__module__", None)
+            is_imported = obj_module is not None and obj_module != module_name
+            if is_imported and filters.no_imported:
+                continue
 
-            # Check if function is imported or defined in this module
-            if obj.__module__ != module_name:
-                function_info.is_imported = True
-                function_info.import_source = obj.__module__
+            if kind == "class":
+                member_info = self._inspect_class(obj)
+                module.classes.append(member_info)
+            else:
+                member_info = self._inspect_function(obj, module_name)
+                module.functions.append(member_info)
 
-            module.functions.append(function_info)
+            if is_imported:
+                member_info.is_imported = True
+                member_info.import_source = obj_module
 
         # Create and return the inspection result
         return InspectionResult(name=module_name, type="module", elements=[module])
@@ -142,9 +253,11 @@ class PythonInspector(Inspector):
         # Create and return the inspection result
         return InspectionResult(name=full_name, type="class", elements=[class_info])
 
-    def _inspect_function_as_root(self, func_obj, full_name: str) -> InspectionResult:
+    def _inspect_function_as_root(
+        self, func_obj, full_name: str, module_hint: Optional[str] = None
+    ) -> InspectionResult:
         """Inspect a function or method as the root element."""
-        function_info = self._inspect_function(func_obj)
+        function_info = self._inspect_function(func_obj, module_hint)
 
         # Create and return the inspection result
         return InspectionResult(
@@ -161,29 +274,93 @@ class PythonInspector(Inspector):
 
         # Create a Class object
         class_info = Class(
-            name=class_name, docstring=class_doc, base_classes=base_classes
+            name=class_name,
+            docstring=class_doc,
+            parsed_docstring=_parse_docstring(class_doc),
+            base_classes=base_classes,
+            qualified_name=self._qualified_name(class_obj),
         )
 
-        # Find all methods in the class
-        for name, obj in inspect.getmembers(class_obj, inspect.isfunction):
-            # Skip special methods (starting with __)
-            if name.startswith("__") and name != "__init__":
+        # Find all methods in the class, including inherited ones
+        class_info.methods = self._inspect_class_methods(class_obj)
+
+        return class_info
+
+    def _inspect_class_methods(self, class_obj) -> List[Method]:
+        """Collect the methods of a class by walking its MRO.
+
+        Each method is looked up in the member table by its defining class,
+        so a base-class method is only inspected once per session no matter
+        how many subclasses inherit it.
+        """
+        seen = set()
+        methods = []
+
+        for klass in inspect.getmro(class_obj):
+            if klass is object:
+                continue
+            try:
+                namespace = vars(klass)
+            except TypeError:
                 continue
 
-            method_info = self._inspect_function(obj)
-            class_info.methods.append(method_info)
+            for name, attr in namespace.items():
+                # The first class in the MRO defining a name shadows the rest,
+                # even if its attribute is not a function
+                if name in seen:
+                    continue
+                seen.add(name)
+
+                # Skip special methods (starting with __)
+                if name.startswith("__") and name != "__init__":
+                    continue
+                if name != "__init__" and not self.filters.allows_name(name):
+                    continue
+
+                if isinstance(attr, staticmethod):
+                    attr = attr.__func__
+                if not (
+                    inspect.isfunction(attr) or isinstance(attr, _BUILTIN_METHOD_TYPES)
+                ):
+                    continue
+
+                key = (klass, name)
+                method_info = self._member_table.get(key)
+                if method_info is None:
+                    method_info = self._inspect_function(attr, klass.__module__)
+                    method_info.defined_in = self._qualified_name(klass)
+                    self._member_table[key] = method_info
+                methods.append(method_info)
+
+        methods.sort(key=lambda method: method.name)
+        return methods
+
+    def _qualified_name(self, class_obj) -> str:
+        """Return the module-qualified name of a class."""
+        return f"{class_obj.__module__}.{class_obj.__qualname__}"
+
+    def _inspect_function(self, func_obj, module_hint: Optional[str] = None) -> Method:
+        """Inspect a Python function or method.
+
+        Builtins and other callables implemented in C are inspected through
+        the signature fallback chain instead (see ``_inspect_builtin``).
+        """
+        if not (inspect.isfunction(func_obj) or inspect.ismethod(func_obj)):
+            return self._inspect_builtin(func_obj, module_hint)
 
-        return class_info
+        try:
+            with span("signature"):
+                signature = inspect.signature(func_obj)
+        except (TypeError, ValueError):
+            return self._inspect_builtin(func_obj, module_hint)
 
-    def _inspect_function(self, func_obj) -> Method:
-        """Inspect a Python function or method."""
         func_name = func_obj.__name__
         func_doc = inspect.getdoc(func_obj) or ""
 
         # Get return type annotation if available
         return_type = None
         try:
-            type_hints = get_type_hints(func_obj)
+            type_hints = _type_hints(func_obj)
             if "return" in type_hints:
                 return_type_obj = type_hints["return"]
                 return_type = self._format_type_annotation(return_type_obj)
@@ -192,12 +369,15 @@ class PythonInspector(Inspector):
             pass
 
         # Create a Method object
+        parsed_doc = _parse_docstring(func_doc)
         method_info = Method(
-            name=func_name, docstring=func_doc, return_type=return_type
+            name=func_name,
+            docstring=func_doc,
+            parsed_docstring=parsed_doc,
+            return_type=return_type,
         )
 
         # Get parameters
-        signature = inspect.signature(func_obj)
         for param_name, param in signature.parameters.items():
             # Skip self parameter for methods
             if param_name == "self" and func_name != "__init__":
@@ -206,7 +386,7 @@ class PythonInspector(Inspector):
             # Get parameter type annotation if available
             param_type = None
             try:
-                type_hints = get_type_hints(func_obj)
+                type_hints = _type_hints(func_obj)
                 if param_name in type_hints:
                     param_type_obj = type_hints[param_name]
                     param_type = self._format_type_annotation(param_type_obj)
@@ -226,13 +406,49 @@ class PythonInspector(Inspector):
 
             # Create a Parameter object
             param_info = Parameter(
-                name=param_name, type_annotation=param_type, default_value=default_value
+                name=param_name,
+                type_annotation=param_type,
+                default_value=default_value,
+                description=parsed_doc.param_description(param_name),
             )
 
             method_info.parameters.append(param_info)
 
         return method_info
 
+    def _inspect_builtin(self, func_obj, module_hint: Optional[str]) -> Method:
+        """Inspect a builtin or C-extension callable.
+
+        The signature comes from ``__text_signature__``, ``.pyi`` stubs, or
+        the docstring, in that order (see ``SignatureResolver``).
+        """
+        func_name = getattr(func_obj, "__name__", None) or type(func_obj).__name__
+        func_doc = inspect.getdoc(func_obj) or ""
+        parsed_doc = _parse_docstring(func_doc)
+        method_info = Method(
+            name=func_name, docstring=func_doc, parsed_docstring=parsed_doc
+        )
+
+        with span("signature"):
+            signature = SignatureResolver.resolve(func_obj, module_hint)
+        if signature is None:
+            return method_info
+
+        method_info.return_type = signature.return_type
+        for param_name, param_type, default_value in signature.parameters:
+            # Skip self parameter for methods
+            if param_name == "self" and func_name != "__init__":
+                continue
+            method_info.parameters.append(
+                Parameter(
+                    name=param_name,
+                    type_annotation=param_type,
+                    default_value=default_value,
+                    description=parsed_doc.param_description(param_name),
+                )
+            )
+        return method_info
+
     def _format_type_annotation(self, type_obj) -> str:
         """Format a type annotation as a string."""
         if type_obj is type(None):
@@ -250,5 +466,23 @@ class PythonInspector(Inspector):
         return str(type_obj)
 
 
+def _import(module_name: str):
+    """Import a module (timed as the "import" phase)."""
+    with span("import"):
+        return importlib.import_module(module_name)
+
+
+def _type_hints(func_obj) -> Dict:
+    """Resolve a function's type hints (timed as the "type_hints" phase)."""
+    with span("type_hints"):
+        return get_type_hints(func_obj)
+
+
+def _parse_docstring(docstring: str):
+    """Parse a docstring (timed as the "docstrings" phase)."""
+    with span("docstrings"):
+        return DocstringParser.parse(docstring)
+
+
 # Register the inspector with its formatter
 InspectorFactory.register("python", PythonInspector, formatter_type="python-text")
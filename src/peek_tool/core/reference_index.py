@@ -0,0 +1,427 @@
+"""Static cross-reference index: where is a symbol used across a project.
+
+Every ``.py`` file under a root directory is parsed with ``ast`` (in a process
+pool when many files need parsing) and its imports, calls, attribute accesses,
+base classes, and definitions are recorded with names resolved through the
+file's imports. Per-file results are persisted keyed by each file's size and
+mtime, so a re-run only re-parses files that changed. Queries are answered
+from an in-memory inverted index.
+
+Resolution is static and approximate: local variables that shadow imported
+names are not tracked, and attributes of objects whose type is unknown are
+recorded as ``*.attr`` so that bare names (e.g. ``encode``) can still find them.
+"""
+
+import ast
+import hashlib
+import linecache
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from peek_tool.core.cache import get_cache_dir
+from peek_tool.core.cancellation import OperationCancelled, checkpoint
+from peek_tool.core.process_pool import pool_context
+from peek_tool.models.search_result import SymbolReference
+
+# Fewer changed files than this are parsed in-process
+PARALLEL_THRESHOLD = 32
+
+# Bump when the recorded reference format changes
+INDEX_FORMAT = 1
+
+# Directories never worth indexing
+SKIPPED_DIRS = {"__pycache__", "node_modules", "site-packages", "build", "dist"}
+
+REFERENCE_KINDS = ("import", "call", "base", "attribute", "name", "definition")
+
+# (symbol, kind, line, col)
+_RawReference = Tuple[str, str, int, int]
+
+
+@dataclass
+class _ReferenceIndex:
+    """Per-file references of a root directory plus an inverted symbol index."""
+
+    root: str
+    # Relative path -> (mtime_ns, size, references)
+    files: Dict[str, Tuple[int, int, List[_RawReference]]] = field(default_factory=dict)
+    # Symbol -> [(relative path, kind, line, col)]
+    symbols: Dict[str, List[Tuple[str, str, int, int]]] = field(default_factory=dict)
+    # Dotted component -> symbols containing it
+    components: Dict[str, List[str]] = field(default_factory=dict)
+
+    def rebuild(self) -> None:
+        """Recompute the inverted index from the per-file references."""
+        symbols: Dict[str, List[Tuple[str, str, int, int]]] = {}
+        for rel_path, (_, _, references) in self.files.items():
+            for symbol, kind, line, col in references:
+                symbols.setdefault(symbol, []).append((rel_path, kind, line, col))
+
+        components: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            for component in set(symbol.split(".")):
+                components.setdefault(component, []).append(symbol)
+
+        self.symbols = symbols
+        self.components = components
+
+    def matching_symbols(self, symbol: str) -> List[str]:
+        """Find indexed symbols referring to a query symbol.
+
+        The query matches at dotted-component boundaries anywhere in a symbol:
+        ``json`` matches ``json.dumps`` and ``Parser.parse`` matches
+        ``pkg.Parser.parse``. A bare name like ``parse`` also matches
+        ``*.parse``, an attribute of an object of unknown type.
+        """
+        needle = f".{symbol}."
+        return sorted(
+            candidate
+            for candidate in self.components.get(symbol.split(".", 1)[0], [])
+            if needle in f".{candidate}."
+        )
+
+
+class ReferenceFinder:
+    """Find references to a symbol across the Python files of a directory."""
+
+    _indexes: Dict[str, _ReferenceIndex] = {}
+    # Indexes are updated in place, so refreshing and reading one is serialized
+    _lock = threading.RLock()
+
+    @classmethod
+    def find(
+        cls,
+        symbol: str,
+        root: str = ".",
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[SymbolReference]:
+        """Find references to a symbol.
+
+        Args:
+            symbol: Dotted name (e.g. 'json.dumps') or bare name (e.g. 'dumps')
+            root: Directory whose Python files are searched
+            kind: Only return references of this kind (see REFERENCE_KINDS)
+            limit: Maximum number of references to return
+
+        Returns:
+            References ordered by file and position
+
+        Raises:
+            ValueError: If the root is not a directory or the kind is unknown
+        """
+        if kind is not None and kind not in REFERENCE_KINDS:
+            raise ValueError(
+                f"Unknown reference kind {kind!r}; expected one of {', '.join(REFERENCE_KINDS)}"
+            )
+
+        with cls._lock:
+            index = cls.get_index(root)
+            references = [
+                SymbolReference(symbol=match, kind=ref_kind, path=path, line=line, col=col)
+                for match in index.matching_symbols(symbol)
+                for path, ref_kind, line, col in index.symbols[match]
+                if kind is None or ref_kind == kind
+            ]
+        references.sort(key=lambda ref: (ref.path, ref.line, ref.col))
+        return references[:limit] if limit else references
+
+    @classmethod
+    def get_index(cls, root: str) -> _ReferenceIndex:
+        """Return the up-to-date index of a root, re-parsing only changed files."""
+        root = os.path.abspath(root)
+        if not os.path.isdir(root):
+            raise ValueError(f"{root} is not a directory")
+
+        sources = _discover_sources(root)
+
+        with cls._lock:
+            index = cls._indexes.get(root)
+            if index is None:
+                index = _load_index(root) or _ReferenceIndex(root=root)
+
+            stats: Dict[str, Tuple[int, int]] = {}
+            for rel_path in sources:
+                try:
+                    stat = os.stat(os.path.join(root, rel_path))
+                except OSError:
+                    continue
+                stats[rel_path] = (stat.st_mtime_ns, stat.st_size)
+
+            changed = [
+                (rel_path, sources[rel_path])
+                for rel_path, (mtime_ns, size) in stats.items()
+                if index.files.get(rel_path, (None, None))[:2] != (mtime_ns, size)
+            ]
+            removed = [rel_path for rel_path in index.files if rel_path not in stats]
+
+            if changed or removed or cls._indexes.get(root) is not index:
+                # Parsed before the index is touched, so a cancelled parse
+                # leaves it as it was
+                parsed = _parse_all(root, changed)
+                for rel_path in removed:
+                    del index.files[rel_path]
+                for (rel_path, _), references in zip(changed, parsed):
+                    index.files[rel_path] = (*stats[rel_path], references)
+                index.rebuild()
+                if changed or removed:
+                    _save_index(index)
+                cls._indexes[root] = index
+
+            return index
+
+    @classmethod
+    def get_references_results(
+        cls,
+        symbol: str,
+        root: str = ".",
+        kind: Optional[str] = None,
+        limit: int = 200,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Find references and render them grouped by file.
+
+        Args:
+            symbol: Dotted or bare name to look for
+            root: Directory whose Python files are searched
+            kind: Only show references of this kind
+            limit: Maximum number of references to show
+
+        Returns:
+            A tuple containing:
+            - A formatted string listing references with source lines
+            - A dictionary with metadata (symbol, root, counts)
+        """
+        with cls._lock:
+            references = cls.find(symbol, root, kind=kind)
+            index = cls._indexes[os.path.abspath(root)]
+            files_indexed = len(index.files)
+        shown = references[:limit]
+
+        files = sorted({ref.path for ref in references})
+        metadata = {
+            "symbol": symbol,
+            "root": index.root,
+            "kind": kind,
+            "references": len(references),
+            "shown": len(shown),
+            "files": len(files),
+            "files_indexed": files_indexed,
+        }
+
+        header = f"References to: {symbol} | Root: {index.root}"
+        lines = ["─" * len(header), header, "─" * len(header), ""]
+        if not shown:
+            lines.append("(No references found)")
+
+        current_path = None
+        for ref in shown:
+            if ref.path != current_path:
+                if current_path is not None:
+                    lines.append("")
+                lines.append(ref.path)
+                current_path = ref.path
+            source_line = linecache.getline(
+                os.path.join(index.root, ref.path), ref.line
+            ).strip()
+            lines.append(f"  {ref.line:>5}:{ref.col:<3} {ref.kind:<10} {source_line[:100]}")
+
+        lines.append("")
+        summary = f"{len(references)} reference(s) in {len(files)} of {files_indexed} files"
+        if len(shown) < len(references):
+            summary += f" (showing {len(shown)})"
+        lines.append(summary)
+        return "\n".join(lines), metadata
+
+
+class _ReferenceCollector(ast.NodeVisitor):
+    """Collect resolved references from one module's AST."""
+
+    def __init__(self, module_name: str, is_package: bool):
+        self.module_name = module_name
+        self.package = module_name if is_package else module_name.rpartition(".")[0]
+        self.aliases: Dict[str, str] = {}
+        self.references: List[_RawReference] = []
+        self._roles: Dict[int, str] = {}
+        self._scope: List[str] = []
+
+    def collect(self, tree: ast.Module) -> List[_RawReference]:
+        """Resolve names against imports and module-level definitions, then visit."""
+        for node in tree.body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.aliases.setdefault(node.name, f"{self.module_name}.{node.name}")
+        self.visit(tree)
+        return self.references
+
+    def _add(self, symbol: str, kind: str, node: ast.AST) -> None:
+        self.references.append((symbol, kind, node.lineno, node.col_offset))
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.asname:
+                self.aliases[alias.asname] = alias.name
+            else:
+                head = alias.name.split(".", 1)[0]
+                self.aliases[head] = head
+            self._add(alias.name, "import", node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        base = node.module or ""
+        if node.level:
+            parts = self.package.split(".") if self.package else []
+            parent = ".".join(parts[: len(parts) - (node.level - 1)])
+            base = f"{parent}.{base}".strip(".") if base else parent
+
+        for alias in node.names:
+            if alias.name == "*":
+                self._add(base, "import", node)
+                continue
+            full_name = f"{base}.{alias.name}" if base else alias.name
+            self.aliases[alias.asname or alias.name] = full_name
+            self._add(full_name, "import", node)
+
+    def _visit_definition(self, node) -> None:
+        self._scope.append(node.name)
+        self._add(f"{self.module_name}.{'.'.join(self._scope)}", "definition", node)
+        for base in getattr(node, "bases", []):
+            self._roles[id(base)] = "base"
+        self.generic_visit(node)
+        self._scope.pop()
+
+    visit_ClassDef = _visit_definition
+    visit_FunctionDef = _visit_definition
+    visit_AsyncFunctionDef = _visit_definition
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self._roles[id(node.func)] = "call"
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Load) and node.id in self.aliases:
+            self._add(self.aliases[node.id], self._roles.get(id(node), "name"), node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        role = self._roles.get(id(node), "attribute")
+
+        # Resolve a plain dotted chain (a.b.c) through the import aliases
+        chain = [node.attr]
+        value = node.value
+        while isinstance(value, ast.Attribute):
+            chain.append(value.attr)
+            value = value.value
+        if isinstance(value, ast.Name) and value.id in self.aliases:
+            chain.append(self.aliases[value.id])
+            self._add(".".join(reversed(chain)), role, node)
+            return
+
+        self._add(f"*.{node.attr}", role, node)
+        self.generic_visit(node)
+
+
+def _discover_sources(root: str) -> Dict[str, Tuple[str, bool]]:
+    """Find Python files below a root and derive their module names.
+
+    Returns:
+        A mapping of relative path to (module name, is package)
+    """
+    sources: Dict[str, Tuple[str, bool]] = {}
+
+    def walk(directory: str, package: Optional[str]) -> None:
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            return
+
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name.startswith(".") or name in SKIPPED_DIRS:
+                    continue
+                is_package = os.path.exists(os.path.join(entry.path, "__init__.py"))
+                sub_package = (
+                    (f"{package}.{name}" if package else name) if is_package else None
+                )
+                walk(entry.path, sub_package)
+            elif name.endswith(".py") and entry.is_file():
+                stem = name[:-3]
+                rel_path = os.path.relpath(entry.path, root)
+                if stem == "__init__":
+                    sources[rel_path] = (package or stem, True)
+                else:
+                    sources[rel_path] = (f"{package}.{stem}" if package else stem, False)
+
+    walk(root, None)
+    return sources
+
+
+def _parse_all(
+    root: str, changed: List[Tuple[str, Tuple[str, bool]]]
+) -> List[List[_RawReference]]:
+    """Parse changed files, in parallel when there are many."""
+    jobs = [
+        (os.path.join(root, rel_path), module_name, is_package)
+        for rel_path, (module_name, is_package) in changed
+    ]
+    results = []
+    if len(jobs) < PARALLEL_THRESHOLD:
+        for done, job in enumerate(jobs):
+            checkpoint(done, len(jobs))
+            results.append(_parse_file(job))
+        return results
+
+    workers = min(os.cpu_count() or 1, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+        try:
+            for references in executor.map(_parse_file, jobs, chunksize=chunksize):
+                checkpoint(len(results), len(jobs))
+                results.append(references)
+        except OperationCancelled:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    return results
+
+
+def _parse_file(job: Tuple[str, str, bool]) -> List[_RawReference]:
+    """Collect the references of one file (unparsable files have none)."""
+    path, module_name, is_package = job
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    return _ReferenceCollector(module_name, is_package).collect(tree)
+
+
+def _cache_file(root: str):
+    """Return the on-disk location of a root's index."""
+    digest = hashlib.sha1(root.encode()).hexdigest()[:16]
+    return get_cache_dir("references") / f"{os.path.basename(root) or 'root'}-{digest}.pickle"
+
+
+def _load_index(root: str) -> Optional[_ReferenceIndex]:
+    """Load a persisted index, ignoring missing, stale, or corrupt files."""
+    try:
+        with open(_cache_file(root), "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        return None
+    if data.get("format") != INDEX_FORMAT:
+        return None
+    return _ReferenceIndex(root=root, files=data["files"])
+
+
+def _save_index(index: _ReferenceIndex) -> None:
+    """Persist the per-file references of an index."""
+    try:
+        with open(_cache_file(index.root), "wb") as f:
+            pickle.dump(
+                {"format": INDEX_FORMAT, "files": index.files},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+    except OSError:
+        pass
@@ -0,0 +1,123 @@
+"""Bounded in-memory cache for computed results.
+
+Entries are evicted least-recently-used first when the cache exceeds its entry
+or size budget, and expire after a time-to-live. Hit, miss, eviction, and
+expiry counts are kept for monitoring.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ResultCache(Generic[T]):
+    """A thread-safe LRU cache with a time-to-live and a size budget."""
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 600.0,
+    ):
+        """Create a cache.
+
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total size of all entries, as reported to put()
+            ttl: Seconds after which an entry expires, counted from when it was stored
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # Key -> (value, size, expiry time)
+        self._entries: "OrderedDict[Hashable, Tuple[T, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Return a cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a live entry exists (not counted as a hit or miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[2] > time.monotonic()
+
+    def put(self, key: Hashable, value: T, size: int = 0) -> None:
+        """Store a value, evicting the least recently used entries if needed."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + self.ttl)
+            self._bytes += size
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_or_create(
+        self, key: Hashable, factory: Callable[[], T], sizeof: Callable[[T], int] = len
+    ) -> Tuple[T, bool]:
+        """Return a cached value, computing and storing it on a miss.
+
+        Returns:
+            A tuple of (value, whether it came from the cache)
+        """
+        value = self.get(key)
+        if value is not None:
+            return value, True
+
+        value = factory()
+        self.put(key, value, sizeof(value))
+        return value, False
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry (the lock must be held)."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache occupancy and hit/miss/eviction counts."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
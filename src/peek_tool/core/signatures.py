@@ -0,0 +1,413 @@
+"""Signatures for builtins and C-extension callables.
+
+``inspect.signature`` only works for extension callables that carry a
+``__text_signature__``, and even then it has no annotations. Signatures are
+resolved through a fallback chain:
+
+1. ``__text_signature__`` (through ``inspect.signature``)
+2. ``.pyi`` stubs: next to the module, in a ``<package>-stubs`` distribution,
+   or in a typeshed bundled with an installed tool (mypy, jedi)
+3. Signature lines at the start of the docstring (``max(iterable, *[, key])``)
+
+Stubs also supply annotations for signatures found in step 1 when their
+parameter names agree. Parsed stubs are cached in memory and on disk, keyed
+by each stub file's size and mtime.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import inspect
+import os
+import pickle
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from peek_tool.core.cache import get_cache_dir
+
+# Bump when the cached stub format changes
+STUB_FORMAT = 1
+
+# Installed tools that bundle typeshed, with the stdlib stub directory inside each
+_BUNDLED_TYPESHEDS = (
+    ("mypy", "typeshed/stdlib"),
+    ("jedi", "third_party/typeshed/stdlib"),
+    ("typeshed_client", "typeshed"),
+)
+
+# Set on types defined in Python (as opposed to C)
+_TPFLAGS_HEAPTYPE = 1 << 9
+
+# (name, annotation, default)
+_StubParameter = Tuple[str, Optional[str], Optional[str]]
+
+# Qualified name -> (parameters, return annotation)
+_StubEntries = Dict[str, Tuple[List[_StubParameter], Optional[str]]]
+
+
+@dataclass
+class ResolvedSignature:
+    """Parameters and return type of a callable, as display strings."""
+
+    # (name, annotation, default)
+    parameters: List[_StubParameter] = field(default_factory=list)
+    return_type: Optional[str] = None
+    source: str = "signature"  # "signature", "stub", or "docstring"
+
+
+class SignatureResolver:
+    """Resolve signatures of callables that ``inspect.signature`` cannot fully describe."""
+
+    _stubs: Dict[str, _StubEntries] = {}  # Stub path -> parsed entries
+    _stub_paths: Dict[str, Optional[Path]] = {}  # Module name -> stub path
+    _typeshed_roots: Optional[List[Path]] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def resolve(
+        cls, func_obj, module_hint: Optional[str] = None
+    ) -> Optional[ResolvedSignature]:
+        """Resolve the signature of a builtin or extension callable.
+
+        Args:
+            func_obj: The callable
+            module_hint: Module the callable was found in, searched for stubs
+                when its own ``__module__`` has none (e.g. ``os`` for ``posix.stat``)
+
+        Returns:
+            The resolved signature, or None if no source describes it
+        """
+        stub = cls._stub_signature(func_obj, module_hint)
+
+        parameters = _text_signature(func_obj)
+        if parameters is not None:
+            resolved = ResolvedSignature(parameters=parameters)
+            if stub is not None and _same_names(parameters, stub.parameters):
+                resolved.parameters = [
+                    (name, annotation, default)
+                    for (name, _, default), (_, annotation, _) in zip(
+                        parameters, stub.parameters
+                    )
+                ]
+                resolved.return_type = stub.return_type
+            return resolved
+
+        if stub is not None:
+            return stub
+        return _docstring_signature(func_obj)
+
+    @classmethod
+    def _stub_signature(
+        cls, func_obj, module_hint: Optional[str]
+    ) -> Optional[ResolvedSignature]:
+        """Look a callable up in the stubs of its module (or the hinted module)."""
+        qualname = getattr(func_obj, "__qualname__", None) or getattr(
+            func_obj, "__name__", None
+        )
+        if not isinstance(qualname, str):
+            return None
+
+        modules = []
+        objclass = getattr(func_obj, "__objclass__", None)
+        owner = getattr(objclass or func_obj, "__module__", None)
+        if isinstance(owner, str):
+            modules.append(owner)
+        if module_hint and module_hint not in modules:
+            modules.append(module_hint)
+
+        for module_name in modules:
+            entries = cls.get_stub(module_name)
+            entry = entries.get(qualname) if entries else None
+            # Stubs often re-export a private implementation under its public name
+            if entry is None and entries and "." not in qualname:
+                entry = entries.get(getattr(func_obj, "__name__", ""))
+            if entry is not None:
+                return ResolvedSignature(
+                    parameters=list(entry[0]), return_type=entry[1], source="stub"
+                )
+        return None
+
+    @classmethod
+    def get_stub(cls, module_name: str) -> Optional[_StubEntries]:
+        """Return the parsed stub of a module, or None if it has no stub."""
+        with cls._lock:
+            if module_name not in cls._stub_paths:
+                cls._stub_paths[module_name] = cls._find_stub(module_name)
+            path = cls._stub_paths[module_name]
+            if path is None:
+                return None
+
+            key = str(path)
+            if key not in cls._stubs:
+                cls._stubs[key] = _load_stub(path)
+            return cls._stubs[key]
+
+    @classmethod
+    def _find_stub(cls, module_name: str) -> Optional[Path]:
+        """Locate the ``.pyi`` file for a module, preferring the most specific source."""
+        parts = module_name.split(".")
+        candidates: List[Path] = []
+
+        # Inline stubs next to the module (common for extension modules)
+        module = sys.modules.get(module_name)
+        module_file = getattr(module, "__file__", None)
+        if module_file:
+            module_path = Path(module_file)
+            if module_path.stem == "__init__":
+                candidates.append(module_path.parent / "__init__.pyi")
+            else:
+                # "_speedups.cpython-311-x86_64-linux-gnu.so" -> "_speedups.pyi"
+                candidates.append(module_path.parent / f"{module_path.name.split('.')[0]}.pyi")
+
+        # PEP 561 stub-only distributions
+        for entry in sys.path:
+            if entry and os.path.isdir(entry):
+                stub_dir = Path(entry, f"{parts[0]}-stubs", *parts[1:])
+                candidates += [stub_dir.with_suffix(".pyi"), stub_dir / "__init__.pyi"]
+
+        for root in cls._get_typeshed_roots():
+            stub_path = root.joinpath(*parts)
+            candidates += [stub_path.with_suffix(".pyi"), stub_path / "__init__.pyi"]
+
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+        return None
+
+    @classmethod
+    def _get_typeshed_roots(cls) -> List[Path]:
+        """Stdlib stub directories of installed tools that bundle typeshed."""
+        if cls._typeshed_roots is None:
+            roots = []
+            for package, subdir in _BUNDLED_TYPESHEDS:
+                try:
+                    spec = importlib.util.find_spec(package)
+                except (ImportError, ValueError):
+                    spec = None
+                if spec is None or not spec.submodule_search_locations:
+                    continue
+                for location in spec.submodule_search_locations:
+                    stdlib = Path(location, subdir)
+                    if stdlib.is_dir():
+                        roots += _typeshed_version_dirs(stdlib)
+            cls._typeshed_roots = roots
+        return cls._typeshed_roots
+
+
+def _typeshed_version_dirs(stdlib: Path) -> List[Path]:
+    """Return a stdlib stub directory plus the version subdirectories that apply.
+
+    Older typeshed releases split the stdlib into ``2and3``, ``3``, and ``3.N``
+    directories; newer ones are flat.
+    """
+    roots = [stdlib]
+    versioned = []
+    for child in stdlib.iterdir():
+        match = re.fullmatch(r"3(?:\.(\d+))?|2and3", child.name)
+        if not child.is_dir() or match is None:
+            continue
+        minor = match.group(1)
+        if minor is None or int(minor) <= sys.version_info.minor:
+            versioned.append((int(minor) if minor else -1, child))
+    # Newest matching version first, then "3", then "2and3"
+    versioned.sort(key=lambda item: (item[0], item[1].name != "2and3"), reverse=True)
+    return roots + [child for _, child in versioned]
+
+
+def _load_stub(path: Path) -> _StubEntries:
+    """Parse a stub file, reusing the on-disk cache when the file is unchanged."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+
+    cache_file = get_cache_dir("stubs") / (
+        hashlib.sha1(str(path).encode()).hexdigest()[:16] + ".pickle"
+    )
+    try:
+        with open(cache_file, "rb") as f:
+            data = pickle.load(f)
+        if (
+            data.get("format") == STUB_FORMAT
+            and data.get("mtime_ns") == stat.st_mtime_ns
+            and data.get("size") == stat.st_size
+        ):
+            return data["entries"]
+    except Exception:
+        pass
+
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return {}
+    entries: _StubEntries = {}
+    _collect_stub_entries(tree.body, "", entries)
+
+    try:
+        with open(cache_file, "wb") as f:
+            pickle.dump(
+                {
+                    "format": STUB_FORMAT,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "entries": entries,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+    except OSError:
+        pass
+    return entries
+
+
+def _collect_stub_entries(body: List[ast.stmt], prefix: str, entries: _StubEntries) -> None:
+    """Record the functions and methods in a stub body by qualified name.
+
+    The first definition of a name wins, which picks the first ``@overload``
+    and the first branch of ``if sys.version_info`` blocks.
+    """
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            qualname = prefix + node.name
+            if qualname not in entries:
+                returns = ast.unparse(node.returns) if node.returns else None
+                entries[qualname] = (_stub_parameters(node.args), returns)
+        elif isinstance(node, ast.ClassDef):
+            _collect_stub_entries(node.body, f"{prefix}{node.name}.", entries)
+        elif isinstance(node, ast.If):
+            _collect_stub_entries(node.body, prefix, entries)
+            _collect_stub_entries(node.orelse, prefix, entries)
+
+
+def _stub_parameters(args: ast.arguments) -> List[_StubParameter]:
+    """Convert the arguments of a stub definition to display strings."""
+    positional = args.posonlyargs + args.args
+    defaults: List[Optional[ast.expr]] = [None] * (len(positional) - len(args.defaults))
+    defaults += args.defaults
+
+    params = []
+    for arg, default in zip(positional, defaults):
+        params.append(_stub_parameter(arg, default))
+    if args.vararg:
+        params.append(_stub_parameter(args.vararg, None))
+    for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+        params.append(_stub_parameter(arg, default))
+    if args.kwarg:
+        params.append(_stub_parameter(args.kwarg, None))
+    return params
+
+
+def _stub_parameter(arg: ast.arg, default: Optional[ast.expr]) -> _StubParameter:
+    # Old-style stubs mark positional-only parameters with a "__" prefix
+    name = arg.arg[2:] if arg.arg.startswith("__") and not arg.arg.endswith("__") else arg.arg
+    annotation = ast.unparse(arg.annotation) if arg.annotation else None
+    return name, annotation, ast.unparse(default) if default is not None else None
+
+
+def _text_signature(func_obj) -> Optional[List[_StubParameter]]:
+    """Read the parameters from ``__text_signature__``, if the callable has one.
+
+    The bound first parameter (``$module``, ``$type``) is dropped, except
+    for the ``self`` of an unbound method, which the inspector handles like
+    any other method's.
+    """
+    try:
+        signature = inspect.signature(func_obj)
+    except (TypeError, ValueError):
+        signature = None
+
+    if signature is not None:
+        parameters = [
+            (name, None, _format_default(param.default, param.empty))
+            for name, param in signature.parameters.items()
+        ]
+    else:
+        # inspect rejects some text signatures, e.g. "default=<unrepresentable>"
+        text = getattr(func_obj, "__text_signature__", None)
+        if not isinstance(text, str):
+            return None
+        params_text = text.strip()[1:-1].replace("<unrepresentable>", "...")
+        try:
+            tree = ast.parse(f"def _({params_text.replace('$', '')}): pass")
+        except SyntaxError:
+            return None
+        parameters = _stub_parameters(tree.body[0].args)
+
+    # inspect already drops the bound parameter of bound callables; ast never does
+    bound = getattr(func_obj, "__self__", None) is not None
+    has_bound_param = signature is None or not bound
+    text = getattr(func_obj, "__text_signature__", None) or ""
+    if (
+        text.startswith("($")
+        and has_bound_param
+        and parameters
+        and (bound or parameters[0][0] != "self")
+    ):
+        parameters = parameters[1:]
+    return parameters
+
+
+def _docstring_signature(func_obj) -> Optional[ResolvedSignature]:
+    """Parse a ``name(params) -> result`` line at the start of a docstring.
+
+    The name may be qualified by an instance placeholder, as in ``D.pop(k[,d])``.
+    """
+    name = getattr(func_obj, "__name__", None)
+    doc = getattr(func_obj, "__doc__", None)
+    if not isinstance(name, str) or not isinstance(doc, str):
+        return None
+
+    for line in doc.lstrip().splitlines()[:3]:
+        match = re.match(
+            rf"^\s*(?:\w+\.)?{re.escape(name)}\((.*)\)\s*(?:->\s*(.+?))?\s*$", line
+        )
+        if match is None:
+            continue
+
+        # "[, default=obj, key=func]" marks optional parameters
+        params_text = re.sub(r"[\[\]]", "", match.group(1))
+        params_text = re.sub(r",\s*(?=,|$)", "", params_text).replace("...", "")
+        params_text = re.sub(r",\s*,", ",", params_text).strip(" ,")
+        try:
+            tree = ast.parse(f"def _({params_text}): pass")
+        except SyntaxError:
+            continue
+        parameters = _stub_parameters(tree.body[0].args)
+        return ResolvedSignature(
+            parameters=parameters, return_type=match.group(2), source="docstring"
+        )
+    return None
+
+
+def is_extension_callable(obj) -> bool:
+    """Whether an object is a named callable implemented in C (e.g. a numpy ufunc).
+
+    Such objects are neither functions nor builtins to ``inspect``, but are
+    used like functions and documented like them.
+    """
+    return (
+        callable(obj)
+        and not inspect.isclass(obj)
+        and isinstance(getattr(obj, "__name__", None), str)
+        and not type(obj).__flags__ & _TPFLAGS_HEAPTYPE
+    )
+
+
+def _format_default(default, empty) -> Optional[str]:
+    """Format a default value the way Python-level signatures are shown."""
+    if default is empty:
+        return None
+    if default is None:
+        return "None"
+    if isinstance(default, (str, int, float, bool)):
+        return repr(default)
+    return "..."
+
+
+def _same_names(params: List[_StubParameter], stub_params: List[_StubParameter]) -> bool:
+    """Whether a stub names the same parameters, in the same order."""
+    return [p[0] for p in params] == [p[0] for p in stub_params]
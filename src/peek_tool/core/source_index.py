@@ -0,0 +1,278 @@
+"""Source code lookup backed by a per-file definition index.
+
+Each source file is parsed once into an index of definition spans (keyed by
+qualified name) and line start offsets. The index is cached until the file's
+mtime or size changes. Reading a definition then memory-maps the file and
+decodes only the requested byte range, instead of re-tokenizing the whole
+file the way ``inspect.getsourcelines`` does on every call.
+"""
+
+import ast
+import importlib
+import importlib.util
+import inspect
+import mmap
+import os
+import re
+import sys
+import tokenize
+from array import array
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+
+_NEWLINE_RE = re.compile(b"\n")
+
+
+@dataclass
+class SourceIndex:
+    """Definition spans and line offsets of one source file."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    encoding: str = "utf-8"
+    # Qualified name -> (first line, last line), 1-based and inclusive
+    spans: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # Byte offset of the start of each line (index 0 is line 1)
+    line_offsets: array = field(default_factory=lambda: array("Q"))
+
+    _cache = {}  # Shared cache: path -> SourceIndex
+
+    @classmethod
+    def for_file(cls, path: str) -> "SourceIndex":
+        """Return the index for a file, rebuilding it only if the file changed.
+
+        Raises:
+            ValueError: If the file cannot be read or parsed
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise ValueError(f"Cannot read {path}: {e}")
+
+        cached = cls._cache.get(path)
+        if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        index = cls._build(path, stat.st_mtime_ns, stat.st_size)
+        cls._cache[path] = index
+        return index
+
+    @classmethod
+    def _build(cls, path: str, mtime_ns: int, size: int) -> "SourceIndex":
+        """Parse a file and record its definition spans and line offsets."""
+        with open(path, "rb") as f:
+            data = f.read()
+
+        try:
+            tree = ast.parse(data, filename=path)
+        except (SyntaxError, ValueError) as e:
+            raise ValueError(f"Cannot parse {path}: {e}")
+
+        encoding, _ = tokenize.detect_encoding(BytesIO(data).readline)
+        index = cls(path=path, mtime_ns=mtime_ns, size=size, encoding=encoding)
+
+        index.line_offsets.append(0)
+        index.line_offsets.extend(m.end() for m in _NEWLINE_RE.finditer(data))
+        if index.line_offsets[-1] == len(data) and len(index.line_offsets) > 1:
+            index.line_offsets.pop()  # File ends with a newline; no extra line
+
+        def visit(body: List[ast.stmt], prefix: str) -> None:
+            for node in body:
+                if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                    name = f"{prefix}{node.name}"
+                    start = min(
+                        [node.lineno] + [d.lineno for d in node.decorator_list]
+                    )
+                    # Conditional redefinitions keep the first definition
+                    index.spans.setdefault(name, (start, node.end_lineno))
+                    visit(node.body, f"{name}.")
+                elif isinstance(node, (ast.If, ast.Try)):
+                    # Definitions inside "if TYPE_CHECKING:" / try-except blocks
+                    for block in (
+                        node.body,
+                        getattr(node, "orelse", []),
+                        getattr(node, "finalbody", []),
+                        *[h.body for h in getattr(node, "handlers", [])],
+                    ):
+                        visit(block, prefix)
+
+        visit(tree.body, "")
+        return index
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the file."""
+        return len(self.line_offsets) if self.size else 0
+
+    def read_lines(self, start: int, end: int) -> List[str]:
+        """Read an inclusive, 1-based line range, decoding only those bytes."""
+        start = max(start, 1)
+        end = min(end, self.line_count)
+        if start > end:
+            return []
+
+        begin = self.line_offsets[start - 1]
+        stop = self.line_offsets[end] if end < self.line_count else self.size
+
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                chunk = mapped[begin:stop]
+
+        return chunk.decode(self.encoding, errors="replace").splitlines()
+
+
+class SourceViewer:
+    """Locate and render the source of Python targets."""
+
+    @classmethod
+    def locate(cls, target: str) -> Tuple[SourceIndex, Optional[str], Tuple[int, int]]:
+        """Find the file and line span that define a target.
+
+        Args:
+            target: Dotted module, class, function, or method name
+
+        Returns:
+            A tuple of (file index, qualified name or None for a whole
+            module, (first line, last line))
+
+        Raises:
+            ValueError: If the target or its source cannot be found
+        """
+        parts = target.split(".")
+        for i in range(len(parts), 0, -1):
+            module_name = ".".join(parts[:i])
+            try:
+                spec = importlib.util.find_spec(module_name)
+            except (ImportError, ValueError):
+                continue
+            if spec is None:
+                continue
+            source_file = cls._source_file(module_name, spec)
+            if source_file is None:
+                raise ValueError(f"{module_name} has no Python source ({spec.origin})")
+
+            index = SourceIndex.for_file(source_file)
+            qualname = ".".join(parts[i:])
+            if not qualname:
+                return index, None, (1, index.line_count)
+            if qualname in index.spans:
+                return index, qualname, index.spans[qualname]
+
+            # The name may be imported from another module (e.g. json.JSONDecodeError)
+            return cls._locate_object(target, module_name, parts[i:])
+
+        raise ValueError(f"Could not find a module for {target}")
+
+    @staticmethod
+    def _source_file(module_name: str, spec: Any) -> Optional[str]:
+        """Return the readable .py file of a module, or None if it has none.
+
+        Frozen modules (e.g. os and posixpath on 3.11+) have "frozen" as their
+        origin, but still name their source file, as inspect.getsourcefile()
+        finds it.
+        """
+        module = sys.modules.get(module_name)
+        candidates = [
+            spec.origin,
+            getattr(spec.loader_state, "filename", None),
+            getattr(module, "__file__", None),
+        ]
+        for path in candidates:
+            if path and path.endswith(".py") and os.path.isfile(path):
+                return path
+        return None
+
+    @classmethod
+    def _locate_object(
+        cls, target: str, module_name: str, attributes: List[str]
+    ) -> Tuple[SourceIndex, Optional[str], Tuple[int, int]]:
+        """Resolve a target by importing it and following it to its defining file."""
+        try:
+            obj: Any = importlib.import_module(module_name)
+            for attribute in attributes:
+                obj = getattr(obj, attribute)
+            obj = inspect.unwrap(obj)
+            source_file = inspect.getsourcefile(obj)
+        except (ImportError, AttributeError, TypeError) as e:
+            raise ValueError(f"Could not find the source of {target}: {e}")
+
+        qualname = getattr(obj, "__qualname__", None)
+        if source_file and qualname:
+            index = SourceIndex.for_file(source_file)
+            if qualname in index.spans:
+                return index, qualname, index.spans[qualname]
+
+        raise ValueError(f"Could not find the definition of {target}")
+
+    @classmethod
+    def get_source(
+        cls, target: str, lines: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Get the numbered source of a target.
+
+        Args:
+            target: Dotted module, class, function, or method name
+            lines: Optional "a:b" range of file line numbers to show,
+                clipped to the definition ("a:", ":b", and "a" are allowed)
+
+        Returns:
+            A tuple containing:
+            - The rendered source with a header and line numbers
+            - A dictionary with metadata (file, span, lines shown)
+
+        Raises:
+            ValueError: If the target cannot be found or the range is invalid
+        """
+        index, qualname, (span_start, span_end) = cls.locate(target)
+
+        start, end = span_start, span_end
+        if lines:
+            range_start, range_end = parse_line_range(lines)
+            start = max(start, range_start or start)
+            end = min(end, range_end or end)
+            if start > end:
+                raise ValueError(
+                    f"Lines {lines} are outside {target} (lines {span_start}-{span_end})"
+                )
+
+        source_lines = index.read_lines(start, end)
+        metadata = {
+            "target": target,
+            "file": index.path,
+            "qualname": qualname,
+            "definition_lines": [span_start, span_end],
+            "lines": [start, start + len(source_lines) - 1],
+        }
+
+        header = f"Source for: {target} | File: {index.path} | Lines {start}-{end}"
+        width = len(str(end))
+        output = ["─" * len(header), header, "─" * len(header), ""]
+        output.extend(
+            f"{lineno:>{width}} | {line}"
+            for lineno, line in enumerate(source_lines, start)
+        )
+        return "\n".join(output), metadata
+
+
+def parse_line_range(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """Parse "a:b", "a:", ":b", or "a" into a (start, end) tuple of line numbers.
+
+    Raises:
+        ValueError: If the range is malformed
+    """
+    try:
+        if ":" not in text:
+            line = int(text)
+            return line, line
+        start_text, end_text = text.split(":", 1)
+        start = int(start_text) if start_text.strip() else None
+        end = int(end_text) if end_text.strip() else None
+    except ValueError:
+        raise ValueError(f"Invalid line range {text!r}; expected a:b")
+
+    if (start is not None and start < 1) or (end is not None and end < 1):
+        raise ValueError(f"Invalid line range {text!r}; lines start at 1")
+    return start, end
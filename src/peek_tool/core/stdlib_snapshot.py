@@ -0,0 +1,239 @@
+"""Prebuilt standard-library inspection snapshot.
+
+Standard-library modules never change for a given interpreter, so their
+inspection results can be computed once (``peek index stdlib``) and stored in
+a versioned snapshot file. The inspector then answers stdlib targets from
+the snapshot without importing anything: the file is memory-mapped, and a
+lookup decompresses and decodes only the one module it needs.
+
+File layout::
+
+    magic (8 bytes) | index offset (u64) | index length (u64) | blobs... | index
+
+Each blob is a zlib-compressed codec payload of one module's InspectionResult.
+The index is a codec payload mapping module names to (offset, length) and
+recording the snapshot version.
+"""
+
+import dataclasses
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from peek_tool.core import codec
+from peek_tool.core.cache import get_cache_dir
+from peek_tool.core.crawler import CrawlResult, PackageCrawler
+from peek_tool.models.inspection_result import InspectionResult
+from peek_tool.models.python_element import Class, Method, Module
+
+MAGIC = b"PKSNAP01"
+_HEADER = struct.Struct("<8sQQ")
+
+# Bump when inspection output changes so stale snapshots are ignored
+SNAPSHOT_FORMAT = 2
+
+# Top-level modules that are not useful to index or have import side effects
+EXCLUDED_MODULES = {"antigravity", "this", "idlelib", "turtledemo", "test"}
+
+# Test packages inside the standard library
+EXCLUDED_PATTERNS = ["*.test", "*.tests", "*.idle_test", "*.test.*", "*.tests.*"]
+
+
+def snapshot_version() -> str:
+    """Return the version string a snapshot must match to be used."""
+    from peek_tool import __version__
+
+    impl = sys.implementation
+    return (
+        f"{impl.name}-{'.'.join(map(str, sys.version_info[:3]))}-{impl.cache_tag}"
+        f"-peek{__version__}-fmt{SNAPSHOT_FORMAT}-codec{codec.VERSION}"
+    )
+
+
+class StdlibSnapshot:
+    """Read access to a memory-mapped stdlib snapshot."""
+
+    _loaded: Dict[str, Optional["StdlibSnapshot"]] = {}
+
+    def __init__(self, path: Path):
+        """Open a snapshot file.
+
+        Raises:
+            ValueError: If the file is not a snapshot for this interpreter
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_offset, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a peek snapshot")
+
+        index = codec.decode(self._map[index_offset : index_offset + index_length])
+        if index.get("version") != snapshot_version():
+            raise ValueError(f"{path} was built for {index.get('version')}")
+        self._entries: Dict[str, Tuple[int, int]] = index["entries"]
+
+    @staticmethod
+    def default_path() -> Path:
+        """Return the snapshot location for the running interpreter."""
+        impl = sys.implementation
+        version = ".".join(map(str, sys.version_info[:3]))
+        return get_cache_dir("snapshots") / f"stdlib-{impl.name}-{version}.peeksnap"
+
+    @classmethod
+    def get(cls) -> Optional["StdlibSnapshot"]:
+        """Return the snapshot for this interpreter, or None if unavailable.
+
+        Set ``PEEK_NO_SNAPSHOT=1`` to always inspect live modules.
+        """
+        if os.environ.get("PEEK_NO_SNAPSHOT"):
+            return None
+
+        path = cls.default_path()
+        key = str(path)
+        if key not in cls._loaded:
+            try:
+                cls._loaded[key] = cls(path) if path.exists() else None
+            except (OSError, ValueError):
+                cls._loaded[key] = None
+        return cls._loaded[key]
+
+    def __contains__(self, module_name: str) -> bool:
+        return module_name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def module_names(self) -> List[str]:
+        """Return the names of all modules in the snapshot."""
+        return list(self._entries)
+
+    def get_module(self, module_name: str) -> Optional[InspectionResult]:
+        """Decode the stored result for a module."""
+        entry = self._entries.get(module_name)
+        if entry is None:
+            return None
+        offset, length = entry
+        result = codec.decode_result(zlib.decompress(self._map[offset : offset + length]))
+        result.metadata["source"] = "stdlib-snapshot"
+        return result
+
+    def lookup(self, target: str) -> Optional[InspectionResult]:
+        """Answer a target (module, class, function, or method) from the snapshot.
+
+        Returns:
+            The inspection result, or None if the snapshot cannot answer it
+            (in which case the target should be inspected live)
+        """
+        if target in self._entries:
+            return self.get_module(target)
+
+        parts = target.split(".")
+        # module.Class / module.function, then module.Class.method
+        for split in (len(parts) - 1, len(parts) - 2):
+            if split < 1 or ".".join(parts[:split]) not in self._entries:
+                continue
+            module_result = self.get_module(".".join(parts[:split]))
+            element = _find_member(module_result.elements[0], parts[split:])
+            if element is None:
+                return None
+
+            result_type = "class" if isinstance(element, Class) else "function"
+            return InspectionResult(
+                name=target,
+                type=result_type,
+                elements=[element],
+                metadata={"source": "stdlib-snapshot"},
+            )
+        return None
+
+    @classmethod
+    def build(
+        cls,
+        path: Optional[Path] = None,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[CrawlResult, int, int], None]] = None,
+    ) -> Dict[str, object]:
+        """Inspect every stdlib module and write a snapshot.
+
+        Args:
+            path: Output file (defaults to default_path())
+            workers: Number of worker processes
+            progress: Called with (result, done, total) after each module
+
+        Returns:
+            Build statistics (modules, failures, bytes, seconds)
+        """
+        start = time.perf_counter()
+        path = path or cls.default_path()
+        crawler = PackageCrawler(exclude=EXCLUDED_PATTERNS, workers=workers)
+
+        modules: List[str] = []
+        for name in sorted(sys.stdlib_module_names):
+            if name.startswith("_") or name in EXCLUDED_MODULES:
+                continue
+            try:
+                modules.extend(crawler.discover(name))
+            except ValueError:
+                continue  # Not available on this platform
+
+        entries: Dict[str, Tuple[int, int]] = {}
+        failures: List[str] = []
+        tmp_path = path.with_suffix(".tmp")
+
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, 0, 0))
+            for done, item in enumerate(crawler.inspect_modules(modules), 1):
+                if item.result is not None:
+                    blob = zlib.compress(codec.encode_result(item.result), 6)
+                    entries[item.module_name] = (f.tell(), len(blob))
+                    f.write(blob)
+                else:
+                    failures.append(item.module_name)
+                if progress:
+                    progress(item, done, len(modules))
+
+            index = codec.encode({"version": snapshot_version(), "entries": entries})
+            index_offset = f.tell()
+            f.write(index)
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, index_offset, len(index)))
+
+        os.replace(tmp_path, path)
+        cls._loaded.pop(str(path), None)
+
+        return {
+            "path": str(path),
+            "modules": len(entries),
+            "failures": failures,
+            "bytes": path.stat().st_size,
+            "seconds": round(time.perf_counter() - start, 2),
+        }
+
+
+def _find_member(module: Module, names: List[str]):
+    """Find a class, function, or method inside a snapshot module element."""
+    first = names[0]
+    element = next((c for c in module.classes if c.name == first), None)
+    if element is None:
+        element = next((f for f in module.functions if f.name == first), None)
+    if element is None:
+        return None
+
+    if len(names) == 2:
+        if not isinstance(element, Class):
+            return None
+        element = next((m for m in element.methods if m.name == names[1]), None)
+        if element is None:
+            return None
+
+    if isinstance(element, (Class, Method)) and element.is_imported:
+        # Viewed directly, the element is not "imported" from anywhere
+        element = dataclasses.replace(element, is_imported=False, import_source=None)
+    return element
@@ -0,0 +1,159 @@
+"""Per-phase timing of inspections.
+
+Code marks its phases with ``span()``::
+
+    with span("import"):
+        module = importlib.import_module(name)
+
+When a ``TimingRecorder`` is active in the current context, spans are timed
+with ``perf_counter_ns`` and nested under the span that was open when they
+started. Otherwise ``span()`` returns a shared no-op context manager, so
+instrumented code costs one context variable lookup per span.
+"""
+
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+from peek_tool.models.timing import TimingSpan
+
+_current: ContextVar[Optional["TimingRecorder"]] = ContextVar(
+    "peek_timing_recorder", default=None
+)
+
+_NO_SPAN = nullcontext()
+
+
+def span(name: str) -> ContextManager:
+    """Time a phase if a recorder is active (a no-op otherwise).
+
+    Args:
+        name: Phase name; same-named phases under one parent are merged
+    """
+    recorder = _current.get()
+    if recorder is None:
+        return _NO_SPAN
+    return _ActiveSpan(recorder, name)
+
+
+def active_recorder() -> Optional["TimingRecorder"]:
+    """The recorder active in the current context, if any."""
+    return _current.get()
+
+
+class _ActiveSpan:
+    """A span being timed by a recorder."""
+
+    __slots__ = ("_recorder", "_name", "_node", "_start")
+
+    def __init__(self, recorder: "TimingRecorder", name: str):
+        self._recorder = recorder
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._node = self._recorder._enter(self._name)
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        self._node.total_ns += time.perf_counter_ns() - self._start
+        self._node.count += 1
+        self._recorder._exit(self._node)
+
+
+class TimingRecorder:
+    """Context manager that records the spans entered in the current context.
+
+    Example:
+        with TimingRecorder() as timings:
+            InspectorFactory.inspect("json")
+        print(timings.render())
+    """
+
+    # Node type of the recorded spans
+    span_type = TimingSpan
+
+    # Key of the recording in InspectionResult.metadata
+    metadata_key = "timings"
+
+    def __init__(self):
+        self.roots: List[TimingSpan] = []
+        self._stack: List[TimingSpan] = []
+        self._reset = None
+
+    def __enter__(self) -> "TimingRecorder":
+        self._reset = _current.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current.reset(self._reset)
+
+    def _enter(self, name: str) -> TimingSpan:
+        siblings = self._stack[-1].children if self._stack else self.roots
+        for node in siblings:
+            if node.name == name:
+                break
+        else:
+            node = self.span_type(name=name)
+            siblings.append(node)
+        self._stack.append(node)
+        return node
+
+    def _exit(self, node: TimingSpan) -> None:
+        self._stack.pop()
+
+    @property
+    def total_ns(self) -> int:
+        """Time spent in all top-level spans."""
+        return sum(root.total_ns for root in self.roots)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the spans as plain data (times in milliseconds)."""
+        return {
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "spans": [self._span_dict(root) for root in self.roots],
+        }
+
+    def _span_dict(self, node: TimingSpan) -> Dict[str, Any]:
+        return {
+            "name": node.name,
+            "ms": round(node.total_ns / 1e6, 3),
+            "self_ms": round(node.self_ns / 1e6, 3),
+            "count": node.count,
+            "children": [self._span_dict(child) for child in node.children],
+        }
+
+    def render(self) -> str:
+        """Render the spans as a total/self-time tree."""
+        lines = [f"Timings: {self.total_ns / 1e6:.1f} ms"]
+        if self.roots:
+            lines.append(f"{'total':>12} {'self':>10}  phase")
+            lines.extend(
+                render_tree(
+                    self.roots,
+                    lambda node: f"{node.total_ns / 1e6:>9.1f} ms {node.self_ns / 1e6:>7.1f} ms",
+                )
+            )
+        return "\n".join(lines)
+
+
+def render_tree(roots: List[TimingSpan], columns: Callable[[TimingSpan], str]) -> List[str]:
+    """Render spans as tree lines, each prefixed by its columns.
+
+    Args:
+        roots: Top-level spans
+        columns: Formats the figures shown before a span's name
+    """
+    lines: List[str] = []
+
+    def visit(nodes: List[TimingSpan], prefix: str, nested: bool) -> None:
+        for i, node in enumerate(nodes):
+            last = i == len(nodes) - 1
+            branch = ("└─ " if last else "├─ ") if nested else ""
+            count = f" (x{node.count})" if node.count > 1 else ""
+            lines.append(f"{columns(node)}  {prefix}{branch}{node.name}{count}")
+            child_prefix = prefix + ("   " if last else "│  ") if nested else ""
+            visit(node.children, child_prefix, True)
+
+    visit(roots, "", False)
+    return lines
@@ -3,6 +3,7 @@ from peek_tool.formatters.base_text import BaseTextFormatter
 from peek_tool.formatters.python import PythonFormatter, TextFormatter
 from peek_tool.formatters.json import JsonFormatter, JsonTextFormatter
 from peek_tool.formatters.docstring import DocstringFormatter, DocstringTextFormatter
+from peek_tool.formatters.structured import StructuredFormatter, JsonOutputFormatter
 
 # Ensure formatters are registered
 __all__ = [
@@ -15,4 +16,6 @@ __all__ = [
     "JsonTextFormatter",
     "DocstringFormatter",
     "DocstringTextFormatter",
+    "StructuredFormatter",
+    "JsonOutputFormatter",
 ]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from typing import Dict, Iterator, Type
 
 from peek_tool.models.inspection_result import InspectionResult
 
@@ -12,6 +12,14 @@ class Formatter(ABC):
         """Format inspection results into a string."""
         pass
 
+    def stream(self, result: InspectionResult) -> Iterator[str]:
+        """Yield the formatted output in chunks.
+
+        The default implementation yields the complete output at once;
+        formatters can override this to encode very large results incrementally.
+        """
+        yield self.format(result)
+
 
 class FormatterFactory:
     """Factory for creating appropriate formatters based on format type."""
@@ -7,7 +7,9 @@ and formatting code examples.
 
 from typing import List
 
+from peek_tool.core.docstring_parser import DocstringParser
 from peek_tool.formatters.docstring.base import DocstringFormatter
+from peek_tool.models.docstring import DocstringItem, ParsedDocstring
 
 
 class DocstringTextFormatter(DocstringFormatter):
@@ -16,27 +18,15 @@ class DocstringTextFormatter(DocstringFormatter):
     This formatter improves the readability of docstrings by:
     - Normalizing indentation
     - Highlighting section headers (Args, Returns, etc.)
-    - Improving the formatting of code examples
+    - Rendering Google, NumPy, and reST sections in one consistent layout
     - Aligning parameter descriptions
+
+    The docstring is parsed once (and cached) by DocstringParser; rendering
+    works from the resulting structure rather than re-scanning the text.
     """
 
-    # Common section headers in docstrings
-    SECTION_HEADERS = [
-        "Args:",
-        "Arguments:",
-        "Parameters:",
-        "Returns:",
-        "Return:",
-        "Yields:",
-        "Raises:",
-        "Exceptions:",
-        "Example:",
-        "Examples:",
-        "Note:",
-        "Notes:",
-        "Warning:",
-        "Warnings:",
-    ]
+    # Indentation used for section bodies
+    SECTION_INDENT = " " * 4
 
     def format(self, docstring: str) -> str:
         """Format a docstring for improved readability.
@@ -51,115 +41,61 @@ class DocstringTextFormatter(DocstringFormatter):
         if not docstring:
             return "(No docstring available)"
 
-        # Normalize line endings
-        docstring = docstring.replace("\r\n", "\n")
-
-        # Split into lines for processing
-        lines = docstring.split("\n")
-
-        # Format the docstring
-        formatted_lines = self._process_lines(lines)
+        return self.format_parsed(DocstringParser.parse(docstring))
 
-        # Join lines back together
-        return "\n".join(formatted_lines)
-
-    def _process_lines(self, lines: List[str]) -> List[str]:
-        """Process docstring lines for formatting.
+    def format_parsed(self, parsed: ParsedDocstring) -> str:
+        """Format an already parsed docstring.
 
         Args:
-            lines: The docstring split into lines
+            parsed: The structured docstring
 
         Returns:
-            A list of processed lines with improved formatting
+            The rendered docstring text
         """
-        # Normalize indentation first
-        lines = self._normalize_indentation(lines)
-
-        # Format sections
-        formatted_lines = []
-        in_code_block = False
-        current_section = None
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            # Handle code block detection
-            if stripped.startswith("```") or stripped.startswith(":::"):
-                in_code_block = not in_code_block
-                formatted_lines.append(line)
-                continue
-
-            # Don't format content inside code blocks
-            if in_code_block:
-                formatted_lines.append(line)
-                continue
-
-            # Check for section headers
-            is_section_header = False
-            for header in self.SECTION_HEADERS:
-                if stripped == header or stripped.startswith(f"{header} "):
-                    current_section = header.rstrip(":")
-                    is_section_header = True
-                    # Add extra spacing before sections (except the first line)
-                    if i > 0 and formatted_lines and formatted_lines[-1].strip():
-                        formatted_lines.append("")
-                    formatted_lines.append(line)
-                    break
-
-            if is_section_header:
-                continue
-
-            # Handle parameter descriptions in Args sections
-            if (
-                current_section in ["Args", "Arguments", "Parameters"]
-                and stripped
-                and ":" in stripped
-            ):
-                # This is likely a parameter description
-                param_parts = stripped.split(":", 1)
-                if len(param_parts) == 2 and not param_parts[0].strip().startswith(
-                    "- "
-                ):
-                    param_name = param_parts[0].strip()
-                    param_desc = param_parts[1].strip()
-                    formatted_lines.append(f"    {param_name}: {param_desc}")
-                    continue
-
-            # Add normal line
-            formatted_lines.append(line)
-
-        return formatted_lines
-
-    def _normalize_indentation(self, lines: List[str]) -> List[str]:
-        """Normalize the indentation in a docstring.
+        blocks = []
+
+        if parsed.summary:
+            blocks.append(parsed.summary)
+        if parsed.description:
+            blocks.append(parsed.description)
+
+        for section in parsed.sections:
+            lines: List[str] = []
+            if section.title:
+                lines.append(f"{section.title}:")
+                indent = self.SECTION_INDENT
+            else:
+                indent = ""
 
-        Args:
-            lines: The docstring split into lines
+            if section.items:
+                for item in section.items:
+                    lines.extend(self._format_item(item, indent))
+            elif section.text:
+                lines.extend(
+                    f"{indent}{line}" if line else "" for line in section.text.split("\n")
+                )
 
-        Returns:
-            Lines with normalized indentation
-        """
-        # Find the minimum indentation of non-empty lines
-        indentation_levels = []
-        for line in lines:
-            if line.strip():  # Skip empty lines
-                # Count leading spaces
-                indent = len(line) - len(line.lstrip())
-                indentation_levels.append(indent)
-
-        # If no non-empty lines, return original
-        if not indentation_levels:
-            return lines
-
-        # Calculate common indentation to remove
-        min_indent = min(indentation_levels)
-
-        # Remove the common indentation from all lines
-        normalized_lines = []
-        for line in lines:
-            if line.strip():  # Only process non-empty lines
-                normalized_lines.append(line[min_indent:])
-            else:
-                normalized_lines.append("")  # Keep empty lines as empty
+            blocks.append("\n".join(lines))
+
+        if not blocks:
+            return "(No docstring available)"
 
-        return normalized_lines
+        return "\n\n".join(blocks)
+
+    def _format_item(self, item: DocstringItem, indent: str) -> List[str]:
+        """Format a single section entry as 'name (type): description'."""
+        if item.name and item.type_annotation:
+            head = f"{item.name} ({item.type_annotation})"
+        else:
+            head = item.name or item.type_annotation or ""
+
+        description = item.description.split("\n") if item.description else []
+        if not head:
+            return [f"{indent}{line}" if line else "" for line in description]
+
+        first = f"{indent}{head}: {description[0]}" if description else f"{indent}{head}"
+        continuation = [
+            f"{indent}{self.SECTION_INDENT}{line}" if line else ""
+            for line in description[1:]
+        ]
+        return [first.rstrip(), *continuation]
@@ -1,10 +1,13 @@
 from abc import abstractmethod
-from typing import List
+from typing import List, Optional, Sequence, Tuple, TypeVar, Union
 
 from peek_tool.formatters.base_text import BaseTextFormatter
+from peek_tool.formatters.docstring.text import DocstringTextFormatter
 from peek_tool.models.python_element import Module, Class, Method, Parameter
 from peek_tool.models.inspection_result import InspectionResult
 
+T = TypeVar("T")
+
 
 class PythonFormatter(BaseTextFormatter):
     """Base class for Python-specific formatters.
@@ -17,6 +20,12 @@ class PythonFormatter(BaseTextFormatter):
     MAX_DOCSTRING_LINES = 8
     MAX_FUNCTION_DOCSTRING_LINES = 15
 
+    # Maximum classes, functions, or methods listed per section (None for all)
+    MAX_LISTED_MEMBERS: Optional[int] = None
+
+    # Whether imported names are listed (otherwise only counted)
+    SHOW_IMPORTED = True
+
     def _format_content(self, result: InspectionResult, output: List[str]) -> None:
         """Format Python inspection result elements."""
         for element in result.elements:
@@ -27,6 +36,26 @@ class PythonFormatter(BaseTextFormatter):
             elif isinstance(element, Method):
                 self._format_method(element, output, indent=0)
 
+    def _render_docstring(self, element: Union[Module, Class, Method]) -> str:
+        """Render an element's docstring from its parsed structure when available."""
+        if element.parsed_docstring is not None:
+            return DocstringTextFormatter().format_parsed(element.parsed_docstring)
+        return element.docstring or ""
+
+    def _is_inherited(self, method: Method, class_obj: Class) -> bool:
+        """Check whether a class method is defined by a base class."""
+        return bool(
+            method.defined_in
+            and class_obj.qualified_name
+            and method.defined_in != class_obj.qualified_name
+        )
+
+    def _limit_members(self, members: Sequence[T]) -> Tuple[Sequence[T], int]:
+        """Apply MAX_LISTED_MEMBERS, returning the members to show and the hidden count."""
+        if self.MAX_LISTED_MEMBERS is None or len(members) <= self.MAX_LISTED_MEMBERS:
+            return members, 0
+        return members[: self.MAX_LISTED_MEMBERS], len(members) - self.MAX_LISTED_MEMBERS
+
     def _truncate_docstring(self, docstring: str, max_lines: int) -> str:
         """Truncate a docstring to a maximum number of lines."""
         if not docstring:
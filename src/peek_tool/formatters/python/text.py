@@ -13,7 +13,7 @@ class TextFormatter(PythonFormatter):
         # Module docstring (truncated)
         if module.docstring:
             truncated_doc = self._truncate_docstring(
-                module.docstring, self.MAX_DOCSTRING_LINES
+                self._render_docstring(module), self.MAX_DOCSTRING_LINES
             )
             output.append(f"Description: {truncated_doc}")
             output.append("")
@@ -30,6 +30,7 @@ class TextFormatter(PythonFormatter):
         if local_classes:
             output.append("Classes:")
             output.append("-" * 7)
+            local_classes, hidden = self._limit_members(local_classes)
             for class_obj in local_classes:
                 # Simplified class listing at module level
                 indentation = " " * 2
@@ -38,6 +39,8 @@ class TextFormatter(PythonFormatter):
                     base_classes_str = ", ".join(class_obj.base_classes)
                     class_decl += f"({base_classes_str})"
                 output.append(class_decl)
+            if hidden:
+                output.append(f"  ... ({hidden} more classes)")
             output.append("")
 
         # Get directly defined functions (not imported)
@@ -45,6 +48,7 @@ class TextFormatter(PythonFormatter):
         if local_functions:
             output.append("Functions:")
             output.append("-" * 9)
+            local_functions, hidden = self._limit_members(local_functions)
             for function in local_functions:
                 # Simplified function listing at module level
                 indentation = " " * 2
@@ -55,6 +59,8 @@ class TextFormatter(PythonFormatter):
                 if function.return_type:
                     signature += f" -> {function.return_type}"
                 output.append(signature)
+            if hidden:
+                output.append(f"  ... ({hidden} more functions)")
             output.append("")
 
         # Group imported classes by source module
@@ -75,6 +81,17 @@ class TextFormatter(PythonFormatter):
                     imported_functions[source] = []
                 imported_functions[source].append(function.name)
 
+        if not self.SHOW_IMPORTED:
+            for label, groups in (
+                ("Imported Classes", imported_classes),
+                ("Imported Functions", imported_functions),
+            ):
+                if groups:
+                    count = sum(len(names) for names in groups.values())
+                    output.append(f"{label}: {count} from {len(groups)} module(s)")
+                    output.append("")
+            return
+
         # Show imported classes
         if imported_classes:
             output.append("Imported Classes:")
@@ -115,13 +132,25 @@ class TextFormatter(PythonFormatter):
                 if indent == 0
                 else self.MAX_DOCSTRING_LINES
             )
-            truncated_doc = self._truncate_docstring(class_obj.docstring, max_lines)
+            truncated_doc = self._truncate_docstring(
+                self._render_docstring(class_obj), max_lines
+            )
             output.append(f"{indentation}  Description: {truncated_doc}")
 
+        # Split own methods from inherited ones, grouped by defining class
+        own_methods = []
+        inherited = {}
+        for method in class_obj.methods:
+            if self._is_inherited(method, class_obj):
+                inherited.setdefault(method.defined_in, []).append(method.name)
+            else:
+                own_methods.append(method)
+
         # Class methods
-        if class_obj.methods:
+        if own_methods:
             output.append(f"{indentation}  Methods:")
-            for method in class_obj.methods:
+            own_methods, hidden = self._limit_members(own_methods)
+            for method in own_methods:
                 method_indentation = " " * (indent + 4)
 
                 # Format method signature with parameters
@@ -139,6 +168,13 @@ class TextFormatter(PythonFormatter):
                     method_sig += f" [imported from {method.import_source}]"
 
                 output.append(f"{method_indentation}{method_sig}")
+            if hidden:
+                output.append(f"{indentation}    ... ({hidden} more methods)")
+
+        # Inherited methods are collapsed to their names
+        for defined_in, names in inherited.items():
+            output.append(f"{indentation}  Inherited from {defined_in}:")
+            output.append(f"{indentation}    " + ", ".join(names))
 
         output.append("")  # Add an empty line after the class
 
@@ -166,7 +202,9 @@ class TextFormatter(PythonFormatter):
         # This means methods in classes won't show docstrings by default
         if method.docstring and indent == 0:
             max_lines = self.MAX_FUNCTION_DOCSTRING_LINES
-            truncated_doc = self._truncate_docstring(method.docstring, max_lines)
+            truncated_doc = self._truncate_docstring(
+                self._render_docstring(method), max_lines
+            )
             output.append(f"{indentation}  Description: {truncated_doc}")
 
         output.append("")  # Add an empty line after the method
@@ -0,0 +1,10 @@
+"""Structured (machine-readable) formatters for the peek tool.
+
+These formatters serialize InspectionResult models directly instead of
+rendering them as human-readable text.
+"""
+
+from peek_tool.formatters.structured.base import StructuredFormatter, SCHEMA_VERSION
+from peek_tool.formatters.structured.json_output import JsonOutputFormatter
+
+__all__ = ["StructuredFormatter", "JsonOutputFormatter", "SCHEMA_VERSION"]
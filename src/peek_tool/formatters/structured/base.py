@@ -0,0 +1,65 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Tuple, Type
+
+from peek_tool.formatters.base import Formatter
+from peek_tool.models.inspection_result import InspectionResult
+from peek_tool.models.json_element import JsonElement, JsonRootElement
+from peek_tool.models.python_element import Module, Class, Method
+
+# Version of the serialized layout. Bump when fields are renamed or removed;
+# adding new fields is backwards compatible and does not require a bump.
+SCHEMA_VERSION = 1
+
+# Tags identifying the model type of each top-level element
+ELEMENT_KINDS: Dict[Type, str] = {
+    Module: "module",
+    Class: "class",
+    Method: "method",
+    JsonRootElement: "json_root",
+    JsonElement: "json_element",
+}
+
+# Cache of dataclass field names, in declaration order
+_FIELD_NAMES: Dict[Type, Tuple[str, ...]] = {}
+
+
+class StructuredFormatter(Formatter):
+    """Base class for formatters that serialize the result models directly.
+
+    Output has the layout::
+
+        {"schema_version": 1, "name": ..., "type": ..., "metadata": {...},
+         "elements": [{"kind": "module", ...model fields...}, ...]}
+    """
+
+    def envelope(self, result: InspectionResult) -> Dict[str, Any]:
+        """Return the top-level fields of the serialized result (without elements)."""
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "name": result.name,
+            "type": result.type,
+            "metadata": result.metadata,
+        }
+
+    def element_kind(self, element: Any) -> str:
+        """Return the kind tag for a top-level element."""
+        return ELEMENT_KINDS.get(type(element), type(element).__name__.lower())
+
+
+def shallow_fields(obj: Any) -> Dict[str, Any]:
+    """Convert one level of a dataclass into a dict (nested values are left as-is)."""
+    cls = type(obj)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls))
+        _FIELD_NAMES[cls] = names
+    return {name: getattr(obj, name) for name in names}
+
+
+def default_encoder(obj: Any) -> Any:
+    """Fallback encoder for values the JSON encoder does not handle natively."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return shallow_fields(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
@@ -0,0 +1,75 @@
+import json
+from typing import Any, Iterator
+
+from peek_tool.formatters.base import FormatterFactory
+from peek_tool.formatters.structured.base import (
+    StructuredFormatter,
+    default_encoder,
+    shallow_fields,
+)
+from peek_tool.models.inspection_result import InspectionResult
+
+try:  # orjson is optional; it is several times faster than the stdlib encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class JsonOutputFormatter(StructuredFormatter):
+    """Serialize inspection results as JSON.
+
+    Uses orjson when it is installed and falls back to the standard library
+    encoder otherwise. Both produce the same document layout.
+    """
+
+    def format(self, result: InspectionResult) -> str:
+        """Serialize the complete result to a JSON string."""
+        return "".join(self.stream(result))
+
+    def stream(self, result: InspectionResult) -> Iterator[str]:
+        """Yield the JSON document in chunks, one element at a time.
+
+        Only one element is encoded at a time, so the full document never
+        has to be held in memory. With the stdlib encoder each element is
+        itself encoded incrementally.
+        """
+        head = self._dumps(self.envelope(result))
+        yield head[:-1] + ',"elements":['
+
+        for i, element in enumerate(result.elements):
+            if i:
+                yield ","
+            yield from self._encode_element(element)
+
+        yield "]}"
+
+    def _encode_element(self, element: Any) -> Iterator[str]:
+        """Encode a top-level element with its kind tag as the first key."""
+        kind = self.element_kind(element)
+
+        if orjson is not None:
+            body = orjson.dumps(
+                element, default=default_encoder, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+            yield f'{{"kind":"{kind}",' + body[1:]
+            return
+
+        tagged = {"kind": kind, **shallow_fields(element)}
+        encoder = json.JSONEncoder(
+            default=default_encoder, separators=(",", ":"), ensure_ascii=False
+        )
+        yield from encoder.iterencode(tagged)
+
+    def _dumps(self, value: Any) -> str:
+        """Encode a small value in one go."""
+        if orjson is not None:
+            return orjson.dumps(
+                value, default=default_encoder, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        return json.dumps(
+            value, default=default_encoder, separators=(",", ":"), ensure_ascii=False
+        )
+
+
+# Register the formatter
+FormatterFactory.register("json", JsonOutputFormatter)
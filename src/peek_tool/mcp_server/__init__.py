@@ -4,7 +4,13 @@ This package provides an MCP server that exposes peek functionality
 through the Model Context Protocol, allowing LLMs to inspect Python modules.
 """
 
+import anyio
+import uvicorn
 from mcp.server.fastmcp import FastMCP
+from starlette.routing import Route
+
+from peek_tool.mcp_server.config import build_options, set_options
+from peek_tool.models.command_options import McpServerOptions
 
 server = FastMCP(
     name="Peek",
@@ -15,6 +21,8 @@ server = FastMCP(
 import peek_tool.mcp_server.tools  # noqa: F401, E402
 import peek_tool.mcp_server.resources  # noqa: F401, E402
 import peek_tool.mcp_server.prompts  # noqa: F401, E402
+from peek_tool.mcp_server.tools import SCHEDULER  # noqa: E402
+from peek_tool.mcp_server.warmup import start_preload  # noqa: E402
 
 __all__ = ["server"]
 
@@ -31,9 +39,81 @@ def main():
         default="stdio",
         help="Transport protocol to use (default: stdio)",
     )
+    parser.add_argument(
+        "--python",
+        default=None,
+        help="Inspect Python targets with this interpreter (e.g. a project venv's bin/python)",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="TARGET",
+        help="Module or JSON file to load in the background after start-up (repeatable)",
+    )
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="TOML file with server options and a [preload] list",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="After serving a module, load its classes and submodules while idle",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Tool calls running at once (default: 4)",
+    )
+    parser.add_argument(
+        "--max-per-client",
+        type=int,
+        default=None,
+        help="Tool calls one client may have running at once (default: 2)",
+    )
 
     args = parser.parse_args()
-    server.run(transport=args.transport)
+    try:
+        options = build_options(
+            args.transport,
+            args.python,
+            args.preload,
+            args.config,
+            args.prefetch,
+            args.workers,
+            args.max_per_client,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    run(options)
+
+
+def run(options: McpServerOptions) -> None:
+    """Run the server, preloading the configured targets in the background."""
+    set_options(options)
+    SCHEDULER.configure(options.workers, options.max_per_client)
+    start_preload(options.preload)
+    if options.transport == "sse":
+        anyio.run(_run_sse)
+    else:
+        server.run(transport=options.transport)
+
+
+async def _run_sse() -> None:
+    """Serve the SSE transport, with the server metrics at GET /metrics."""
+    from peek_tool.mcp_server.metrics import metrics_endpoint
+
+    app = server.sse_app()
+    app.router.routes.append(Route("/metrics", endpoint=metrics_endpoint, methods=["GET"]))
+    config = uvicorn.Config(
+        app,
+        host=server.settings.host,
+        port=server.settings.port,
+        log_level=server.settings.log_level.lower(),
+    )
+    await uvicorn.Server(config).serve()
 
 
 # Make the module callable for the entry point
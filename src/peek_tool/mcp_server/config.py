@@ -0,0 +1,104 @@
+"""Start-up options of the MCP server.
+
+The options are set once by the entry point (``peek-mcp`` or ``peek mcp
+server``) before the server runs, and read by the tools on each call. They
+can come from the command line and from a TOML config file::
+
+    python = "/path/to/project/.venv/bin/python"
+    prefetch = true
+    workers = 4         # Tool calls running at once
+    max_per_client = 2  # Tool calls one client may have running at once
+
+    [preload]
+    modules = ["django.db.models", "numpy"]
+    files = ["fixtures/schema.json"]  # Relative to the config file
+
+Command-line values take precedence; preload lists are combined.
+"""
+
+import os
+import tomllib
+from typing import Optional, Sequence
+
+from peek_tool.models.command_options import McpServerOptions
+
+_options = McpServerOptions()
+
+
+def get_options() -> McpServerOptions:
+    """Return the options the server was started with."""
+    return _options
+
+
+def set_options(options: McpServerOptions) -> None:
+    """Replace the server options (call before the server starts)."""
+    global _options
+    _options = options
+
+
+def build_options(
+    transport: str = "stdio",
+    python: Optional[str] = None,
+    preload: Sequence[str] = (),
+    config: Optional[str] = None,
+    prefetch: bool = False,
+    workers: Optional[int] = None,
+    max_per_client: Optional[int] = None,
+) -> McpServerOptions:
+    """Combine command-line options with a config file.
+
+    Raises:
+        ValueError: If the config file cannot be read or has invalid values
+    """
+    settings = load_config(config) if config else McpServerOptions()
+    if (workers is not None and workers < 1) or (
+        max_per_client is not None and max_per_client < 1
+    ):
+        raise ValueError("--workers and --max-per-client must be at least 1")
+    return McpServerOptions(
+        transport=transport,
+        python=python or settings.python,
+        preload=tuple(dict.fromkeys(list(settings.preload) + list(preload))),
+        prefetch=prefetch or settings.prefetch,
+        workers=workers or settings.workers,
+        max_per_client=max_per_client or settings.max_per_client,
+    )
+
+
+def load_config(path: str) -> McpServerOptions:
+    """Read server options from a TOML config file.
+
+    Raises:
+        ValueError: If the file cannot be read or has invalid values
+    """
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise ValueError(f"Could not read config file {path}: {e}")
+
+    preload = data.get("preload", {})
+    modules = preload.get("modules", [])
+    files = preload.get("files", [])
+    python = data.get("python")
+    prefetch = data.get("prefetch", False)
+    limits = {
+        name: data.get(name, getattr(McpServerOptions, name))
+        for name in ("workers", "max_per_client")
+    }
+    if not all(isinstance(name, str) for name in modules + files):
+        raise ValueError(f"{path}: preload modules and files must be lists of strings")
+    if python is not None and not isinstance(python, str):
+        raise ValueError(f"{path}: python must be a string")
+    if not isinstance(prefetch, bool):
+        raise ValueError(f"{path}: prefetch must be true or false")
+    for name, value in limits.items():
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"{path}: {name} must be a positive integer")
+
+    # Relative paths are relative to the config file, not the working directory
+    base = os.path.dirname(os.path.abspath(path))
+    files = [os.path.normpath(os.path.join(base, name)) for name in files]
+    return McpServerOptions(
+        python=python, preload=tuple(modules + files), prefetch=prefetch, **limits
+    )
@@ -0,0 +1,117 @@
+"""Metrics of the running MCP server, for scraping by Prometheus.
+
+Served as the ``mcp://peek/metrics`` resource and, with the SSE transport, at
+``GET /metrics``. Tool call latencies are recorded as calls complete; caches,
+the scheduler, worker pools, and memory are sampled when the metrics are read.
+"""
+
+import os
+import time
+from typing import List
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from peek_tool.core.interpreter_pool import InterpreterPool
+from peek_tool.core.metrics import CONTENT_TYPE, INSPECTION_SECONDS, rss_bytes, sample_lines
+from peek_tool.core.pagination import Paginator
+from peek_tool.mcp_server.tools import OUTPUT_CACHE, PREFETCHER, SCHEDULER, TOOL_SECONDS
+
+_STARTED = time.time()
+
+
+def render_metrics() -> str:
+    """Render all server metrics in the Prometheus text format."""
+    lines: List[str] = []
+    lines += TOOL_SECONDS.collect()
+    lines += INSPECTION_SECONDS.collect()
+    lines += _cache_metrics()
+    lines += _scheduler_metrics()
+    lines += _pool_metrics()
+    lines += _process_metrics()
+    return "\n".join(lines) + "\n"
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve the metrics over HTTP (the SSE transport's /metrics route)."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
+def _cache_metrics() -> List[str]:
+    caches = {"output": OUTPUT_CACHE.stats(), "pages": Paginator.cache.stats()}
+
+    def each(field: str):
+        return [({"cache": name}, stats[field]) for name, stats in caches.items()]
+
+    lines: List[str] = []
+    for field, description in [
+        ("hits", "Lookups answered from the cache"),
+        ("misses", "Lookups not answered from the cache"),
+        ("evictions", "Entries evicted to stay within the cache budget"),
+        ("expirations", "Entries dropped after their time-to-live"),
+    ]:
+        lines += sample_lines(f"peek_cache_{field}_total", description, "counter", each(field))
+    lines += sample_lines("peek_cache_entries", "Entries in the cache", "gauge", each("entries"))
+    lines += sample_lines("peek_cache_bytes", "Size of the cached entries", "gauge", each("bytes"))
+    lines += sample_lines(
+        "peek_prefetch_hits_total",
+        "Prefetched targets that were requested afterwards",
+        "counter",
+        [({}, PREFETCHER.hits)],
+    )
+    return lines
+
+
+def _scheduler_metrics() -> List[str]:
+    stats = SCHEDULER.stats()
+    lines: List[str] = []
+    for name, metric_type, value, description in [
+        ("running", "gauge", stats["running"], "Tool calls running in worker threads"),
+        ("queued", "gauge", stats["queued"], "Tool calls waiting for a worker"),
+        ("max_workers", "gauge", stats["max_workers"], "Tool calls that may run at once"),
+        ("admitted_total", "counter", stats["admitted"], "Tool calls given a worker"),
+        ("fast_lane_total", "counter", stats["fast_lane"], "Tool calls run without a worker"),
+        ("rejected_total", "counter", stats["rejected"], "Tool calls rejected (queue full)"),
+        ("timed_out_total", "counter", stats["timed_out"], "Tool calls that waited too long"),
+        ("wait_seconds_total", "counter", stats["wait_seconds_total"], "Time spent queued"),
+    ]:
+        lines += sample_lines(f"peek_scheduler_{name}", description, metric_type, [({}, value)])
+    return lines
+
+
+def _pool_metrics() -> List[str]:
+    pools = InterpreterPool.stats()
+    lines: List[str] = []
+    for field, description in [
+        ("workers", "Worker processes started for an interpreter (--python)"),
+        ("busy", "Worker processes inspecting a target"),
+        ("max_workers", "Worker processes an interpreter may have"),
+    ]:
+        lines += sample_lines(
+            f"peek_pool_{field}",
+            description,
+            "gauge",
+            [({"python": python}, stats[field]) for python, stats in pools.items()],
+        )
+    return lines
+
+
+def _process_metrics() -> List[str]:
+    lines = sample_lines(
+        "process_start_time_seconds",
+        "Start time of the process since the Unix epoch",
+        "gauge",
+        [({}, _STARTED)],
+    )
+    rss = rss_bytes()
+    if rss is not None:
+        lines += sample_lines(
+            "process_resident_memory_bytes", "Resident memory size", "gauge", [({}, rss)]
+        )
+    lines += sample_lines(
+        "process_cpu_seconds_total",
+        "User and system CPU time used by the process",
+        "counter",
+        [({}, sum(os.times()[:2]))],
+    )
+    return lines
@@ -3,7 +3,57 @@
 This module contains the resource definitions used by the peek MCP server.
 """
 
+import json
+
 from peek_tool.mcp_server import server
+from peek_tool.mcp_server.metrics import render_metrics
+from peek_tool.mcp_server.tools import PREFETCHER, SCHEDULER
+from peek_tool.mcp_server.warmup import preload_status
+
+
+@server.resource("mcp://peek/preload")
+def preload_resource() -> str:
+    """Progress and timings of the start-up preload.
+
+    Lists each target named by --preload or the config file with its status
+    (pending, loading, done, failed) and how long it took to load.
+    """
+    status = preload_status()
+    if status is None:
+        return json.dumps({"total": 0, "done": 0, "targets": []})
+    return json.dumps(status.as_dict(), indent=2)
+
+
+@server.resource("mcp://peek/prefetch")
+def prefetch_resource() -> str:
+    """Speculative prefetch statistics (--prefetch).
+
+    Counts the targets loaded, cancelled by incoming requests, and dropped for
+    exceeding the budget, and how many prefetched targets were requested
+    afterwards (the hit rate).
+    """
+    return json.dumps(PREFETCHER.stats(), indent=2)
+
+
+@server.resource("mcp://peek/scheduler")
+def scheduler_resource() -> str:
+    """Tool call scheduling: running and queued calls per client and wait times.
+
+    Also counts calls served in the fast lane (cache hits, cursors, small JSON
+    files), rejected because the queue was full, and timed out while queued.
+    """
+    return json.dumps(SCHEDULER.stats(), indent=2)
+
+
+@server.resource("mcp://peek/metrics", mime_type="text/plain")
+def metrics_resource() -> str:
+    """Server metrics in the Prometheus text format.
+
+    Tool call and inspection latency histograms, cache hits, misses and
+    evictions, scheduler and worker pool utilization, and resident memory.
+    With the SSE transport the same metrics are served at GET /metrics.
+    """
+    return render_metrics()
 
 
 @server.resource("mcp://peek/help")
@@ -28,6 +78,17 @@ inspect_module(target="json.dumps")  # Inspect a function
 inspect_module(target="json.JSONEncoder.encode")  # Inspect a method
 ```
 
+## Large Outputs
+
+Pass `page` or `page_size` to read a large result in pages. Each page ends with
+a `next_cursor`; pass it back as `cursor` to get the next page from the cached
+output without inspecting again:
+
+```python
+inspect_module(target="numpy", page=1)  # First page (8000 characters)
+inspect_module(target="numpy", cursor="3f2a9c1b0d4e5f67-2")  # Next page
+```
+
 ## Inspect a JSON File
 
 Use the `inspect_module` tool with a JSON file path:
@@ -37,6 +98,43 @@ inspect_module(target="/path/to/file.json")  # Inspect a JSON file
 inspect_module(target="/path/to/file.json:path.to.element")  # Inspect a specific element
 ```
 
+## Inspect a Wheel or Sdist
+
+Packages can be inspected from their archive without installing them (the
+source is parsed, never imported):
+
+```python
+inspect_module(target="/path/to/pkg-1.0-py3-none-any.whl")  # Package summary and modules
+inspect_module(target="/path/to/pkg-1.0.tar.gz:pkg.client.Client")  # A class in an sdist
+```
+
+## Search Docstrings
+
+Use the `search_docstrings` tool to find APIs across a whole package:
+
+```python
+search_docstrings(package="requests", query="retry")  # Ranked word search
+search_docstrings(package="json", query="decode.*error", regex=True)  # Regex search
+```
+
+## View Source Code
+
+Use the `inspect_source` tool to read the source of a definition:
+
+```python
+inspect_source(target="json.dumps")  # Source of a function
+inspect_source(target="json.decoder", lines="1:40")  # A line range of a module
+```
+
+## Find References
+
+Use the `find_references` tool to see where a symbol is used in a project:
+
+```python
+find_references(symbol="json.dumps", root="/path/to/project")  # All uses
+find_references(symbol="mypkg.Base", root=".", kind="base")  # Subclasses
+```
+
 ## Parameters
 
 - `target`: The Python module, class, function, method, or JSON file path to inspect
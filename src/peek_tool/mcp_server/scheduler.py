@@ -0,0 +1,249 @@
+"""Fair scheduling of tool calls across MCP clients.
+
+Several clients (e.g. IDE sessions sharing one SSE server) can call tools at
+the same time. Blocking tool work runs in worker threads, at most
+``max_workers`` at once and at most ``max_per_client`` per client; further
+calls wait in per-client queues that are served round-robin, so a client
+crawling a huge package cannot starve the others.
+
+Calls known to be cheap (cache hits, cursors, small JSON files) take the
+fast lane: they run at once on the event loop without a worker slot. When
+too many calls are queued, new ones are rejected instead of queued
+(backpressure), and a call that waits longer than the queue timeout fails.
+
+Work runs with a ``CancellationToken``: when a call is cancelled (e.g. by the
+client) the token is cancelled, and the worker slot stays taken until the
+work stops at its next checkpoint.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+import anyio
+
+from peek_tool.core.cancellation import CancellationToken
+
+T = TypeVar("T")
+
+# Tool calls running in worker threads at once
+MAX_WORKERS = 4
+
+# Tool calls one client may have running at once
+MAX_PER_CLIENT = 2
+
+# Tool calls that may wait for a worker before new ones are rejected
+MAX_QUEUE = 64
+
+# Seconds a tool call may wait for a worker
+QUEUE_TIMEOUT = 60.0
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when a tool call is rejected or waits too long for a worker."""
+
+
+class RequestScheduler:
+    """Admit tool calls to worker threads fairly across clients.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        max_per_client: int = MAX_PER_CLIENT,
+        max_queue: int = MAX_QUEUE,
+        queue_timeout: float = QUEUE_TIMEOUT,
+    ):
+        """Create a scheduler.
+
+        Args:
+            max_workers: Tool calls running at once
+            max_per_client: Tool calls one client may have running at once
+            max_queue: Waiting calls beyond which new calls are rejected
+            queue_timeout: Seconds a call may wait for a worker
+        """
+        self.max_workers = max_workers
+        self.max_per_client = max_per_client
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        # Client -> waiting calls (future, time queued), in round-robin order
+        self._waiting: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {}
+        self._running: Dict[str, int] = {}
+        self._queued = 0
+
+        self.admitted = 0
+        self.fast_lane = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def configure(self, max_workers: int, max_per_client: int) -> None:
+        """Change the concurrency limits (before the server starts)."""
+        if max_workers < 1 or max_per_client < 1:
+            raise ValueError("Worker limits must be at least 1")
+        self.max_workers = max_workers
+        self.max_per_client = max_per_client
+
+    async def run(
+        self,
+        client: str,
+        work: Callable[[], T],
+        fast: bool = False,
+        token: Optional[CancellationToken] = None,
+    ) -> T:
+        """Run blocking work for a client once a worker is free.
+
+        Args:
+            client: Identifies the calling client (for per-client limits)
+            work: The blocking work
+            fast: Run at once on the event loop (only for cheap work)
+            token: Checked by the work's checkpoints; cancelled if the call is
+                cancelled (not used in the fast lane)
+
+        Returns:
+            The result of the work
+
+        Raises:
+            ServerBusyError: If the queue is full or the wait times out
+        """
+        if fast:
+            self.fast_lane += 1
+            return work()
+
+        await self._acquire(client)
+        try:
+            return await _run_in_thread(work, token or CancellationToken())
+        finally:
+            self._release(client)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, running calls, and wait times."""
+        clients = set(self._waiting) | {c for c, n in self._running.items() if n}
+        return {
+            "running": sum(self._running.values()),
+            "queued": self._queued,
+            "max_workers": self.max_workers,
+            "max_per_client": self.max_per_client,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "fast_lane": self.fast_lane,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": (
+                round(self.wait_seconds_total / self.wait_count, 6) if self.wait_count else 0.0
+            ),
+            "clients": {
+                client: {
+                    "running": self._running.get(client, 0),
+                    "queued": len(self._waiting.get(client, ())),
+                }
+                for client in sorted(clients)
+            },
+        }
+
+    async def _acquire(self, client: str) -> None:
+        """Wait for a worker slot."""
+        if not self._waiting and self._has_slot(client):
+            self._start(client, 0.0)
+            return
+
+        if self._queued >= self.max_queue:
+            self.rejected += 1
+            raise ServerBusyError(
+                f"Server busy: {self._queued} requests are queued; retry later"
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(client, deque()).append((future, time.monotonic()))
+        self._queued += 1
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot was granted as the wait ended; hand it on
+                self._release(client)
+            else:
+                self._discard(client, future)
+            if isinstance(e, asyncio.TimeoutError):
+                self.timed_out += 1
+                raise ServerBusyError(
+                    f"Timed out after {self.queue_timeout:g}s waiting for a worker"
+                )
+            raise
+
+    def _release(self, client: str) -> None:
+        self._running[client] -= 1
+        if not self._running[client]:
+            del self._running[client]
+        self._dispatch()
+
+    def _has_slot(self, client: str) -> bool:
+        return (
+            sum(self._running.values()) < self.max_workers
+            and self._running.get(client, 0) < self.max_per_client
+        )
+
+    def _start(self, client: str, waited: float) -> None:
+        self._running[client] = self._running.get(client, 0) + 1
+        self.admitted += 1
+        self.wait_count += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiting calls, one client at a time in turn."""
+        while self._waiting and sum(self._running.values()) < self.max_workers:
+            client = next((c for c in self._waiting if self._has_slot(c)), None)
+            if client is None:
+                return
+
+            queue = self._waiting.pop(client)
+            future, queued_at = queue.popleft()
+            self._queued -= 1
+            if queue:
+                # Back of the line until the other clients have had a turn
+                self._waiting[client] = queue
+            if future.done():
+                continue
+
+            self._start(client, time.monotonic() - queued_at)
+            future.set_result(None)
+
+    def _discard(self, client: str, future: asyncio.Future) -> None:
+        """Remove a call that stopped waiting."""
+        queue = self._waiting.get(client)
+        for entry in list(queue or ()):
+            if entry[0] is future:
+                queue.remove(entry)
+                self._queued -= 1
+        if queue is not None and not queue:
+            del self._waiting[client]
+
+
+async def _run_in_thread(work: Callable[[], T], token: CancellationToken) -> T:
+    """Run work in a worker thread, cancelling the token if the caller is cancelled.
+
+    A cancelled caller returns only once the work has stopped, so its worker
+    slot is not handed on while the thread is still busy.
+    """
+    future = asyncio.get_running_loop().run_in_executor(None, token.run, work)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        token.cancel()
+        with anyio.CancelScope(shield=True):
+            try:
+                await future
+            except Exception:
+                pass
+        raise
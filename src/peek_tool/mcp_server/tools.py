@@ -1,62 +1,498 @@
 """MCP server tools for peek-tool."""
 
-from typing import Optional, Annotated
+import asyncio
+import functools
+import json
+import os
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Annotated,
+    Awaitable,
+    Callable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from pydantic import Field
 
 from mcp.server.fastmcp import Context
 
 from peek_tool.core.base import InspectorFactory
+from peek_tool.core.cancellation import CancellationToken
+from peek_tool.core.crawler import PackageCrawler
+from peek_tool.core.docstring_search import DocstringSearcher
 from peek_tool.core.docstring_utils import DocstringExtractor
+from peek_tool.core.import_profiler import ImportProfiler
+from peek_tool.core.metrics import Histogram
+from peek_tool.core.pagination import Paginator
+from peek_tool.core.prefetch import Prefetcher
+from peek_tool.core.result_cache import ResultCache
+from peek_tool.core.reference_index import ReferenceFinder
+from peek_tool.core.source_index import SourceViewer
+from peek_tool.core.timings import TimingRecorder
+from peek_tool.formatters.structured.base import SCHEMA_VERSION
+from peek_tool.models.inspection_filters import InspectionFilters
 from peek_tool.mcp_server import server
+from peek_tool.mcp_server.config import get_options
+from peek_tool.mcp_server.scheduler import RequestScheduler
+
+T = TypeVar("T")
+
+# Complete inspect_module outputs, filled by requests and by preloading
+OUTPUT_CACHE: ResultCache[str] = ResultCache(
+    max_entries=256, max_bytes=64 * 1024 * 1024, ttl=3600.0
+)
+
+# Admits blocking tool work to worker threads (limits set by the entry point)
+SCHEDULER = RequestScheduler()
+
+# Tool call latency, by tool and outcome (ok, error, cancelled)
+TOOL_SECONDS = Histogram(
+    "peek_tool_call_seconds", "Time to answer a tool call", ["tool", "outcome"]
+)
+
+# Whether the current tool call failed, set by _mark_failed()
+_call_failed: ContextVar[bool] = ContextVar("peek_tool_call_failed", default=False)
+
+# JSON files up to this size are parsed without waiting for a worker
+SMALL_FILE_BYTES = 256 * 1024
+
+
+def _foreground(tool: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Pause speculative prefetching while a tool call runs."""
+
+    @functools.wraps(tool)
+    async def run(*args: Any, **kwargs: Any) -> Any:
+        with PREFETCHER.foreground():
+            return await tool(*args, **kwargs)
+
+    return run
+
+
+def _measured(tool: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Record the latency and outcome of each call in TOOL_SECONDS.
+
+    Tools report failures as error messages rather than exceptions, so they
+    call _mark_failed() for the call to count as an error.
+    """
+
+    @functools.wraps(tool)
+    async def run(*args: Any, **kwargs: Any) -> Any:
+        outcome = "error"
+        reset = _call_failed.set(False)
+        start = time.perf_counter()
+        try:
+            result = await tool(*args, **kwargs)
+            outcome = "error" if _call_failed.get() else "ok"
+            return result
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            TOOL_SECONDS.observe(time.perf_counter() - start, tool.__name__, outcome)
+            _call_failed.reset(reset)
+
+    return run
+
+
+def _mark_failed() -> None:
+    """Count the current tool call as failed (it returns an error message)."""
+    _call_failed.set(True)
+
+
+async def _schedule(
+    work: Callable[[], T], fast: bool = False, ctx: Optional[Context] = None
+) -> T:
+    """Run the blocking part of a tool call through the scheduler.
+
+    Progress from the work's checkpoints is sent to the client, and when the
+    client cancels the request the work stops at its next checkpoint.
+    """
+    loop = asyncio.get_running_loop()
+
+    def report(progress: float, total: Optional[float]) -> None:
+        # Called from the worker thread; the work does not wait for the send
+        asyncio.run_coroutine_threadsafe(ctx.report_progress(progress, total), loop)
+
+    token = CancellationToken(report if ctx is not None else None)
+    return await SCHEDULER.run(_client_id(), work, fast=fast, token=token)
+
+
+def _client_id() -> str:
+    """Identify the client session making the current tool call."""
+    try:
+        session = server.get_context().session
+    except ValueError:
+        return "local"
+    return f"session-{id(session):x}"
+
+
+def _is_small_file(target: str) -> bool:
+    path = target.split(":", 1)[0]
+    try:
+        return os.path.getsize(path) <= SMALL_FILE_BYTES
+    except OSError:
+        return False
 
 
 @server.tool()
-def inspect_module(
+@_measured
+@_foreground
+async def inspect_module(
     target: Annotated[
         str,
         Field(
             description="Target to inspect (e.g., a Python module, class name, or JSON file path)"
         ),
     ],
-    ctx: Optional[Context] = None,
+    output_format: Annotated[
+        Literal["text", "json"],
+        Field(
+            description="'text' for readable output, 'json' for the structured result "
+            "(versioned schema) for programmatic use"
+        ),
+    ] = "text",
+    recursive: Annotated[
+        bool,
+        Field(
+            description="Inspect a package and all of its submodules (in parallel worker processes)"
+        ),
+    ] = False,
+    depth: Annotated[
+        Optional[int],
+        Field(description="Maximum submodule depth when recursive=True", ge=1),
+    ] = None,
+    profile_imports: Annotated[
+        bool,
+        Field(
+            description="Log a tree of the slowest modules imported by this request "
+            "(cumulative and self time)"
+        ),
+    ] = False,
+    timings: Annotated[
+        bool,
+        Field(
+            description="Report the time spent in each phase (resolve, import, "
+            "introspect, format): a trailer for text output, metadata.timings for JSON"
+        ),
+    ] = False,
+    public_only: Annotated[
+        bool,
+        Field(description="Skip members whose names start with an underscore"),
+    ] = False,
+    no_imported: Annotated[
+        bool,
+        Field(description="Skip classes and functions imported from other modules"),
+    ] = False,
+    respect_all: Annotated[
+        bool,
+        Field(description="Only inspect names listed in a module's __all__"),
+    ] = False,
+    kinds: Annotated[
+        Optional[List[Literal["class", "function", "submodule"]]],
+        Field(description="Only inspect members of these kinds"),
+    ] = None,
+    max_tokens: Annotated[
+        Optional[int],
+        Field(
+            description="Token budget for text output; the level of detail (docstring "
+            "lines, listed members, JSON depth) is chosen to fit it",
+            ge=50,
+        ),
+    ] = None,
+    page: Annotated[
+        Optional[int],
+        Field(description="Return only this page (1-based) of the output", ge=1),
+    ] = None,
+    cursor: Annotated[
+        Optional[str],
+        Field(
+            description="Cursor from a previous page's footer; returns that page "
+            "from the cached output without inspecting again"
+        ),
+    ] = None,
+    page_size: Annotated[
+        Optional[int],
+        Field(
+            description="Maximum characters per page (enables paging; default 8000)",
+            ge=500,
+            le=200000,
+        ),
+    ] = None,
+    ctx: Context = None,
 ) -> str:
     """Inspect a Python module, class, method, function, or JSON file.
 
-    Returns the detailed structure and documentation of the target.
+    Returns the detailed structure and documentation of the target. Large
+    outputs can be read in pages: pass `page` or `page_size`, then follow the
+    `next_cursor` printed at the end of each page.
 
     Examples:
       - `inspect_module(target="json")` - Inspect the json module
       - `inspect_module(target="json.JSONEncoder")` - Inspect a class
       - `inspect_module(target="json.dumps")` - Inspect a function
       - `inspect_module(target="/path/to/file.json")` - Inspect a JSON file
+      - `inspect_module(target="json", output_format="json")` - Structured JSON output
+      - `inspect_module(target="email", recursive=True, depth=1)` - A package and its submodules
+      - `inspect_module(target="pandas", profile_imports=True)` - Log which imports are slow
+      - `inspect_module(target="requests", timings=True)` - Where the time goes
+      - `inspect_module(target="numpy", respect_all=True, no_imported=True)` - Public API only
+      - `inspect_module(target="typing", max_tokens=1000)` - Fit the output to a budget
+      - `inspect_module(target="numpy", page=1)` - First page of a large output
+      - `inspect_module(target="numpy", cursor="3f2a9c1b0d4e5f67-2")` - The next page
     """
     try:
+        filters = InspectionFilters(
+            public_only=public_only,
+            no_imported=no_imported,
+            respect_all=respect_all,
+            kinds=frozenset(kinds or []),
+        )
+
+        detected_type = InspectorFactory.detect_inspector_type(target)
+
         # Log inspection details if context is provided
         if ctx:
-            detected_type = InspectorFactory.detect_inspector_type(target)
-            format_type = InspectorFactory.get_formatter_for_inspector(detected_type)
-            ctx.info(
+            format_type = (
+                InspectorFactory.get_formatter_for_inspector(detected_type)
+                if output_format == "text"
+                else output_format
+            )
+            await ctx.info(
                 f"Inspecting {target} (type: {detected_type}, format: {format_type})"
             )
 
-        # Perform the inspection
-        output = InspectorFactory.inspect(target)
+        python = get_options().python
+        if python is not None and (recursive or profile_imports):
+            raise ValueError(
+                "recursive and profile_imports are not available when the server "
+                "inspects with another interpreter (--python)"
+            )
+        if recursive and max_tokens is not None:
+            raise ValueError("max_tokens cannot be combined with recursive=True")
+        if recursive and timings:
+            raise ValueError("timings cannot be combined with recursive=True")
+
+        key = _output_key(target, output_format, recursive, depth, filters, max_tokens)
+        profiler = None
+        recorder = TimingRecorder() if timings else None
+
+        def render() -> str:
+            nonlocal profiler
+            with recorder or nullcontext():
+                if profile_imports:
+                    with ImportProfiler() as profiler:
+                        return _render_output(*key)
+                return _render_output(*key)
+
+        paged = page is not None or cursor is not None or page_size is not None
+        # Crawls re-import in worker processes, so they are never reused
+        cacheable = not (paged or profile_imports or recursive or timings)
+
+        def serve() -> Tuple[str, Optional[str]]:
+            """Produce the output and a note on where it came from."""
+            if not paged:
+                if not cacheable:
+                    return render(), None
+                output, cached = OUTPUT_CACHE.get_or_create(key, render)
+                PREFETCHER.record_request(target, cached)
+                return output, "Served from the result cache" if cached else None
+
+            output, page_info = Paginator.get_page(
+                key,
+                render,
+                page=page,
+                cursor=cursor,
+                page_size=page_size,
+            )
+            source = "cached output" if page_info["cached"] else "new output"
+            return output, f"Page {page_info['page']} of {page_info['pages']} ({source})"
+
+        def serve_cached() -> Optional[Tuple[str, Optional[str]]]:
+            """Serve an existing cache entry, or None on a miss (never inspects)."""
+            output = OUTPUT_CACHE.get(key)
+            if output is None:
+                return None
+            PREFETCHER.record_request(target, True)
+            return output, "Served from the result cache"
+
+        # Cache hits are served on the event loop; an entry that expired or
+        # was evicted since the check is inspected by a worker like any miss
+        served = None
+        if cacheable and key in OUTPUT_CACHE:
+            served = await _schedule(serve_cached, fast=True, ctx=ctx)
+        if served is None:
+            # Perform the inspection (cursors only read cached pages)
+            fast = cursor is not None or (detected_type == "json" and _is_small_file(target))
+            served = await _schedule(serve, fast=fast, ctx=ctx)
+        output, note = served
+        if note and ctx:
+            await ctx.info(note)
+
+        if profiler and ctx:
+            await ctx.info(profiler.render())
+
+        # JSON output carries the timings in its metadata; pages served from
+        # cached output were not timed
+        if recorder is not None and recorder.roots and output_format == "text":
+            output = f"{output.rstrip()}\n\n{recorder.render()}"
+
+        if get_options().prefetch and detected_type == "python" and not recursive:
+            PREFETCHER.schedule(target)
 
         # Report completion
         if ctx:
-            ctx.info(f"Inspection of {target} completed successfully")
+            await ctx.info(f"Inspection of {target} completed successfully")
 
         return output
 
     except Exception as e:
+        _mark_failed()
         error_msg = f"Error inspecting {target}: {str(e)}"
         if ctx:
-            ctx.error(error_msg)
+            await ctx.error(error_msg)
+        if output_format == "json":
+            return _json_error(error_msg, target, getattr(e, "suggestions", []))
         return error_msg
 
 
+def _json_error(message: str, target: str, suggestions: List[str]) -> str:
+    """Serialize an error for callers that asked for structured output."""
+    return json.dumps(
+        {
+            "schema_version": SCHEMA_VERSION,
+            "error": {"message": message, "target": target, "suggestions": suggestions},
+        }
+    )
+
+
+def _output_key(
+    target: str,
+    output_format: str = "text",
+    recursive: bool = False,
+    depth: Optional[int] = None,
+    filters: Optional[InspectionFilters] = None,
+    max_tokens: Optional[int] = None,
+) -> Tuple:
+    """The parameters that determine an inspect_module output.
+
+    File targets include the file's modification time, so edits are never
+    answered from the cache.
+    """
+    path = target.split(":", 1)[0]
+    mtime = os.stat(path).st_mtime_ns if os.path.isfile(path) else None
+    return (
+        target,
+        output_format,
+        recursive,
+        depth,
+        filters or InspectionFilters(),
+        max_tokens,
+        get_options().python,
+        mtime,
+    )
+
+
+def _render_output(
+    target: str,
+    output_format: str,
+    recursive: bool,
+    depth: Optional[int],
+    filters: InspectionFilters,
+    max_tokens: Optional[int],
+    python: Optional[str],
+    mtime: Optional[int],
+) -> str:
+    """Produce the full output of an inspect_module request (see _output_key)."""
+    if recursive:
+        return _crawl_package(target, output_format, depth, filters)
+    if InspectorFactory.detect_inspector_type(target) != "python":
+        python = None
+    return InspectorFactory.inspect(
+        target,
+        output_format=output_format,
+        filters=filters,
+        max_tokens=max_tokens,
+        python=python,
+    )
+
+
+def warm_up(target: str) -> bool:
+    """Render the default inspect_module output of a target into the result cache.
+
+    Returns:
+        False if the output was already cached
+    """
+    key = _output_key(target)
+    if key in OUTPUT_CACHE:
+        return False
+    output = _render_output(*key)
+    OUTPUT_CACHE.put(key, output, len(output))
+    return True
+
+
+# Members worth prefetching after a module is served
+_PREFETCH_FILTERS = InspectionFilters(
+    public_only=True, no_imported=True, kinds=frozenset({"class", "submodule"})
+)
+
+
+def _prefetch_candidates(target: str) -> List[str]:
+    """The classes defined in a module, then its public submodules.
+
+    Other targets (classes, functions) have no candidates.
+    """
+    result = InspectorFactory.inspect_result(
+        target, "python", _PREFETCH_FILTERS, python=get_options().python
+    )
+    if result.type != "module":
+        return []
+
+    candidates = []
+    for module in result.elements:
+        candidates += [f"{module.name}.{cls.name}" for cls in module.classes]
+        candidates += [
+            name for name in module.submodules if not name.rsplit(".", 1)[-1].startswith("_")
+        ]
+    return candidates
+
+
+# Used only when the server runs with --prefetch
+PREFETCHER = Prefetcher(
+    load=warm_up, candidates=_prefetch_candidates, max_unused=OUTPUT_CACHE.max_entries
+)
+
+
+def _crawl_package(
+    target: str,
+    output_format: str,
+    depth: Optional[int],
+    filters: Optional[InspectionFilters] = None,
+) -> str:
+    """Inspect a package recursively and combine the results in module order."""
+    crawler = PackageCrawler(depth=depth, filters=filters)
+    formatter = InspectorFactory.create_formatter("python", output_format)
+
+    outputs = []
+    errors = []
+    for item in sorted(crawler.crawl(target), key=lambda item: item.module_name):
+        if item.error is not None:
+            errors.append(f"Error inspecting {item.module_name}: {item.error}")
+        else:
+            outputs.append(formatter.format(item.result))
+
+    return "\n".join(outputs + errors)
+
+
 @server.tool()
-def inspect_docstring(
+@_measured
+@_foreground
+async def inspect_docstring(
     target: Annotated[
         str,
         Field(
@@ -78,7 +514,7 @@ def inspect_docstring(
             le=100,
         ),
     ] = 20,
-    ctx: Optional[Context] = None,
+    ctx: Context = None,
 ) -> str:
     """Get the complete docstring for a Python module, class, or function with pagination.
 
@@ -92,27 +528,195 @@ def inspect_docstring(
     try:
         # Log operation if context is provided
         if ctx:
-            ctx.info(
+            await ctx.info(
                 f"Retrieving docstring for {target} (page {page + 1}, size {page_size})"
             )
 
         # Get the paginated docstring
-        rendered_text, metadata = DocstringExtractor.get_paginated_docstring(
-            target, page, page_size
+        rendered_text, metadata = await _schedule(
+            lambda: DocstringExtractor.get_paginated_docstring(target, page, page_size),
+            ctx=ctx,
         )
 
         # Report completion
         if ctx:
             pagination = metadata.get("pagination", {})
             total_pages = pagination.get("total_pages", 1)
-            ctx.info(
+            await ctx.info(
                 f"Retrieved docstring for {target} (page {page + 1}/{total_pages})"
             )
 
         # Return just the formatted text
         return rendered_text
     except Exception as e:
+        _mark_failed()
         error_msg = f"Error retrieving docstring for {target}: {str(e)}"
         if ctx:
-            ctx.error(error_msg)
+            await ctx.error(error_msg)
         return f"Error: {str(e)}"
+
+
+@server.tool()
+@_measured
+@_foreground
+async def search_docstrings(
+    package: Annotated[
+        str,
+        Field(description="Package or module whose docstrings to search (e.g., 'json')"),
+    ],
+    query: Annotated[
+        str,
+        Field(description="Words to search for, or a regular expression if regex=True"),
+    ],
+    regex: Annotated[
+        bool,
+        Field(description="Treat the query as a case-insensitive regular expression"),
+    ] = False,
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of hits to return", ge=1, le=200),
+    ] = 20,
+    ctx: Context = None,
+) -> str:
+    """Search the docstrings of every module, class, and function in a package.
+
+    Returns ranked hits with their dotted paths, so they can be passed to
+    `inspect_module` or `inspect_docstring`.
+
+    Examples:
+      - `search_docstrings(package="requests", query="retry")` - Find retry-related APIs
+      - `search_docstrings(package="json", query="decode.*error", regex=True)` - Regex search
+    """
+    try:
+        if ctx:
+            await ctx.info(f"Searching docstrings of {package} for {query!r}")
+
+        rendered_text, metadata = await _schedule(
+            lambda: DocstringSearcher.get_search_results(
+                package, query, regex=regex, limit=limit
+            ),
+            ctx=ctx,
+        )
+
+        if ctx:
+            await ctx.info(
+                f"Found {metadata['hits']} hit(s) in {metadata['docstrings_scanned']} docstrings"
+            )
+
+        return rendered_text
+    except Exception as e:
+        _mark_failed()
+        error_msg = f"Error searching docstrings of {package}: {str(e)}"
+        if ctx:
+            await ctx.error(error_msg)
+        return error_msg
+
+
+@server.tool()
+@_measured
+@_foreground
+async def inspect_source(
+    target: Annotated[
+        str,
+        Field(description="Module, class, function, or method (e.g., json.dumps)"),
+    ],
+    lines: Annotated[
+        Optional[str],
+        Field(
+            description="File line range 'a:b' to show (also 'a:', ':b', or 'a'), "
+            "clipped to the definition"
+        ),
+    ] = None,
+    ctx: Context = None,
+) -> str:
+    """Show the source code of a Python module, class, function, or method.
+
+    Returns the definition with file line numbers, so a long definition can be
+    read in pieces by passing the next `lines` range.
+
+    Examples:
+      - `inspect_source(target="json.dumps")` - Source of a function
+      - `inspect_source(target="json.JSONEncoder.encode")` - Source of a method
+      - `inspect_source(target="json.decoder", lines="1:40")` - Part of a module
+    """
+    try:
+        if ctx:
+            await ctx.info(f"Reading source of {target}")
+
+        rendered_text, metadata = await _schedule(
+            lambda: SourceViewer.get_source(target, lines=lines),
+            ctx=ctx,
+        )
+
+        if ctx:
+            first, last = metadata["lines"]
+            await ctx.info(f"Read lines {first}-{last} of {metadata['file']}")
+
+        return rendered_text
+    except Exception as e:
+        _mark_failed()
+        error_msg = f"Error reading source of {target}: {str(e)}"
+        if ctx:
+            await ctx.error(error_msg)
+        return error_msg
+
+
+@server.tool()
+@_measured
+@_foreground
+async def find_references(
+    symbol: Annotated[
+        str,
+        Field(
+            description="Dotted name (e.g., 'requests.Session.get') or bare name "
+            "(e.g., 'get', which also matches methods of unknown objects)"
+        ),
+    ],
+    root: Annotated[
+        str,
+        Field(description="Project directory whose Python files are searched"),
+    ] = ".",
+    kind: Annotated[
+        Optional[Literal["import", "call", "base", "attribute", "name", "definition"]],
+        Field(description="Only return references of this kind"),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of references to return", ge=1, le=1000),
+    ] = 200,
+    ctx: Context = None,
+) -> str:
+    """Find where a symbol is imported, called, subclassed, or accessed in a project.
+
+    Files are parsed statically (nothing is imported). The index is persisted
+    and only changed files are re-parsed, so repeated queries are fast.
+
+    Examples:
+      - `find_references(symbol="json.dumps", root="/path/to/project")` - All uses
+      - `find_references(symbol="mypkg.Base", root=".", kind="base")` - Subclasses
+      - `find_references(symbol="retry", kind="call")` - Calls to anything named retry
+    """
+    try:
+        if ctx:
+            await ctx.info(f"Finding references to {symbol} in {root}")
+
+        rendered_text, metadata = await _schedule(
+            lambda: ReferenceFinder.get_references_results(
+                symbol, root, kind=kind, limit=limit
+            ),
+            ctx=ctx,
+        )
+
+        if ctx:
+            await ctx.info(
+                f"Found {metadata['references']} reference(s) in "
+                f"{metadata['files']} of {metadata['files_indexed']} files"
+            )
+
+        return rendered_text
+    except Exception as e:
+        _mark_failed()
+        error_msg = f"Error finding references to {symbol}: {str(e)}"
+        if ctx:
+            await ctx.error(error_msg)
+        return error_msg
@@ -0,0 +1,37 @@
+"""Background preloading of the targets named in the server options."""
+
+import logging
+from typing import Optional, Sequence
+
+from peek_tool.core.preload import Preloader
+from peek_tool.mcp_server.tools import warm_up
+from peek_tool.models.preload_status import PreloadItem, PreloadStatus
+
+logger = logging.getLogger(__name__)
+
+_preloader: Optional[Preloader] = None
+
+
+def start_preload(targets: Sequence[str]) -> None:
+    """Start loading targets into the result cache in the background."""
+    global _preloader
+    _preloader = Preloader(targets, warm_up, on_progress=_log_progress)
+    if _preloader.status.items:
+        logger.info("Preloading %d target(s) in the background", len(_preloader.status.items))
+    _preloader.start()
+
+
+def preload_status() -> Optional[PreloadStatus]:
+    """Progress of the start-up preload, or None if nothing was preloaded."""
+    return _preloader.status if _preloader is not None else None
+
+
+def _log_progress(item: PreloadItem, status: PreloadStatus) -> None:
+    position = f"{status.done}/{len(status.items)}"
+    if item.status == "failed":
+        logger.warning("Could not preload %s (%s): %s", item.target, position, item.error)
+    else:
+        logger.info("Preloaded %s in %.2fs (%s)", item.target, item.seconds, position)
+    if status.done == len(status.items):
+        elapsed = status.as_dict()["elapsed_seconds"]
+        logger.info("Preload finished in %.2fs", elapsed)
@@ -1,7 +1,7 @@
 """Command option dataclasses for the peek CLI."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -17,6 +17,11 @@ class McpServerOptions:
 
     name: str = "Peek"
     transport: str = "stdio"
+    python: Optional[str] = None  # Interpreter for Python targets (the server's if None)
+    preload: Tuple[str, ...] = ()  # Targets to load in the background after start-up
+    prefetch: bool = False  # Load the classes and submodules of served modules while idle
+    workers: int = 4  # Tool calls running at once
+    max_per_client: int = 2  # Tool calls one client may have running at once
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class DocstringItem:
+    """Represents a single entry in a docstring section (a parameter, exception, etc.)."""
+
+    name: str = ""
+    type_annotation: Optional[str] = None
+    description: str = ""
+
+
+@dataclass
+class DocstringSection:
+    """Represents a section of a docstring such as Args, Returns, or Examples."""
+
+    kind: str  # 'params', 'returns', 'yields', 'raises', 'examples', 'notes', 'text', etc.
+    title: str  # The header as written in the docstring (e.g. 'Parameters')
+    items: List[DocstringItem] = field(default_factory=list)
+    text: str = ""  # The section body with normalized indentation
+
+
+@dataclass
+class ParsedDocstring:
+    """Structured representation of a docstring.
+
+    Instances are shared between all objects with the same docstring text,
+    so they should be treated as read-only.
+    """
+
+    style: str = "plain"  # 'google', 'numpy', 'rest', or 'plain'
+    summary: str = ""
+    description: str = ""
+    sections: List[DocstringSection] = field(default_factory=list)
+
+    def get_sections(self, kind: str) -> List[DocstringSection]:
+        """Return all sections of the given kind, in document order."""
+        return [section for section in self.sections if section.kind == kind]
+
+    @property
+    def params(self) -> List[DocstringItem]:
+        """All documented parameters."""
+        return [item for s in self.get_sections("params") for item in s.items]
+
+    @property
+    def returns(self) -> Optional[DocstringSection]:
+        """The Returns section, if present."""
+        sections = self.get_sections("returns")
+        return sections[0] if sections else None
+
+    @property
+    def raises(self) -> List[DocstringItem]:
+        """All documented exceptions."""
+        return [item for s in self.get_sections("raises") for item in s.items]
+
+    @property
+    def examples(self) -> List[str]:
+        """The text of all example sections."""
+        return [s.text for s in self.get_sections("examples")]
+
+    def param_description(self, name: str) -> Optional[str]:
+        """Return the description for a named parameter, if documented."""
+        stripped = name.lstrip("*")
+        for item in self.params:
+            # NumPy style allows several names per entry ("x, y : int")
+            names = [n.strip().lstrip("*") for n in item.name.split(",")]
+            if stripped in names:
+                return item.description or None
+        return None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class ImportTiming:
+    """Time spent importing one module, including the imports it triggered."""
+
+    module: str
+    cumulative_us: int = 0  # Executing the module, including nested imports
+    self_us: int = 0  # Executing the module, excluding nested imports
+    children: List["ImportTiming"] = field(default_factory=list)
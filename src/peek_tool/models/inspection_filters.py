@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import FrozenSet
+
+# Member kinds that can be selected with InspectionFilters.kinds
+MEMBER_KINDS = ("class", "function", "submodule")
+
+
+@dataclass(frozen=True)
+class InspectionFilters:
+    """Which module members to inspect.
+
+    Filters are applied before a member is introspected, so excluded members
+    cost nothing beyond a name or type check.
+    """
+
+    public_only: bool = False  # Skip names starting with an underscore
+    no_imported: bool = False  # Skip classes and functions defined in other modules
+    respect_all: bool = False  # Only inspect names in __all__ when a module defines it
+    kinds: FrozenSet[str] = frozenset()  # Member kinds to keep (empty keeps all)
+
+    def __post_init__(self):
+        unknown = set(self.kinds) - set(MEMBER_KINDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown member kind(s) {', '.join(sorted(unknown))}; "
+                f"expected {', '.join(MEMBER_KINDS)}"
+            )
+
+    @property
+    def is_active(self) -> bool:
+        """Whether any filter is set."""
+        return self.public_only or self.no_imported or self.respect_all or bool(self.kinds)
+
+    def allows_name(self, name: str) -> bool:
+        """Check a member name against the visibility filter."""
+        return not (self.public_only and name.startswith("_"))
+
+    def allows_kind(self, kind: str) -> bool:
+        """Check a member kind against the kind filter."""
+        return not self.kinds or kind in self.kinds
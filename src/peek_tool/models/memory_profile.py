@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from peek_tool.models.timing import TimingSpan
+
+
+@dataclass
+class AllocationSite:
+    """Memory allocated at one source line and still held at the end of a phase."""
+
+    filename: str
+    lineno: int
+    size_bytes: int
+    count: int  # Allocated blocks
+
+
+@dataclass
+class MemorySpan(TimingSpan):
+    """Memory use of one phase of an operation, including its nested phases.
+
+    Phases entered more than once under the same parent are merged: the peak
+    is the highest of any entry, retained bytes and sites are summed.
+    """
+
+    peak_bytes: int = 0  # Highest traced memory above the phase's start
+    retained_bytes: int = 0  # Traced memory still held when the phase ended
+    sites: List[AllocationSite] = field(default_factory=list)
@@ -0,0 +1,47 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class PreloadItem:
+    """The warm-up state of one target."""
+
+    target: str
+    status: str = "pending"  # "pending", "loading", "done", or "failed"
+    seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class PreloadStatus:
+    """Progress of a warm-up run."""
+
+    items: List[PreloadItem] = field(default_factory=list)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> int:
+        """Number of targets that have finished loading (successfully or not)."""
+        return sum(item.status in ("done", "failed") for item in self.items)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the status as plain data."""
+        now = self.finished_at or time.perf_counter()
+        return {
+            "total": len(self.items),
+            "done": self.done,
+            "failed": sum(item.status == "failed" for item in self.items),
+            "running": self.started_at is not None and self.finished_at is None,
+            "elapsed_seconds": round(now - self.started_at, 3) if self.started_at else 0.0,
+            "targets": [
+                {
+                    "target": item.target,
+                    "status": item.status,
+                    "seconds": None if item.seconds is None else round(item.seconds, 3),
+                    "error": item.error,
+                }
+                for item in self.items
+            ],
+        }
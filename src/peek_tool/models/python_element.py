@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from peek_tool.models.docstring import ParsedDocstring
+
 
 @dataclass
 class Parameter:
@@ -20,8 +22,12 @@ class Method:
     parameters: List[Parameter] = field(default_factory=list)
     return_type: Optional[str] = None
     docstring: Optional[str] = None
+    parsed_docstring: Optional[ParsedDocstring] = None
     decorators: List[str] = field(default_factory=list)
 
+    # Qualified name of the class that defines this method (None for functions)
+    defined_in: Optional[str] = None
+
     # Import information
     is_imported: bool = False
     import_source: Optional[str] = None
@@ -35,6 +41,8 @@ class Class:
     methods: List[Method] = field(default_factory=list)
     base_classes: List[str] = field(default_factory=list)
     docstring: Optional[str] = None
+    parsed_docstring: Optional[ParsedDocstring] = None
+    qualified_name: Optional[str] = None  # e.g. 'json.decoder.JSONDecoder'
 
     # Import information
     is_imported: bool = False
@@ -49,6 +57,7 @@ class Module:
     classes: List[Class] = field(default_factory=list)
     functions: List[Method] = field(default_factory=list)
     docstring: Optional[str] = None
+    parsed_docstring: Optional[ParsedDocstring] = None
 
     # Additional structure
     submodules: List[str] = field(default_factory=list)
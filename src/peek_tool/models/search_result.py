@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DocstringEntry:
+    """A docstring extracted from a module, class, or function."""
+
+    path: str  # Dotted path, e.g. 'json.decoder.JSONDecoder.decode'
+    kind: str  # 'module', 'class', or 'function'
+    docstring: str
+    line: int = 0  # Line of the definition in its source file (0 if unknown)
+
+
+@dataclass
+class DocstringSearchHit:
+    """A ranked docstring search match."""
+
+    path: str
+    kind: str
+    score: float
+    snippet: str  # The first matching docstring line
+    line: int = 0
+
+
+@dataclass
+class SymbolReference:
+    """A place in a source file that refers to a symbol."""
+
+    symbol: str  # Resolved dotted name, or '*.attr' for attributes of unknown objects
+    kind: str  # 'import', 'call', 'base', 'attribute', 'name', or 'definition'
+    path: str  # File path relative to the indexed root
+    line: int
+    col: int
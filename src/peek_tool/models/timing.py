@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class TimingSpan:
+    """Time spent in one phase of an operation, including its nested phases.
+
+    Phases entered more than once under the same parent (e.g. resolving the
+    type hints of each function) are merged into one span.
+    """
+
+    name: str
+    total_ns: int = 0
+    count: int = 0  # Times the phase was entered
+    children: List["TimingSpan"] = field(default_factory=list)
+
+    @property
+    def self_ns(self) -> int:
+        """Time spent in the phase itself, excluding nested phases."""
+        return max(self.total_ns - sum(child.total_ns for child in self.children), 0)